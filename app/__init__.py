@@ -1,32 +1,192 @@
+"""붕어빵 관리 시스템 앱 팩토리
+
+create_app() 하나로 개발 서버(run.py), WSGI(wsgi.py), ASGI(asgi.py), 벤치마크가
+같은 앱을 만든다.
+
+시작 비용을 줄이려고 무거운 부분은 처음 쓸 때 불러온다.
+    마이그레이션 (Flask-Migrate / alembic): flask db ... 명령이나 init_migrations()
+    비밀번호 해시 프로세스 풀 (multiprocessing): 첫 해시 요청
+    작업 큐 작업자 스레드: 첫 작업 커밋
+    redis 클라이언트: CACHE_BACKEND='redis' 일 때만
+"""
+import os
+
+import click
 from flask import Flask, jsonify
+from flask.cli import ScriptInfo
 from flask_sqlalchemy import SQLAlchemy
-from flask_migrate import Migrate
+from .cache import Cache
+from .versioning import TableVersions
+from .idempotency import Idempotency
+from .jobs import JobQueue
+from .replicas import Replicas, RoutingSession
+from .limits import Limits
+from .instrumentation import Instrumentation
+from .hashing import hash_stats
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'migrations')
+
+# 세션은 @replicas.reads 라우트의 SELECT 를 복제본으로 보낸다
+db = SQLAlchemy(session_options={"class_": RoutingSession})
+cache = Cache()
+versions = TableVersions()
+idempotency = Idempotency()
+jobs = JobQueue()
+replicas = Replicas()
+limits = Limits()
+instrumentation = Instrumentation()
+
+# /metrics 에 함께 노출할 해시 실행기 / 캐시 / 작업 큐 / 복제본 / 요청 한도 지표
+instrumentation.add_metrics('gauge', lambda: {
+    "password_hash_queue_depth": hash_stats()["queue_depth"],
+    "password_hash_avg_latency_ms": hash_stats()["avg_latency_ms"]
+})
+instrumentation.add_metrics('counter', lambda: {
+    "cache_hits_total": cache.stats()["hits"],
+    "cache_misses_total": cache.stats()["misses"],
+    "idempotent_replays_total": idempotency.stats()["replays"],
+    "idempotent_conflicts_total": idempotency.stats()["conflicts"],
+    "jobs_completed_total": jobs.stats()["completed"],
+    "jobs_failed_total": jobs.stats()["failed"],
+    "jobs_retried_total": jobs.stats()["retried"],
+    'replica_reads_total{target="replica"}': replicas.stats()["replica_reads"],
+    'replica_reads_total{target="primary"}': replicas.stats()["primary_reads"],
+    "rate_limited_requests_total": limits.stats()["rate_limited"],
+    "shed_requests_total": limits.stats()["shed"]
+})
+
+def init_migrations(app):
+    """Flask-Migrate 초기화 (alembic 은 이때 처음 import)"""
+    if 'migrate' not in app.extensions:
+        from flask_migrate import Migrate
+        Migrate(app, db, directory=MIGRATIONS_DIR)
+    return app.extensions['migrate']
+
+class _MigrateGroup(click.Group):
+    """flask db ... 옵션과 하위 명령은 실행할 때 Flask-Migrate 에서 가져옴"""
 
-db = SQLAlchemy()
-migrate = Migrate()
+    @property
+    def migrate_group(self):
+        from flask_migrate.cli import db as group
+        return group
 
-def create_app():
+    def get_params(self, ctx):
+        return self.migrate_group.get_params(ctx)
+
+    def list_commands(self, ctx):
+        return self.migrate_group.list_commands(ctx)
+
+    def get_command(self, ctx, name):
+        return self.migrate_group.get_command(ctx, name)
+
+@click.group('db', cls=_MigrateGroup)
+@click.pass_context
+def db_cli(ctx, **options):
+    """Perform database migrations."""
+    init_migrations(ctx.ensure_object(ScriptInfo).load_app())
+    ctx.invoke(ctx.command.migrate_group.callback, **options)
+
+def create_app(overrides=None):
     print("📱 Flask 앱 생성 중...")
     app = Flask(__name__)
     app.config.from_object('app.config.Config')
-    
+
+    # 벤치마크 / 스크립트용 설정 덮어쓰기
+    if overrides:
+        app.config.update(overrides)
+
+    # 엔진/커넥션 풀 옵션 (DB 종류와 DB_POOL_* 환경변수에 맞춰 계산)
+    from .database import engine_options, init_engine
+    app.config.setdefault(
+        'SQLALCHEMY_ENGINE_OPTIONS', engine_options(app.config['SQLALCHEMY_DATABASE_URI'])
+    )
+
+    # 읽기 전용 복제본 bind 등록 (db.init_app 전, SQLALCHEMY_REPLICA_URIS 가 있을 때만)
+    replicas.init_app(app, db)
+
     db.init_app(app)
-    migrate.init_app(app, db)
-    
-    # 모델 import 추가
-    from . import models
-    
-    # Blueprint 등록 (임시 주석처리)
-    # from .routes import api_bp
-    # app.register_blueprint(api_bp)
-    
-    #@app.route('/')
+
+    # SQLite 운영용 PRAGMA (WAL 등, 복제본은 query_only) 적용
+    init_engine(app, db)
+
+    # 비밀번호 해시 실행기 설정 (풀은 첫 요청 때 생성)
+    from . import hashing
+    hashing.init_app(app)
+
+    # JSON 직렬화 (orjson 이 있으면 사용)
+    from . import jsonprovider
+    jsonprovider.init_app(app)
+
+    # 읽기 캐시 설정
+    cache.init_app(app)
+
+    # Idempotency-Key 응답 보관 설정 (flask purge-idempotency-keys 포함)
+    idempotency.init_app(app)
+
+    # 작업 큐 설정 (작업자 스레드는 첫 작업이 커밋될 때 시작, flask jobs-worker 포함)
+    jobs.init_app(app)
+
+    # 비싼 API 의 요청 한도 / 동시 실행 한도
+    limits.init_app(app)
+
+    # 요청 계측 (INSTRUMENTATION_ENABLED 일 때만)
+    instrumentation.init_app(app, db)
+
+    # 마이그레이션 명령 (flask db ...) 은 실행할 때 초기화
+    app.cli.add_command(db_cli)
+
+    # 오래된 비활성 행 보관 명령 (flask archive-inactive)
+    from .archive import archive_command
+    app.cli.add_command(archive_command)
+
+    # 가게별 인원 집계 재계산 명령 (flask rebuild-store-stats)
+    from .stats import rebuild_command
+    app.cli.add_command(rebuild_command)
+
+    # 모델 import 와 Blueprint 등록
+    from . import models  # noqa: F401
+    from . import tasks  # noqa: F401
+    from .routes import api_bp
+    app.register_blueprint(api_bp)
+
+    @app.route('/')
     def home():
         return jsonify({
             "message": "🥮 붕어빵 시스템이 정상적으로 실행중입니다!",
-            "api_docs": "/api",
-            "version": "1.0.0"
+            "version": "2.0.0",
+            "features": ["User Management", "Store Management", "Employee Management"],
+            "endpoints": {
+                "GET /": "홈페이지",
+                "GET /api": "API 문서",
+                "POST /api/users/signup": "사용자 가입",
+                "POST /api/users/bulk": "사용자 일괄 가입",
+                "GET /api/metrics/hashing": "비밀번호 해시 실행기 지표",
+                "GET /api/metrics/cache": "캐시 적중/실패 지표",
+                "GET /api/metrics/jobs": "작업 큐 지표",
+                "GET /api/metrics/limits": "요청 한도 / 동시 실행 한도 지표",
+                "GET /api/jobs/<id>": "작업 상태",
+                "GET /api/users": "사용자 목록",
+                "GET /api/users/search": "사용자 검색 (?q=&gender=&active=)",
+                "POST /api/users/<id>/deactivate": "사용자 비활성화",
+                "POST /api/users/<id>/reactivate": "사용자 활성화",
+                "POST /api/stores": "가게 생성",
+                "GET /api/stores": "가게 목록",
+                "GET /api/stores/stats": "가게별 직급 인원 집계",
+                "POST /api/stores/<id>/deactivate": "가게 비활성화",
+                "POST /api/stores/<id>/reactivate": "가게 활성화",
+                "POST /api/employees": "직원 등록",
+                "POST /api/employees/bulk": "직원 일괄 등록",
+                "GET /api/employees": "직원 목록",
+                "GET /api/employees/search": "직원 검색 (?q=&position=&store_id=&gender=&active=)",
+                "GET /api/stores/<id>/employees": "가게별 직원 명단 (?position=)",
+                "GET /api/users/<id>/stores": "사용자별 근무 가게 (?position=)",
+                "POST /api/employees/<id>/deactivate": "직원 비활성화",
+                "POST /api/employees/<id>/reactivate": "직원 활성화",
+                "GET /api/export/users": "사용자 전체 내보내기 (NDJSON)",
+                "GET /api/export/stores": "가게 전체 내보내기 (NDJSON)",
+                "GET /api/export/employees": "직원 전체 내보내기 (NDJSON)"
+            }
         })
-    
+
     print("✅ Flask 앱 생성 완료!")
     return app
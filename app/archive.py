@@ -0,0 +1,79 @@
+"""오래된 비활성 행을 보관 테이블로 옮기기
+
+비활성화(is_active = false)된 지 ARCHIVE_AFTER_DAYS 일이 지난 행을
+<테이블>_archive 로 옮기고 원래 테이블에서 지운다. 활성 테이블과 인덱스가
+비활성 행으로 커지지 않게 한다.
+
+    flask archive-inactive [--days N] [--batch-size N]
+
+cron 등으로 주기적으로 실행한다. 배치(기본 1000행)마다 INSERT ... SELECT
+와 DELETE 를 한 트랜잭션으로 커밋하므로 쓰기 잠금이 짧고, 중간에 멈춰도
+다시 실행하면 이어서 옮긴다. 한 번 실행할 때 id 커서로 테이블을 한 번만
+훑는다.
+
+직원을 먼저 옮기고, 사용자 / 가게는 남은 직원 행이 없을 때만 옮긴다.
+보관 테이블은 FK / UNIQUE 없이 같은 컬럼 + archived_at 이고, Enum 컬럼은
+이름 문자열로 저장한다.
+"""
+from datetime import datetime, timedelta, timezone
+
+import click
+from flask import current_app
+from flask.cli import with_appcontext
+from sqlalchemy import Column, DateTime, Enum, String, Table, delete, insert, literal, select
+
+
+def _utcnow():
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def archive_table(source):
+    """source 테이블의 보관 테이블 (<이름>_archive) 정의"""
+    columns = [
+        Column(c.name, String(50) if isinstance(c.type, Enum) else c.type,
+               primary_key=c.primary_key, nullable=c.nullable)
+        for c in source.columns
+    ]
+    return Table(f"{source.name}_archive", source.metadata, *columns,
+                 Column('archived_at', DateTime, nullable=False))
+
+
+def archive_rows(session, model, archive, conditions, batch_size):
+    """conditions 를 만족하는 model 행을 batch_size 씩 archive 로 옮기고 옮긴 행 수 반환"""
+    source = model.__table__
+    moved = 0
+    last_id = 0
+    while True:
+        ids = session.scalars(
+            select(model.id).where(model.id > last_id, *conditions)
+            .order_by(model.id).limit(batch_size)
+        ).all()
+        if not ids:
+            return moved
+
+        session.execute(insert(archive).from_select(
+            [c.name for c in source.columns] + ['archived_at'],
+            select(*source.columns, literal(_utcnow(), DateTime)).where(source.c.id.in_(ids))
+        ))
+        # ORM DELETE 로 지워야 캐시 / 테이블 버전이 함께 갱신된다
+        session.execute(
+            delete(model).where(model.id.in_(ids)).execution_options(synchronize_session=False)
+        )
+        session.commit()
+        moved += len(ids)
+        last_id = ids[-1]
+
+
+@click.command('archive-inactive')
+@click.option('--days', type=int, default=None, help='비활성화 후 보관까지 일수 (기본 ARCHIVE_AFTER_DAYS)')
+@click.option('--batch-size', type=int, default=None, help='배치 행 수 (기본 ARCHIVE_BATCH_SIZE)')
+@with_appcontext
+def archive_command(days, batch_size):
+    """오래된 비활성 사용자 / 가게 / 직원을 보관 테이블로 이동"""
+    from .services import archive_inactive
+
+    days = current_app.config['ARCHIVE_AFTER_DAYS'] if days is None else days
+    batch_size = batch_size or current_app.config['ARCHIVE_BATCH_SIZE']
+    moved = archive_inactive(_utcnow() - timedelta(days=days), batch_size)
+    for table, count in moved.items():
+        click.echo(f"{table}: {count}행 보관")
@@ -0,0 +1,212 @@
+"""ASGI 서빙: I/O 위주 읽기 API 는 asyncio 엔진에서, 나머지는 기존 WSGI 앱으로
+
+AsyncApp 에 등록한 코루틴 라우트는 이벤트 루프에서 바로 처리하므로, 느린
+클라이언트 연결 수천 개를 스레드 없이 붙잡고 있을 수 있다. 등록되지 않은
+경로(쓰기, 내보내기 등)는 a2wsgi 의 WSGIMiddleware 가 Flask 앱을 스레드 풀에서
+실행해서 처리하므로 한 프로세스가 전체 API 를 그대로 서비스한다.
+
+코루틴 라우트는 AsyncRoutes 에 모아 두고 (async_routes.py) AsyncApp 에 넘긴다.
+view(request, connection, **경로 인자) 형태로 호출된다.
+    request:    Flask request (args, headers, if_none_match ...)
+    connection: 요청마다 새로 여는 AsyncConnection (끝나면 롤백 후 반납). 복제본이
+                설정되어 있으면 복제본 연결 (최근에 쓴 클라이언트는 주 DB, replicas.py).
+                캐시 키는 동기 라우트처럼 고른 bind 별로 나뉜다
+반환값은 Flask 뷰처럼 payload 또는 (payload, status) 이다.
+
+코루틴 라우트도 Flask 요청 컨텍스트 안에서 before_request / after_request /
+teardown 을 거치므로 요청 계측 (Server-Timing, /metrics) 과 read-your-writes
+쿠키 처리가 동기 라우트와 같다. 오류 응답도 Flask 오류 처리기가 만든다.
+
+요청 한도 / 동시 실행 한도는 routes.limited(limits, 이름) 로 붙인다 (limits.py).
+
+설정 (app.config)
+    ASGI_WSGI_THREADS: WSGI 경로를 실행할 스레드 수 (기본 16)
+"""
+import asyncio
+from functools import wraps
+import io
+
+from a2wsgi import WSGIMiddleware
+from a2wsgi.wsgi import build_environ
+from flask import current_app, request
+from werkzeug.exceptions import HTTPException
+from werkzeug.routing import Map, Rule
+
+from .cache import key_scope
+from .database import create_async_engine_for
+
+
+async def _read_body(receive):
+    chunks = []
+    while True:
+        message = await receive()
+        if message['type'] == 'http.disconnect':
+            break
+        chunks.append(message.get('body', b''))
+        if not message.get('more_body', False):
+            break
+    return b''.join(chunks)
+
+
+def _asgi_headers(headers):
+    return [(name.lower().encode('latin-1'), value.encode('latin-1')) for name, value in headers]
+
+
+class AsyncRoutes:
+    """코루틴 라우트 모음 (Flask Blueprint 처럼 먼저 모아 두고 AsyncApp 에 등록)"""
+
+    def __init__(self):
+        self.rules = []
+
+    def route(self, rule, methods=('GET',)):
+        """코루틴 라우트 등록 (Flask 와 같은 경로 문법)"""
+        def decorator(view):
+            self.rules.append((rule, view, methods))
+            return view
+        return decorator
+
+    @staticmethod
+    def conditional(versions, *tables):
+        """TableVersions.conditional 의 코루틴 라우트 버전 (같은 ETag 를 만든다)"""
+        def decorator(view):
+            @wraps(view)
+            async def wrapper(request, connection, **kwargs):
+                etag, last_modified = await versions.validators_async(connection, tables)
+                if etag is None:
+                    return await view(request, connection, **kwargs)
+
+                scope = etag
+                etag = versions.query_etag(etag, request.query_string)
+                if request.if_none_match.contains_weak(etag):
+                    response = current_app.response_class(status=304)
+                else:
+                    with key_scope(scope):
+                        response = current_app.make_response(await view(request, connection, **kwargs))
+                    if response.status_code != 200:
+                        return response
+
+                response.set_etag(etag, weak=True)
+                response.last_modified = last_modified
+                return response
+            return wrapper
+        return decorator
+
+    @staticmethod
+    def limited(limits, name):
+        """Limits.limit 의 코루틴 라우트 버전
+
+        버킷 백엔드(redis 는 네트워크 왕복) 와 입장 잠금이 이벤트 루프를 막지
+        않도록 acquire 는 스레드에서 한다. 스레드를 오래 잡지 않도록 동시 실행
+        한도가 차 있으면 대기열에서 기다리지 않고 바로 503 을 돌려준다.
+        """
+        def decorator(view):
+            @wraps(view)
+            async def wrapper(request, connection, **kwargs):
+                rejected = await asyncio.to_thread(limits.acquire, name, request.remote_addr, False)
+                if rejected is not None:
+                    payload, status, headers = rejected
+                    return payload, status, headers
+                try:
+                    return await view(request, connection, **kwargs)
+                finally:
+                    limits.release(name)
+            return wrapper
+        return decorator
+
+
+class AsyncApp:
+    """코루틴 라우트 + WSGI 앱 대체 처리를 묶은 ASGI 앱"""
+
+    def __init__(self, flask_app, db, *route_sets):
+        self.flask_app = flask_app
+        self.db = db
+        self.engine = None
+        self.replica_engines = {}
+        self.url_map = Map()
+        self.views = {}
+        self.wsgi = WSGIMiddleware(flask_app, workers=flask_app.config.get('ASGI_WSGI_THREADS', 16))
+        for routes in route_sets:
+            for rule, view, methods in routes.rules:
+                self.url_map.add(Rule(rule, endpoint=view.__name__, methods=methods))
+                self.views[view.__name__] = view
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            await self._lifespan(receive, send)
+        elif scope['type'] == 'http':
+            root_path, path = scope.get('root_path', ''), scope['path']
+            if path.startswith(root_path):
+                path = path[len(root_path):]
+            try:
+                endpoint, view_args = self.url_map.bind('localhost').match(path, scope['method'])
+            except HTTPException:
+                # 코루틴 라우트가 아니면 (404/405 포함) Flask 앱이 처리
+                await self.wsgi(scope, receive, send)
+            else:
+                environ = build_environ(scope, io.BytesIO(await _read_body(receive)))
+                await self._call_view(self.views[endpoint], environ, view_args, send)
+        else:
+            raise RuntimeError(f"지원하지 않는 ASGI scope 입니다: {scope['type']}")
+
+    async def _lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                self._create_engines()
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                await self.dispose()
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    def _create_engines(self):
+        """주 DB 와 복제본(SQLALCHEMY_REPLICA_URIS) 의 AsyncEngine (요청 계측도 연결)"""
+        self.engine = create_async_engine_for(self.flask_app, self.db)
+        self.replica_engines = {
+            key: create_async_engine_for(self.flask_app, self.db, key)
+            for key in self.flask_app.extensions['replicas'].bind_keys
+        }
+        instrumentation = self.flask_app.extensions.get('instrumentation')
+        if instrumentation is not None:
+            for engine in [self.engine, *self.replica_engines.values()]:
+                instrumentation.watch_engine(engine.sync_engine)
+
+    async def dispose(self):
+        """비동기 엔진의 연결을 모두 닫음"""
+        for engine in [self.engine, *self.replica_engines.values()]:
+            if engine is not None:
+                await engine.dispose()
+        self.engine, self.replica_engines = None, {}
+
+    async def _call_view(self, view, environ, view_args, send):
+        """Flask 요청 컨텍스트 안에서 코루틴 뷰 실행 (Flask.full_dispatch_request 와 같은 순서)"""
+        if self.engine is None:     # lifespan 을 보내지 않는 서버
+            self._create_engines()
+
+        app = self.flask_app
+        with app.request_context(environ):
+            try:
+                try:
+                    rv = app.preprocess_request()
+                    if rv is None:
+                        rv = await self._dispatch(view, view_args)
+                except Exception as e:
+                    rv = app.handle_user_exception(e)
+                response = app.finalize_request(rv)
+            except Exception as e:
+                response = app.handle_exception(e)
+
+            await send({
+                'type': 'http.response.start',
+                'status': response.status_code,
+                'headers': _asgi_headers(response.headers.items())
+            })
+            body = b'' if request.method == 'HEAD' else response.get_data()
+            await send({'type': 'http.response.body', 'body': body})
+
+    async def _dispatch(self, view, view_args):
+        replica = self.flask_app.extensions['replicas'].choose(request.cookies)
+        engine = self.engine if replica is None else self.replica_engines[replica]
+        async with engine.connect() as connection:
+            with key_scope(replica or 'primary'):
+                return await view(request._get_current_object(), connection, **view_args)
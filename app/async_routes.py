@@ -0,0 +1,196 @@
+"""asyncio 엔진으로 처리하는 목록 조회 API (코루틴 라우트)
+
+사용자/가게/직원 목록과 가게별·사용자별 목록. 응답 JSON, ETag, 캐시 키는
+동기 라우트(routes.py) 와 같다. asgi.py 가 AsyncApp 에 등록한다.
+"""
+from sqlalchemy import select
+
+from . import cache, limits, versions
+from .asgi import AsyncRoutes
+from .models import Employee, Store, User
+from .pagination import keyset_page_async, parse_fields, parse_page_args
+from .services import (
+    EMPLOYEE_FIELDS, STORE_FIELDS, USER_FIELDS, USER_STORE_FIELDS, _full_name,
+    active_employee_query, page_key, parse_position, store_employees_key, user_stores_key
+)
+
+routes = AsyncRoutes()
+
+
+async def get_user_summary(connection, user_id):
+    """활성 사용자 id/이름 조회 (동기 버전과 같은 캐시 키)"""
+    async def load():
+        result = await connection.execute(
+            select(User.id, User.first_name, User.last_name)
+            .where(User.id == user_id, User.is_active.is_(True))
+        )
+        row = result.first()
+        return {"id": row.id, "name": _full_name(row.first_name, row.last_name)} if row else None
+    return await cache.get_or_load_async('user', user_id, load)
+
+
+async def get_store_summary(connection, store_id):
+    """활성 가게 id/이름 조회 (동기 버전과 같은 캐시 키)"""
+    async def load():
+        result = await connection.execute(
+            select(Store.id, Store.name).where(Store.id == store_id, Store.is_active.is_(True))
+        )
+        row = result.first()
+        return {"id": row.id, "name": row.name} if row else None
+    return await cache.get_or_load_async('store', store_id, load)
+
+
+@routes.route('/api/users')
+@routes.conditional(versions, 'users')
+async def list_users(request, connection):
+    try:
+        after, limit = parse_page_args(request.args)
+        fields = parse_fields(request.args, USER_FIELDS, USER_FIELDS)
+    except ValueError as e:
+        return {"error": str(e)}, 400
+
+    try:
+        async def load():
+            user_list, next_cursor = await keyset_page_async(
+                connection, select(User.id).filter_by(is_active=True), User.id,
+                USER_FIELDS, fields, after, limit
+            )
+            return {
+                "message": "사용자 목록 조회 성공",
+                "users": user_list,
+                "count": len(user_list),
+                "next_cursor": next_cursor
+            }
+
+        return await cache.get_or_load_async('users', page_key(after, limit, fields), load)
+    except Exception as e:
+        return {"error": f"사용자 목록 조회 실패: {str(e)}"}, 500
+
+
+@routes.route('/api/stores')
+@routes.conditional(versions, 'stores')
+async def list_stores(request, connection):
+    try:
+        after, limit = parse_page_args(request.args)
+        fields = parse_fields(request.args, STORE_FIELDS, STORE_FIELDS)
+    except ValueError as e:
+        return {"error": str(e)}, 400
+
+    try:
+        async def load():
+            store_list, next_cursor = await keyset_page_async(
+                connection, select(Store.id).filter_by(is_active=True), Store.id,
+                STORE_FIELDS, fields, after, limit
+            )
+            return {
+                "message": "가게 목록 조회 성공",
+                "stores": store_list,
+                "count": len(store_list),
+                "next_cursor": next_cursor
+            }
+
+        return await cache.get_or_load_async('stores', page_key(after, limit, fields), load)
+    except Exception as e:
+        return {"error": f"가게 목록 조회 실패: {str(e)}"}, 500
+
+
+@routes.route('/api/employees')
+@routes.conditional(versions, 'users', 'stores', 'employees')
+@routes.limited(limits, 'employees')
+async def list_employees(request, connection):
+    try:
+        after, limit = parse_page_args(request.args)
+        fields = parse_fields(request.args, EMPLOYEE_FIELDS, EMPLOYEE_FIELDS)
+    except ValueError as e:
+        return {"error": str(e)}, 400
+
+    try:
+        async def load():
+            employee_list, next_cursor = await keyset_page_async(
+                connection, active_employee_query(fields, query=select(Employee.id)), Employee.id,
+                EMPLOYEE_FIELDS, fields, after, limit
+            )
+            return {
+                "message": "직원 목록 조회 성공",
+                "employees": employee_list,
+                "count": len(employee_list),
+                "next_cursor": next_cursor
+            }
+
+        return await cache.get_or_load_async('employees', page_key(after, limit, fields), load)
+    except Exception as e:
+        return {"error": f"직원 목록 조회 실패: {str(e)}"}, 500
+
+
+@routes.route('/api/stores/<int:store_id>/employees')
+@routes.conditional(versions, 'users', 'stores', 'employees')
+async def list_store_employees(request, connection, store_id):
+    try:
+        after, limit = parse_page_args(request.args)
+        fields = parse_fields(request.args, EMPLOYEE_FIELDS, EMPLOYEE_FIELDS)
+        position = parse_position(request.args)
+    except ValueError as e:
+        return {"error": str(e)}, 400
+
+    try:
+        store = await get_store_summary(connection, store_id)
+        if not store:
+            return {"error": "존재하지 않는 가게입니다"}, 404
+
+        async def load():
+            query = active_employee_query(fields, query=select(Employee.id)) \
+                .where(Employee.store_id == store_id)
+            if position:
+                query = query.where(Employee.type == position)
+            employee_list, next_cursor = await keyset_page_async(
+                connection, query, Employee.id, EMPLOYEE_FIELDS, fields, after, limit
+            )
+            return {
+                "message": "가게 직원 목록 조회 성공",
+                "store": store,
+                "employees": employee_list,
+                "count": len(employee_list),
+                "next_cursor": next_cursor
+            }
+
+        key = store_employees_key(store_id, position, after, limit, fields)
+        return await cache.get_or_load_async('employees', key, load)
+    except Exception as e:
+        return {"error": f"가게 직원 목록 조회 실패: {str(e)}"}, 500
+
+
+@routes.route('/api/users/<int:user_id>/stores')
+@routes.conditional(versions, 'users', 'stores', 'employees')
+async def list_user_stores(request, connection, user_id):
+    try:
+        after, limit = parse_page_args(request.args)
+        fields = parse_fields(request.args, USER_STORE_FIELDS, USER_STORE_FIELDS)
+        position = parse_position(request.args)
+    except ValueError as e:
+        return {"error": str(e)}, 400
+
+    try:
+        user = await get_user_summary(connection, user_id)
+        if not user:
+            return {"error": "존재하지 않는 사용자입니다"}, 404
+
+        async def load():
+            query = active_employee_query(fields, USER_STORE_FIELDS, select(Employee.id)) \
+                .where(Employee.user_id == user_id)
+            if position:
+                query = query.where(Employee.type == position)
+            store_list, next_cursor = await keyset_page_async(
+                connection, query, Employee.id, USER_STORE_FIELDS, fields, after, limit
+            )
+            return {
+                "message": "사용자 근무 가게 목록 조회 성공",
+                "user": user,
+                "stores": store_list,
+                "count": len(store_list),
+                "next_cursor": next_cursor
+            }
+
+        key = user_stores_key(user_id, position, after, limit, fields)
+        return await cache.get_or_load_async('employees', key, load)
+    except Exception as e:
+        return {"error": f"사용자 근무 가게 목록 조회 실패: {str(e)}"}, 500
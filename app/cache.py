@@ -0,0 +1,235 @@
+"""읽기 캐시 (가게/사용자 조회, 목록 응답)
+
+백엔드
+    memory: 프로세스 내 LRU + TTL (기본)
+    redis:  Redis 호환 클라이언트 (get / set(ex=) / incr 만 사용)
+    null:   캐시 사용 안 함
+
+무효화는 namespace 별 세대(generation) 번호를 올리는 방식이다. 키에 세대가
+들어가므로 namespace 의 모든 키를 찾아 지울 필요가 없다. 세션 커밋 시
+변경된 테이블에 연결된 namespace 가 자동으로 무효화된다.
+
+설정 (app.config)
+    CACHE_BACKEND: 'memory' | 'redis' | 'null'
+    CACHE_TTL: 초 단위 만료 시간 (기본 30)
+    CACHE_MAXSIZE: memory 백엔드 최대 항목 수 (기본 1024)
+    CACHE_REDIS_URL: redis 백엔드 접속 주소
+    CACHE_REDIS_CLIENT: redis 대신 쓸 호환 클라이언트 객체 (테스트용)
+
+memory 백엔드는 워커 프로세스마다 따로 있으므로, 다른 워커에서 일어난
+변경은 TTL 이 지나야 반영된다. 단 key_scope(...) 블록 안의 키에는 블록에
+넘긴 값이 덧붙는다. versions.conditional 은 응답을 만드는 동안 테이블 버전을
+넘기므로, 조건부 GET 목록은 어느 프로세스의 변경이든 ETag 가 바뀌는 순간
+다른 캐시 키를 쓰게 되어 ETag 와 본문이 어긋나지 않는다.
+"""
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+import json
+import threading
+import time
+
+from sqlalchemy import event
+
+from .changes import changed_tables, track_changes
+
+MISSING = object()
+
+_scope = ContextVar('cache_key_scope', default=())
+
+
+@contextmanager
+def key_scope(*parts):
+    """이 블록 안에서 만드는 캐시 키에 parts 를 덧붙임 (중첩 가능)"""
+    token = _scope.set(_scope.get() + tuple(str(part) for part in parts))
+    try:
+        yield
+    finally:
+        _scope.reset(token)
+
+
+class NullCache:
+    """아무것도 저장하지 않는 백엔드"""
+
+    def get(self, key):
+        return MISSING
+
+    def set(self, key, value):
+        pass
+
+    def generation(self, namespace):
+        return 0
+
+    def bump(self, namespace):
+        pass
+
+    def clear(self):
+        pass
+
+
+class LRUCache:
+    """프로세스 내 LRU + TTL 백엔드"""
+
+    def __init__(self, maxsize=1024, ttl=30):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._generations = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return MISSING
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return MISSING
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def generation(self, namespace):
+        with self._lock:
+            return self._generations.get(namespace, 0)
+
+    def bump(self, namespace):
+        with self._lock:
+            self._generations[namespace] = self._generations.get(namespace, 0) + 1
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._generations.clear()
+
+
+class RedisCache:
+    """Redis 호환 클라이언트 백엔드 (값은 JSON 으로 저장)"""
+
+    def __init__(self, client, ttl=30, prefix='bungeoppang:'):
+        self.client = client
+        self.ttl = ttl
+        self.prefix = prefix
+
+    def get(self, key):
+        raw = self.client.get(self.prefix + key)
+        return MISSING if raw is None else json.loads(raw)
+
+    def set(self, key, value):
+        self.client.set(self.prefix + key, json.dumps(value), ex=self.ttl)
+
+    def generation(self, namespace):
+        return int(self.client.get(f"{self.prefix}gen:{namespace}") or 0)
+
+    def bump(self, namespace):
+        self.client.incr(f"{self.prefix}gen:{namespace}")
+
+    def clear(self):
+        pass
+
+
+class Cache:
+    """read-through 캐시 + 적중/실패 카운터"""
+
+    def __init__(self):
+        self.backend = NullCache()
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def init_app(self, app):
+        backend = app.config.get('CACHE_BACKEND', 'memory')
+        ttl = app.config.get('CACHE_TTL', 30)
+
+        if backend == 'memory':
+            self.backend = LRUCache(app.config.get('CACHE_MAXSIZE', 1024), ttl)
+        elif backend == 'redis':
+            client = app.config.get('CACHE_REDIS_CLIENT')
+            if client is None:
+                try:
+                    import redis
+                except ImportError:
+                    raise RuntimeError("CACHE_BACKEND='redis' 를 쓰려면 redis 패키지가 필요합니다")
+                client = redis.Redis.from_url(app.config['CACHE_REDIS_URL'])
+            self.backend = RedisCache(client, ttl)
+        elif backend == 'null':
+            self.backend = NullCache()
+        else:
+            raise ValueError(f"알 수 없는 캐시 백엔드입니다: {backend}")
+
+        app.extensions['cache'] = self
+
+    def full_key(self, namespace, key):
+        """namespace 세대 + key_scope 를 포함한 백엔드 키"""
+        full_key = f"{namespace}:{self.backend.generation(namespace)}:{key}"
+        scope = _scope.get()
+        return f"{full_key}@{'/'.join(scope)}" if scope else full_key
+
+    def get_or_load(self, namespace, key, loader):
+        """캐시에 있으면 반환, 없으면 loader() 결과를 저장 후 반환 (None 은 저장 안 함)"""
+        full_key = self.full_key(namespace, key)
+        value = self.backend.get(full_key)
+        if value is not MISSING:
+            with self._lock:
+                self.hits += 1
+            return value
+
+        with self._lock:
+            self.misses += 1
+        value = loader()
+        if value is not None:
+            self.backend.set(full_key, value)
+        return value
+
+    async def get_or_load_async(self, namespace, key, loader):
+        """get_or_load 의 비동기 버전 (loader 는 코루틴 함수)
+
+        백엔드 호출은 동기로 한다. memory / null 은 바로 끝나지만 redis 는
+        그동안 이벤트 루프를 잠깐 막는다.
+        """
+        full_key = self.full_key(namespace, key)
+        value = self.backend.get(full_key)
+        if value is not MISSING:
+            with self._lock:
+                self.hits += 1
+            return value
+
+        with self._lock:
+            self.misses += 1
+        value = await loader()
+        if value is not None:
+            self.backend.set(full_key, value)
+        return value
+
+    def invalidate(self, *namespaces):
+        for namespace in namespaces:
+            self.backend.bump(namespace)
+
+    def watch(self, session, dependencies):
+        """세션 커밋 시 변경된 테이블에 연결된 namespace 무효화
+
+        dependencies: {테이블명: (무효화할 namespace, ...)}
+        """
+        track_changes(session)
+
+        @event.listens_for(session, 'after_commit')
+        def after_commit(sess):
+            for table in changed_tables(sess):
+                self.invalidate(*dependencies.get(table, ()))
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "backend": type(self.backend).__name__,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / total, 4) if total else 0.0
+            }
@@ -0,0 +1,39 @@
+"""세션별 변경 테이블 추적 (캐시 무효화 / 테이블 버전 관리에서 공용)"""
+from itertools import chain
+
+from sqlalchemy import event
+
+_INFO_KEY = 'changed_tables'
+_tracked = set()
+
+
+def changed_tables(session):
+    """현재 트랜잭션에서 변경된 테이블 이름 집합"""
+    return session.info.setdefault(_INFO_KEY, set())
+
+
+def track_changes(session):
+    """ORM flush 와 session.execute(insert/update/delete(Model)) 로 바뀐 테이블을 기록
+
+    기록은 최상위 트랜잭션이 끝날 때(커밋/롤백 모두) 비워진다.
+    같은 세션에 여러 번 호출해도 한 번만 등록된다.
+    """
+    if id(session) in _tracked:
+        return
+    _tracked.add(id(session))
+
+    @event.listens_for(session, 'after_flush')
+    def after_flush(sess, flush_context):
+        tables = changed_tables(sess)
+        for obj in chain(sess.new, sess.dirty, sess.deleted):
+            tables.add(obj.__table__.name)
+
+    @event.listens_for(session, 'do_orm_execute')
+    def do_orm_execute(state):
+        if (state.is_insert or state.is_update or state.is_delete) and state.bind_mapper:
+            changed_tables(state.session).add(state.bind_mapper.local_table.name)
+
+    @event.listens_for(session, 'after_transaction_end')
+    def after_transaction_end(sess, transaction):
+        if transaction.parent is None:
+            sess.info.pop(_INFO_KEY, None)
@@ -1,5 +1,54 @@
+import os
+
+from .database import database_url, replica_urls
+
 class Config:
-    SQLALCHEMY_DATABASE_URI = "sqlite:///bungeoppang.db"
+    SQLALCHEMY_DATABASE_URI = database_url()
+    SQLALCHEMY_REPLICA_URIS = replica_urls()   # 읽기 전용 복제본 (목록 / 검색 / 내보내기)
+    READ_YOUR_WRITES_SECONDS = 5         # 쓰기 후 그 클라이언트가 주 DB 를 읽는 시간 (초)
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     SECRET_KEY = 'my-bungeoppang-secret-2024'
-    DEBUG = True
+    DEBUG = os.environ.get('FLASK_DEBUG') == '1'   # 운영 기본값은 끔
+    PASSWORD_HASH_EXECUTOR = 'process'   # process | thread | inline
+    PASSWORD_HASH_WORKERS = None         # None 이면 CPU 코어 수 (gunicorn: 코어 수 / 워커 수)
+    EMPLOYEE_CODE_KEY = 0x5EED_B00C      # 직원번호 순열 키 (운영 중 변경 금지)
+    BULK_SIGNUP_ROWS_PER_HASH_WORKER = 20   # 일괄 가입 최대 건수 = 이 값 x 해시 작업자 수 (요청당 약 10 초)
+    CACHE_BACKEND = 'memory'             # memory | redis | null
+    CACHE_TTL = 30
+    CACHE_MAXSIZE = 1024
+    CACHE_REDIS_URL = None
+    IDEMPOTENCY_TTL = 86400              # Idempotency-Key 응답 보관 시간 (초)
+    IDEMPOTENCY_LOCK_TIMEOUT = 60        # 처리 중 행을 죽은 요청으로 볼 시간 (초)
+    ARCHIVE_AFTER_DAYS = 30              # 비활성화 후 보관 테이블로 옮기기까지 일수
+    ARCHIVE_BATCH_SIZE = 1000
+    JOBS_EXECUTOR = 'thread'             # thread | external (flask jobs-worker 만)
+    JOBS_WORKERS = 1
+    JOBS_POLL_INTERVAL = 1.0             # 빈 큐 확인 첫 간격 (초)
+    JOBS_POLL_MAX_INTERVAL = 30.0        # 큐가 계속 비면 두 배씩 늘리는 간격의 상한 (초)
+    JOBS_MAX_ATTEMPTS = 5
+    JOBS_RETRY_BACKOFF = 2               # 첫 재시도 대기 (초, 시도마다 2배)
+    JOBS_LOCK_TIMEOUT = 300              # running 작업을 죽은 작업으로 볼 시간 (초)
+    JOBS_TTL = 604800                    # 끝난 작업 보관 시간 (초)
+    WEBHOOK_URL = os.environ.get('WEBHOOK_URL')   # 가입 / 직원 등록 이벤트를 받을 주소 (작업 큐로 전송)
+    WEBHOOK_TIMEOUT = 5                  # 웹훅 요청 제한 시간 (초)
+    RATELIMIT_BACKEND = 'memory'         # memory | redis | null
+    RATELIMIT_CAPACITY = 60              # 클라이언트 x 라우트별 버킷 크기 (토큰)
+    RATELIMIT_REFILL_RATE = 2.0          # 초당 보충 토큰
+    RATELIMIT_COSTS = {                  # 요청 한 번의 토큰 (없는 라우트는 1)
+        'signup': 10,                    # PBKDF2 한 번
+        'signup_bulk': 30,
+        'employees': 1,
+        'export': 20
+    }
+    RATELIMIT_REDIS_URL = None
+    ADMISSION_LIMITS = {                 # 프로세스별 (동시 실행 수, 대기열 길이)
+        'signup': (8, 16),
+        'signup_bulk': (2, 4),
+        'employees': (8, 16),
+        'export': (2, 2)
+    }
+    ADMISSION_QUEUE_TIMEOUT = 2.0        # 대기열에서 기다리는 최대 시간 (초)
+    JSON_BACKEND = 'auto'                # auto | orjson | std
+    INSTRUMENTATION_ENABLED = os.environ.get('INSTRUMENTATION_ENABLED') == '1'
+    PROFILE_SAMPLE_RATE = float(os.environ.get('PROFILE_SAMPLE_RATE', 0))
+    PROFILE_SLOW_REQUEST_MS = 500
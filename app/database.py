@@ -0,0 +1,138 @@
+"""DB 엔진 설정 (SQLite 운영용 PRAGMA, PostgreSQL 커넥션 풀)
+
+환경변수
+    DATABASE_URL              접속 주소 (기본: sqlite:///bungeoppang.db)
+    DATABASE_REPLICA_URLS     읽기 전용 복제본 주소 (쉼표 구분, 기본 없음)
+    DB_POOL_SIZE              풀 크기 (PostgreSQL 기본 10)
+    DB_MAX_OVERFLOW           풀 초과 허용 연결 수 (PostgreSQL 기본 20)
+    DB_POOL_TIMEOUT           풀 대기 시간 초 (기본 30)
+    DB_POOL_RECYCLE           연결 재생성 주기 초 (PostgreSQL 기본 1800)
+    DB_POOL_PRE_PING          사용 전 연결 확인 (PostgreSQL 기본 1)
+    SQLITE_JOURNAL_MODE       기본 WAL (읽기와 쓰기가 서로 막지 않음)
+    SQLITE_SYNCHRONOUS        기본 NORMAL (WAL 에서는 커밋마다 fsync 하지 않아도 안전)
+    SQLITE_BUSY_TIMEOUT_MS    잠금 대기 시간 (기본 5000)
+    SQLITE_MMAP_SIZE          메모리 맵 크기 바이트 (기본 256MB)
+    SQLITE_CACHE_SIZE         페이지 캐시 (음수는 KB 단위, 기본 -65536 = 64MB)
+"""
+import os
+
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+
+DEFAULT_DATABASE_URL = "sqlite:///bungeoppang.db"
+
+# 복제본 bind 키 (SQLALCHEMY_BINDS)
+REPLICA_BIND = "replica_{}"
+
+# 복제본 연결에서는 쓰기가 필요한 PRAGMA 대신 query_only 로 쓰기를 막는다
+REPLICA_SKIP_PRAGMAS = ("journal_mode", "synchronous")
+
+# 비동기 엔진에서 쓸 asyncio 드라이버
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg"
+}
+
+
+def database_url():
+    return os.environ.get('DATABASE_URL', DEFAULT_DATABASE_URL)
+
+
+def replica_urls():
+    value = os.environ.get('DATABASE_REPLICA_URLS', '')
+    return [url.strip() for url in value.split(',') if url.strip()]
+
+
+def _env_int(name, default=None):
+    value = os.environ.get(name)
+    return int(value) if value not in (None, '') else default
+
+
+def sqlite_pragmas():
+    """연결마다 실행할 SQLite PRAGMA"""
+    return {
+        "journal_mode": os.environ.get('SQLITE_JOURNAL_MODE', 'WAL'),
+        "synchronous": os.environ.get('SQLITE_SYNCHRONOUS', 'NORMAL'),
+        "busy_timeout": _env_int('SQLITE_BUSY_TIMEOUT_MS', 5000),
+        "mmap_size": _env_int('SQLITE_MMAP_SIZE', 256 * 1024 * 1024),
+        "cache_size": _env_int('SQLITE_CACHE_SIZE', -65536)
+    }
+
+
+def engine_options(uri):
+    """SQLALCHEMY_ENGINE_OPTIONS 값 (접속 주소의 DB 종류에 맞춰 계산)"""
+    backend = make_url(uri).get_backend_name()
+    options = {}
+
+    if backend == 'postgresql':
+        options.update({
+            "pool_size": _env_int('DB_POOL_SIZE', 10),
+            "max_overflow": _env_int('DB_MAX_OVERFLOW', 20),
+            "pool_timeout": _env_int('DB_POOL_TIMEOUT', 30),
+            "pool_recycle": _env_int('DB_POOL_RECYCLE', 1800),
+            "pool_pre_ping": bool(_env_int('DB_POOL_PRE_PING', 1))
+        })
+    elif backend == 'sqlite':
+        # sqlite3 드라이버 자체 잠금 대기도 busy_timeout 과 맞춤
+        options["connect_args"] = {"timeout": sqlite_pragmas()["busy_timeout"] / 1000}
+        for key, name in [("pool_size", 'DB_POOL_SIZE'), ("max_overflow", 'DB_MAX_OVERFLOW'),
+                          ("pool_timeout", 'DB_POOL_TIMEOUT')]:
+            if _env_int(name) is not None:
+                options[key] = _env_int(name)
+
+    return options
+
+
+def install_sqlite_pragmas(engine, pragmas):
+    """engine 의 새 연결마다 PRAGMA 실행 (AsyncEngine 은 sync_engine 을 넘김)"""
+    @event.listens_for(engine, 'connect')
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
+
+
+def async_database_url(url):
+    """동기 접속 주소를 asyncio 드라이버 주소로 (sqlite -> aiosqlite, postgresql -> asyncpg)"""
+    url = make_url(url)
+    backend = url.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"비동기 엔진을 지원하지 않는 DB 입니다: {backend}")
+    return url.set(drivername=ASYNC_DRIVERS[backend])
+
+
+def _pragmas_for(app, bind_key):
+    pragmas = app.config.get('SQLITE_PRAGMAS') or sqlite_pragmas()
+    if bind_key is None:
+        return pragmas
+    pragmas = {name: value for name, value in pragmas.items() if name not in REPLICA_SKIP_PRAGMAS}
+    pragmas["query_only"] = 1
+    return pragmas
+
+
+def create_async_engine_for(app, db, bind_key=None):
+    """동기 엔진(bind_key, 기본은 주 DB)과 같은 DB / 풀 옵션 / PRAGMA 를 쓰는 AsyncEngine
+
+    Flask-SQLAlchemy 가 상대 경로 SQLite 주소를 instance 폴더 기준으로
+    바꾸므로, 설정값이 아니라 실제 동기 엔진의 주소를 변환한다.
+    """
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    with app.app_context():
+        url = db.engines[bind_key].url
+    options = dict(app.config.get('SQLALCHEMY_ENGINE_OPTIONS') or engine_options(url))
+    engine = create_async_engine(async_database_url(url), **options)
+
+    if url.get_backend_name() == 'sqlite':
+        install_sqlite_pragmas(engine.sync_engine, _pragmas_for(app, bind_key))
+    return engine
+
+
+def init_engine(app, db):
+    """SQLite 엔진이면 새 연결마다 PRAGMA 적용 (복제본 bind 는 query_only)"""
+    with app.app_context():
+        engines = dict(db.engines)
+    for bind_key, engine in engines.items():
+        if engine.dialect.name == 'sqlite':
+            install_sqlite_pragmas(engine, _pragmas_for(app, bind_key))
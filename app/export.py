@@ -0,0 +1,29 @@
+"""대용량 목록 스트리밍(NDJSON) 내보내기"""
+from flask import Response, current_app, stream_with_context
+
+from .pagination import project
+
+EXPORT_BATCH_SIZE = 1000
+
+
+def stream_ndjson(query, id_column, spec, fields, batch_size=EXPORT_BATCH_SIZE):
+    """query 결과를 한 줄에 한 객체(NDJSON)로 스트리밍하는 Response 생성
+
+    yield_per 로 서버 측 커서를 batch_size 만큼씩 읽고, 읽은 묶음을 바로
+    응답으로 흘려보내므로 테이블 크기와 관계없이 메모리 사용량이 일정하다.
+    """
+    columns, to_dict = project(spec, fields, id_column)
+    rows = query.with_entities(*columns).order_by(id_column).yield_per(batch_size)
+
+    def generate():
+        dumps = current_app.json.dumps
+        chunk = []
+        for row in rows:
+            chunk.append(dumps(to_dict(row)))
+            if len(chunk) >= batch_size:
+                yield '\n'.join(chunk) + '\n'
+                chunk = []
+        if chunk:
+            yield '\n'.join(chunk) + '\n'
+
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
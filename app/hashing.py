@@ -0,0 +1,164 @@
+"""비밀번호 해시 도우미
+
+PBKDF2 는 요청 하나에 수백 ms 의 CPU 를 쓰므로, 요청 스레드에서 직접 돌리지
+않고 별도 실행기(기본: 프로세스 풀)에 맡긴다.
+
+프로세스 풀은 forkserver (없으면 spawn) 로 작업자를 띄운다. gthread 워커처럼
+스레드가 도는 프로세스를 fork 하면 다른 스레드가 잡고 있던 잠금이 자식에서
+풀리지 않아 멈출 수 있다.
+
+풀은 워커 프로세스마다 하나씩 생기므로, gunicorn 에서는 post_fork 가 작업자
+수를 CPU 코어 수 / 워커 수 (최소 1) 로 다시 맞춘다 (gunicorn.conf.py).
+
+설정 (app.config)
+    PASSWORD_HASH_EXECUTOR: 'process' (기본) | 'thread' | 'inline'
+    PASSWORD_HASH_WORKERS: 작업자 수 (기본: CPU 코어 수, gunicorn 에서는 코어 수 / 워커 수)
+"""
+from concurrent.futures import Future, ThreadPoolExecutor
+import atexit
+import multiprocessing
+import os
+import threading
+import time
+
+from werkzeug.security import generate_password_hash
+
+HASH_METHOD = 'pbkdf2:sha256'
+EXECUTOR_MODES = ('process', 'thread', 'inline')
+# 프로세스 풀 시작 방식 (앞에서부터 지원하는 것)
+START_METHODS = ('forkserver', 'spawn')
+
+_mode = 'process'
+_workers = os.cpu_count() or 1
+_executor = None
+_lock = threading.Lock()
+
+# 실행기 지표 (대기열 길이 / 해시 지연시간)
+_stats = {
+    "submitted": 0,
+    "completed": 0,
+    "failed": 0,
+    "total_latency": 0.0,
+    "max_latency": 0.0
+}
+
+
+def _hash(password):
+    return generate_password_hash(password, method=HASH_METHOD)
+
+
+def configure(mode='process', workers=None):
+    """실행기 종류와 작업자 수 설정 (기존 풀은 종료 후 다음 사용 시 새로 생성)"""
+    global _mode, _workers, _executor
+    if mode not in EXECUTOR_MODES:
+        raise ValueError(f"알 수 없는 해시 실행기입니다: {mode}")
+
+    with _lock:
+        old, _executor = _executor, None
+        _mode = mode
+        _workers = workers or os.cpu_count() or 1
+    if old is not None:
+        old.shutdown(wait=False)
+
+
+def init_app(app):
+    """app.config 의 PASSWORD_HASH_* 설정으로 실행기 구성"""
+    configure(
+        app.config.get('PASSWORD_HASH_EXECUTOR', 'process'),
+        app.config.get('PASSWORD_HASH_WORKERS')
+    )
+
+
+def _get_executor():
+    """풀은 처음 필요할 때 한 번만 생성"""
+    global _executor
+    with _lock:
+        if _executor is None:
+            if _mode == 'process':
+                from concurrent.futures import ProcessPoolExecutor
+                _executor = ProcessPoolExecutor(max_workers=_workers, mp_context=_mp_context())
+            else:
+                _executor = ThreadPoolExecutor(max_workers=_workers,
+                                               thread_name_prefix='password-hash')
+        return _executor
+
+
+def _mp_context():
+    """fork 가 아닌 시작 방식의 multiprocessing 컨텍스트"""
+    available = multiprocessing.get_all_start_methods()
+    method = next(method for method in START_METHODS if method in available)
+    return multiprocessing.get_context(method)
+
+
+def _shutdown():
+    """인터프리터 종료 시 모듈 정리 전에 풀을 닫음 (지연 생성한 프로세스 풀 경고 방지)"""
+    global _executor
+    with _lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown()
+
+
+atexit.register(_shutdown)
+
+
+def _record(started, future):
+    latency = time.perf_counter() - started
+    with _lock:
+        if future.cancelled() or future.exception() is not None:
+            _stats["failed"] += 1
+        else:
+            _stats["completed"] += 1
+        _stats["total_latency"] += latency
+        _stats["max_latency"] = max(_stats["max_latency"], latency)
+
+
+def submit_hash(password):
+    """해시 작업을 대기열에 넣고 Future 를 바로 반환 (비동기 경로)"""
+    with _lock:
+        _stats["submitted"] += 1
+    started = time.perf_counter()
+
+    if _mode == 'inline':
+        future = Future()
+        try:
+            future.set_result(_hash(password))
+        except Exception as e:
+            future.set_exception(e)
+    else:
+        future = _get_executor().submit(_hash, password)
+
+    future.add_done_callback(lambda f: _record(started, f))
+    return future
+
+
+def hash_password(password):
+    """비밀번호 하나를 실행기에서 해시하고 결과를 기다림"""
+    return submit_hash(password).result()
+
+
+def hash_passwords(passwords):
+    """여러 비밀번호를 실행기에서 병렬로 해시 (입력 순서 유지)"""
+    futures = [submit_hash(password) for password in passwords]
+    return [future.result() for future in futures]
+
+
+def parallelism():
+    """동시에 실행되는 해시 수 (inline 은 요청 스레드에서 하나씩)"""
+    return 1 if _mode == 'inline' else _workers
+
+
+def hash_stats():
+    """해시 실행기 지표 조회"""
+    with _lock:
+        finished = _stats["completed"] + _stats["failed"]
+        return {
+            "executor": _mode,
+            "workers": _workers,
+            "queue_depth": _stats["submitted"] - finished,
+            "submitted": _stats["submitted"],
+            "completed": _stats["completed"],
+            "failed": _stats["failed"],
+            "avg_latency_ms": round(_stats["total_latency"] / finished * 1000, 2) if finished else 0.0,
+            "max_latency_ms": round(_stats["max_latency"] * 1000, 2)
+        }
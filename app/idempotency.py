@@ -0,0 +1,174 @@
+"""Idempotency-Key 로 쓰기 요청 재시도를 안전하게
+
+같은 Idempotency-Key 헤더로 다시 온 POST 는 뷰(비밀번호 해시, 직원번호
+발급, INSERT)를 다시 실행하지 않고 처음 응답을 그대로 돌려준다.
+
+    1) (키, 경로) 행을 '처리 중' 으로 먼저 INSERT 하고 커밋 (PK 충돌 = 이미 있음)
+    2) 뷰 실행 후 상태 코드와 응답 본문을 그 행에 저장
+       5xx, 429 나 예외면 행을 지워서 재시도가 처음부터 다시 실행되게 함
+    3) 재시도: 저장된 응답 + Idempotent-Replayed: true
+       아직 처리 중이면 409, 같은 키에 다른 본문이면 422
+
+요청 한도(@limits.limit) 는 이 데코레이터 안쪽에 붙인다. 저장된 응답을
+돌려주는 재시도는 토큰이나 동시 실행 자리를 쓰지 않는다.
+
+행은 테이블에 있으므로 워커 / 프로세스가 여러 개여도 공유된다.
+
+설정 (app.config)
+    IDEMPOTENCY_TTL: 응답 보관 시간 (초, 기본 86400). 지나면 같은 키를 새 요청으로 처리
+    IDEMPOTENCY_LOCK_TIMEOUT: '처리 중' 행을 죽은 요청으로 보고 넘겨받기까지의 시간
+                              (초, 기본 60)
+
+오래된 행은 flask purge-idempotency-keys 로 지운다.
+"""
+from datetime import datetime, timedelta, timezone
+from functools import wraps
+import hashlib
+import threading
+
+import click
+from flask import current_app, jsonify, make_response, request
+from flask.cli import with_appcontext
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.exc import IntegrityError
+
+HEADER = 'Idempotency-Key'
+MAX_KEY_LENGTH = 255
+
+
+def _utcnow():
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class Idempotency:
+    """Idempotency-Key 응답 저장소 + 데코레이터"""
+
+    def __init__(self):
+        self.session = None
+        self.table = None
+        self.ttl = 86400
+        self.lock_timeout = 60
+        self._replays = 0
+        self._conflicts = 0
+        self._lock = threading.Lock()
+
+    def watch(self, session, model):
+        """model: (key, path, fingerprint, status_code, response, created_at) 컬럼을 가진 모델"""
+        self.session = session
+        self.table = model.__table__
+
+    def init_app(self, app):
+        self.ttl = app.config.get('IDEMPOTENCY_TTL', 86400)
+        self.lock_timeout = app.config.get('IDEMPOTENCY_LOCK_TIMEOUT', 60)
+        app.cli.add_command(purge_command)
+        app.extensions['idempotency'] = self
+
+    def stats(self):
+        with self._lock:
+            return {"replays": self._replays, "conflicts": self._conflicts}
+
+    @staticmethod
+    def fingerprint():
+        """같은 키로 다른 요청을 보냈는지 가리기 위한 본문 해시"""
+        digest = hashlib.sha256(request.method.encode())
+        digest.update(request.get_data(cache=True))
+        return digest.hexdigest()
+
+    def _claim(self, key, path, fingerprint):
+        """'처리 중' 행을 넣으면 None, 이미 있으면 기존 행 반환"""
+        t = self.table
+        for _ in range(3):
+            try:
+                self.session.execute(insert(t).values(
+                    key=key, path=path, fingerprint=fingerprint, created_at=_utcnow()
+                ))
+                self.session.commit()
+                return None
+            except IntegrityError:
+                self.session.rollback()
+
+            row = self.session.execute(
+                select(t).where(t.c.key == key, t.c.path == path)
+            ).first()
+            if row is None:     # 그 사이 다른 요청이 지움
+                continue
+            age = (_utcnow() - row.created_at).total_seconds()
+            expired = age > (self.lock_timeout if row.status_code is None else self.ttl)
+            if not expired:
+                return row
+            # 만료된 응답 / 죽은 요청의 행은 지우고 다시 시도
+            self.session.execute(delete(t).where(
+                t.c.key == key, t.c.path == path, t.c.created_at == row.created_at
+            ))
+            self.session.commit()
+        raise RuntimeError(f"{HEADER} 행을 확보하지 못했습니다")
+
+    def _finish(self, key, path, response):
+        t = self.table
+        where = (t.c.key == key, t.c.path == path)
+        self.session.rollback()
+        if response is None or response.status_code >= 500 or response.status_code == 429:
+            self.session.execute(delete(t).where(*where))
+        else:
+            self.session.execute(update(t).where(*where).values(
+                status_code=response.status_code, response=response.get_data(as_text=True)
+            ))
+        self.session.commit()
+
+    def idempotent(self, view):
+        """Idempotency-Key 헤더가 있으면 첫 응답을 저장하고 재시도에 돌려줌"""
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            key = request.headers.get(HEADER)
+            if key is None:
+                return view(*args, **kwargs)
+            if not 0 < len(key) <= MAX_KEY_LENGTH:
+                return jsonify({"error": f"{HEADER} 는 1~{MAX_KEY_LENGTH}자여야 합니다"}), 400
+
+            path = request.path
+            fingerprint = self.fingerprint()
+            row = self._claim(key, path, fingerprint)
+            if row is not None:
+                if row.fingerprint != fingerprint:
+                    with self._lock:
+                        self._conflicts += 1
+                    return jsonify({"error": f"같은 {HEADER} 로 다른 요청이 이미 처리되었습니다"}), 422
+                if row.status_code is None:
+                    with self._lock:
+                        self._conflicts += 1
+                    response = jsonify({"error": f"같은 {HEADER} 요청을 처리하는 중입니다"})
+                    response.status_code = 409
+                    response.headers['Retry-After'] = '1'
+                    return response
+                with self._lock:
+                    self._replays += 1
+                response = current_app.response_class(
+                    row.response, status=row.status_code, mimetype='application/json'
+                )
+                response.headers['Idempotent-Replayed'] = 'true'
+                return response
+
+            response = None
+            try:
+                response = make_response(view(*args, **kwargs))
+                return response
+            finally:
+                self._finish(key, path, response)
+        return wrapper
+
+    def purge(self):
+        """보관 시간이 지난 행 삭제, 지운 행 수 반환"""
+        t = self.table
+        result = self.session.execute(
+            delete(t).where(t.c.created_at < _utcnow() - timedelta(seconds=self.ttl))
+        )
+        self.session.commit()
+        return result.rowcount
+
+
+@click.command('purge-idempotency-keys')
+@with_appcontext
+def purge_command():
+    """보관 시간이 지난 Idempotency-Key 응답 삭제"""
+    deleted = current_app.extensions['idempotency'].purge()
+    click.echo(f"{deleted}개의 Idempotency-Key 응답을 삭제했습니다")
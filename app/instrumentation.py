@@ -0,0 +1,196 @@
+"""요청 단위 계측 (선택 기능)
+
+INSTRUMENTATION_ENABLED 가 켜져 있으면 요청마다
+    - 전체 처리 시간
+    - SQL 실행 횟수와 총 시간 (before/after_cursor_execute 이벤트)
+    - JSON 직렬화 시간
+을 모아서 Server-Timing 헤더로 내보내고, 라우트별 지연시간 히스토그램을
+Prometheus 텍스트 형식으로 METRICS_PATH (기본 /metrics) 에 노출한다.
+
+설정 (app.config)
+    INSTRUMENTATION_ENABLED: 계측 사용 여부 (기본 False)
+    METRICS_PATH: 지표 경로 (기본 '/metrics')
+    PROFILE_SAMPLE_RATE: cProfile 로 감쌀 요청 비율 0.0~1.0 (기본 0 = 사용 안 함)
+    PROFILE_SLOW_REQUEST_MS: 이 시간 이상 걸린 표본 요청만 저장 (기본 500)
+    PROFILE_DIR: .prof 파일 저장 위치 (기본 instance/profiles)
+
+다른 모듈의 지표는 add_metrics(종류, collector) 로 함께 노출한다. 종류는
+'counter' (단조 증가, 이름은 _total 로 끝남) 또는 'gauge' 이고, 이름에
+{라벨} 을 붙이면 같은 지표의 표본으로 묶인다.
+
+지표는 프로세스마다 따로 모인다.
+"""
+import cProfile
+import os
+import random
+import re
+import threading
+import time
+
+from flask import Response, g, has_request_context, request
+from sqlalchemy import event
+
+# 초 단위 히스토그램 구간
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+METRIC_TYPES = ('counter', 'gauge')
+
+
+class Instrumentation:
+    """요청 시간 / SQL / JSON 직렬화 계측과 /metrics"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms = {}     # (method, route) -> [구간별 개수..., 합계, 개수]
+        self._requests = {}       # (method, route, status) -> 개수
+        self._queries = {}        # (method, route) -> [SQL 개수 합, SQL 시간 합]
+        self._collectors = []     # (종류, collector)
+
+    def init_app(self, app, db):
+        if not app.config.get('INSTRUMENTATION_ENABLED', False):
+            return
+
+        self.sample_rate = app.config.get('PROFILE_SAMPLE_RATE', 0.0)
+        self.slow_ms = app.config.get('PROFILE_SLOW_REQUEST_MS', 500)
+        self.profile_dir = app.config.get('PROFILE_DIR') or os.path.join(app.instance_path, 'profiles')
+
+        # 주 DB 와 복제본 bind 의 엔진 모두
+        with app.app_context():
+            for engine in db.engines.values():
+                self.watch_engine(engine)
+        self._wrap_json(app)
+
+        app.before_request(self._before_request)
+        app.after_request(self._after_request)
+        app.add_url_rule(app.config.get('METRICS_PATH', '/metrics'), 'metrics', self.metrics_view)
+        app.extensions['instrumentation'] = self
+
+    def add_metrics(self, kind, collector):
+        """collector() -> {지표 이름: 값} 을 kind ('counter' | 'gauge') 지표로 /metrics 에 함께 노출
+
+        이름에 라벨을 붙이면 ('replica_reads_total{target="primary"}') 같은 지표의
+        표본이 된다. counter 이름은 _total 로 끝나야 한다.
+        """
+        if kind not in METRIC_TYPES:
+            raise ValueError(f"알 수 없는 지표 종류입니다: {kind}")
+        self._collectors.append((kind, collector))
+
+    def watch_engine(self, engine):
+        """engine 의 SQL 실행 횟수 / 시간을 요청별로 모음 (AsyncEngine 은 sync_engine 을 넘김)"""
+        @event.listens_for(engine, 'before_cursor_execute')
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            conn.info.setdefault('query_started', []).append(time.perf_counter())
+
+        @event.listens_for(engine, 'after_cursor_execute')
+        def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            elapsed = time.perf_counter() - conn.info['query_started'].pop()
+            if has_request_context() and 'timing' in g:
+                g.timing['sql_count'] += 1
+                g.timing['sql_time'] += elapsed
+
+    def _wrap_json(self, app):
+        provider = app.json
+        dumps = provider.dumps
+
+        def timed_dumps(obj, **kwargs):
+            started = time.perf_counter()
+            try:
+                return dumps(obj, **kwargs)
+            finally:
+                if has_request_context() and 'timing' in g:
+                    g.timing['json_time'] += time.perf_counter() - started
+
+        provider.dumps = timed_dumps
+
+    def _before_request(self):
+        g.timing = {"started": time.perf_counter(), "sql_count": 0, "sql_time": 0.0, "json_time": 0.0}
+        if self.sample_rate and random.random() < self.sample_rate:
+            g.profiler = cProfile.Profile()
+            g.profiler.enable()
+
+    def _after_request(self, response):
+        timing = g.pop('timing', None)
+        if timing is None:
+            return response
+        elapsed = time.perf_counter() - timing['started']
+
+        profiler = g.pop('profiler', None)
+        if profiler is not None:
+            profiler.disable()
+            if elapsed * 1000 >= self.slow_ms:
+                self._dump_profile(profiler, elapsed)
+
+        response.headers.add(
+            'Server-Timing',
+            f'app;dur={elapsed * 1000:.2f}, '
+            f'db;dur={timing["sql_time"] * 1000:.2f};desc="{timing["sql_count"]} queries", '
+            f'json;dur={timing["json_time"] * 1000:.2f}'
+        )
+
+        route = request.url_rule.rule if request.url_rule else 'unmatched'
+        self._observe(request.method, route, response.status_code, elapsed,
+                      timing['sql_count'], timing['sql_time'])
+        return response
+
+    def _dump_profile(self, profiler, elapsed):
+        os.makedirs(self.profile_dir, exist_ok=True)
+        route = re.sub(r'[^A-Za-z0-9]+', '_', request.path).strip('_') or 'root'
+        filename = f"{time.strftime('%Y%m%d-%H%M%S')}-{request.method}-{route}-{int(elapsed * 1000)}ms.prof"
+        profiler.dump_stats(os.path.join(self.profile_dir, filename))
+
+    def _observe(self, method, route, status, elapsed, sql_count, sql_time):
+        with self._lock:
+            key = (method, route)
+            histogram = self._histograms.setdefault(key, [0] * (len(LATENCY_BUCKETS) + 2))
+            for index, bound in enumerate(LATENCY_BUCKETS):
+                if elapsed <= bound:
+                    histogram[index] += 1
+            histogram[-2] += elapsed
+            histogram[-1] += 1
+
+            self._requests[(method, route, status)] = self._requests.get((method, route, status), 0) + 1
+            queries = self._queries.setdefault(key, [0, 0.0])
+            queries[0] += sql_count
+            queries[1] += sql_time
+
+    def render(self):
+        """Prometheus 텍스트 형식"""
+        lines = [
+            '# HELP http_request_duration_seconds Request latency by route',
+            '# TYPE http_request_duration_seconds histogram'
+        ]
+        with self._lock:
+            for (method, route), histogram in sorted(self._histograms.items()):
+                labels = f'method="{method}",route="{route}"'
+                for index, bound in enumerate(LATENCY_BUCKETS):
+                    lines.append(f'http_request_duration_seconds_bucket{{{labels},le="{bound}"}} {histogram[index]}')
+                lines.append(f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}} {histogram[-1]}')
+                lines.append(f'http_request_duration_seconds_sum{{{labels}}} {histogram[-2]:.6f}')
+                lines.append(f'http_request_duration_seconds_count{{{labels}}} {histogram[-1]}')
+
+            lines += ['# HELP http_requests_total Requests by route and status',
+                      '# TYPE http_requests_total counter']
+            for (method, route, status), count in sorted(self._requests.items()):
+                lines.append(f'http_requests_total{{method="{method}",route="{route}",status="{status}"}} {count}')
+
+            lines += ['# HELP db_queries_total SQL statements executed by route',
+                      '# TYPE db_queries_total counter']
+            for (method, route), (count, _) in sorted(self._queries.items()):
+                lines.append(f'db_queries_total{{method="{method}",route="{route}"}} {count}')
+            lines += ['# HELP db_query_seconds_total SQL execution time by route',
+                      '# TYPE db_query_seconds_total counter']
+            for (method, route), (_, seconds) in sorted(self._queries.items()):
+                lines.append(f'db_query_seconds_total{{method="{method}",route="{route}"}} {seconds:.6f}')
+
+        # 지표(라벨 앞 이름) 마다 # TYPE 한 줄 + 표본들
+        families = {}
+        for kind, collector in self._collectors:
+            for name, value in collector().items():
+                family = name.split('{', 1)[0]
+                families.setdefault(family, (kind, []))[1].append(f'{name} {value}')
+        for family, (kind, samples) in families.items():
+            lines.append(f'# TYPE {family} {kind}')
+            lines += samples
+        return '\n'.join(lines) + '\n'
+
+    def metrics_view(self):
+        return Response(self.render(), mimetype='text/plain; version=0.0.4')
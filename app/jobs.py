@@ -0,0 +1,348 @@
+"""쓰기 뒤에 할 일을 나중에 처리하는 작업 큐 (jobs 테이블)
+
+쓰기 요청은 오래 걸리는 후속 작업을 jobs 테이블에 INSERT 만 하고 바로 응답한다. 작업
+행은 요청과 같은 트랜잭션으로 커밋되므로 롤백된 쓰기의 작업은 남지 않고,
+커밋된 쓰기의 작업은 잃어버리지 않는다.
+
+    jobs.enqueue('rebuild_stats', store_id=1)   # 같은 세션에 추가 (커밋은 호출한 쪽)
+    @jobs.task('rebuild_stats')                 # 작업 처리 함수 등록
+    def rebuild_stats(store_id): ...
+
+작업자는 대기 중(queued)이고 run_at 이 지난 행을 UPDATE ... WHERE status
+조건으로 하나씩 가져가므로(running) 스레드 / 프로세스가 여러 개여도 한
+작업은 한 번만 실행된다. 실패하면 JOBS_RETRY_BACKOFF * 2^(시도-1) 초 뒤에
+다시 실행하고, JOBS_MAX_ATTEMPTS 번 실패하면 failed 로 남긴다. 작업자가
+죽어 JOBS_LOCK_TIMEOUT 이 지난 running 행은 다른 작업자가 넘겨받는다.
+
+작업자는 같은 프로세스에서 작업 행이 커밋되면 바로 깨어난다. 큐가 비어
+있으면 확인 간격을 JOBS_POLL_INTERVAL 부터 두 배씩 JOBS_POLL_MAX_INTERVAL
+까지 늘리되, 대기 중인 작업의 run_at (재시도 / 지연 작업) 이 먼저 오면 그때
+깨어난다. 다른 프로세스(flask jobs-worker 와 웹 워커 사이) 에서 넣은 작업은
+깨울 방법이 없으므로 그 간격 안에 처리된다.
+
+설정 (app.config)
+    JOBS_EXECUTOR: 'thread' (기본, 웹 프로세스 안의 작업자 스레드, 첫 작업 때 시작)
+                   | 'external' (flask jobs-worker 프로세스만 실행)
+    JOBS_WORKERS: 작업자 스레드 수 (기본 1)
+    JOBS_POLL_INTERVAL: 빈 큐를 다시 확인하는 첫 간격 (초, 기본 1)
+    JOBS_POLL_MAX_INTERVAL: 큐가 계속 비어 있을 때 늘어나는 확인 간격의 상한 (초, 기본 30)
+    JOBS_MAX_ATTEMPTS: 최대 시도 횟수 (기본 5)
+    JOBS_RETRY_BACKOFF: 첫 재시도까지 대기 (초, 기본 2)
+    JOBS_LOCK_TIMEOUT: running 행을 죽은 작업으로 볼 시간 (초, 기본 300)
+    JOBS_TTL: 끝난(done / failed) 작업 보관 시간 (초, 기본 604800)
+
+    flask jobs-worker [--workers N] [--once]   별도 작업자 프로세스
+    flask purge-jobs                           보관 시간이 지난 작업 삭제
+"""
+from datetime import datetime, timedelta, timezone
+import atexit
+import json
+import threading
+import time
+
+import click
+from flask import current_app
+from flask.cli import with_appcontext
+from sqlalchemy import and_, delete, event, func, or_, select, update
+
+from .changes import changed_tables, track_changes
+
+EXECUTOR_MODES = ('thread', 'external')
+QUEUED, RUNNING, DONE, FAILED = 'queued', 'running', 'done', 'failed'
+MAX_ERROR_LENGTH = 1000
+
+
+def _utcnow():
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class JobQueue:
+    """jobs 테이블 기반 작업 큐 + 작업자"""
+
+    def __init__(self):
+        self.session = None
+        self.model = None
+        self.mode = 'thread'
+        self.workers = 1
+        self.poll_interval = 1.0
+        self.max_poll_interval = 30.0
+        self.max_attempts = 5
+        self.backoff = 2
+        self.lock_timeout = 300
+        self.ttl = 604800
+        self._tasks = {}
+        self._threads = []
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._stats = {"enqueued": 0, "completed": 0, "failed": 0, "retried": 0, "total_latency": 0.0}
+        # 인터프리터 종료 시 실행 중인 작업을 마치고 멈춤 (못 마치면 LOCK_TIMEOUT 뒤 재시도)
+        atexit.register(self.shutdown)
+
+    def watch(self, session, model):
+        """model: (id, name, payload, status, attempts, max_attempts, run_at, locked_until,
+        last_error, result, created_at, finished_at) 컬럼을 가진 모델
+
+        작업 행이 커밋되면 작업자를 깨운다 (thread 모드면 이때 처음 시작).
+        """
+        self.session = session
+        self.model = model
+        track_changes(session)
+
+        @event.listens_for(session, 'after_commit')
+        def after_commit(sess):
+            if model.__tablename__ in changed_tables(sess):
+                if self.mode == 'thread' and not self._threads:
+                    self.start(current_app._get_current_object())
+                self._wake.set()
+
+    def init_app(self, app):
+        self.mode = app.config.get('JOBS_EXECUTOR', 'thread')
+        if self.mode not in EXECUTOR_MODES:
+            raise ValueError(f"알 수 없는 작업 실행기입니다: {self.mode}")
+        self.workers = app.config.get('JOBS_WORKERS', 1)
+        self.poll_interval = app.config.get('JOBS_POLL_INTERVAL', 1.0)
+        self.max_poll_interval = max(self.poll_interval, app.config.get('JOBS_POLL_MAX_INTERVAL', 30.0))
+        self.max_attempts = app.config.get('JOBS_MAX_ATTEMPTS', 5)
+        self.backoff = app.config.get('JOBS_RETRY_BACKOFF', 2)
+        self.lock_timeout = app.config.get('JOBS_LOCK_TIMEOUT', 300)
+        self.ttl = app.config.get('JOBS_TTL', 604800)
+        app.cli.add_command(worker_command)
+        app.cli.add_command(purge_command)
+        app.extensions['jobs'] = self
+
+    def task(self, name):
+        """name 작업을 처리할 함수 등록 (payload 를 키워드 인자로 받고, 반환값은 JSON 으로 저장)"""
+        def decorator(fn):
+            self._tasks[name] = fn
+            return fn
+        return decorator
+
+    def enqueue(self, name, delay=0, dedupe=False, **payload):
+        """작업 행을 현재 세션에 추가하고 반환 (커밋은 호출한 쪽)
+
+        dedupe: 같은 이름 / payload 로 아직 대기 중인 작업이 있으면 새로 넣지 않고
+                그 작업을 반환 (쓰기가 몰릴 때 같은 후속 작업을 한 번으로 합침)
+        """
+        if name not in self._tasks:
+            raise ValueError(f"등록되지 않은 작업입니다: {name}")
+        body = json.dumps(payload, sort_keys=True, ensure_ascii=False)
+        if dedupe:
+            job = self.session.query(self.model).filter_by(
+                name=name, payload=body, status=QUEUED
+            ).first()
+            if job is not None:
+                return job
+
+        now = _utcnow()
+        job = self.model(name=name, payload=body, status=QUEUED, attempts=0,
+                         max_attempts=self.max_attempts,
+                         run_at=now + timedelta(seconds=delay), created_at=now)
+        self.session.add(job)
+        with self._lock:
+            self._stats["enqueued"] += 1
+        return job
+
+    def get(self, job_id):
+        """작업 상태 조회 (없으면 None)"""
+        job = self.session.get(self.model, job_id)
+        if job is None:
+            return None
+        return {
+            "id": job.id,
+            "name": job.name,
+            "status": job.status,
+            "attempts": job.attempts,
+            "max_attempts": job.max_attempts,
+            "run_at": job.run_at.isoformat(),
+            "created_at": job.created_at.isoformat(),
+            "finished_at": job.finished_at.isoformat() if job.finished_at else None,
+            "last_error": job.last_error,
+            "result": json.loads(job.result) if job.result is not None else None
+        }
+
+    def _claim(self):
+        """실행할 작업 하나를 running 으로 바꾸고 반환 (없으면 None)"""
+        t = self.model.__table__
+        while True:
+            now = _utcnow()
+            ready = or_(
+                and_(t.c.status == QUEUED, t.c.run_at <= now),
+                and_(t.c.status == RUNNING, t.c.locked_until < now)
+            )
+            job_id = self.session.scalar(select(t.c.id).where(ready).order_by(t.c.run_at).limit(1))
+            if job_id is None:
+                self.session.commit()
+                return None
+            # 다른 작업자가 먼저 가져갔으면 rowcount 0 → 다음 후보
+            claimed = self.session.execute(update(t).where(t.c.id == job_id, ready).values(
+                status=RUNNING, attempts=t.c.attempts + 1,
+                locked_until=now + timedelta(seconds=self.lock_timeout)
+            )).rowcount
+            self.session.commit()
+            if claimed:
+                return self.session.execute(select(t).where(t.c.id == job_id)).first()
+
+    def _finish(self, job_id, **values):
+        t = self.model.__table__
+        self.session.execute(update(t).where(t.c.id == job_id).values(locked_until=None, **values))
+        self.session.commit()
+
+    def run_one(self):
+        """작업 하나를 가져와 실행, 실행했으면 True"""
+        job = self._claim()
+        if job is None:
+            return False
+
+        started = time.perf_counter()
+        fn = self._tasks.get(job.name)
+        try:
+            if job.attempts > job.max_attempts:
+                raise RuntimeError("작업 시간이 초과되었습니다")
+            if fn is None:
+                raise LookupError(f"등록되지 않은 작업입니다: {job.name}")
+            result = fn(**json.loads(job.payload))
+        except Exception as e:
+            self.session.rollback()
+            error = f"{type(e).__name__}: {e}"[:MAX_ERROR_LENGTH]
+            if fn is not None and job.attempts < job.max_attempts:
+                delay = self.backoff * 2 ** (job.attempts - 1)
+                self._finish(job.id, status=QUEUED, last_error=error,
+                             run_at=_utcnow() + timedelta(seconds=delay))
+                outcome = "retried"
+            else:
+                self._finish(job.id, status=FAILED, last_error=error, finished_at=_utcnow())
+                outcome = "failed"
+        else:
+            self._finish(job.id, status=DONE, finished_at=_utcnow(),
+                         result=json.dumps(result, ensure_ascii=False, default=str))
+            outcome = "completed"
+
+        with self._lock:
+            self._stats[outcome] += 1
+            self._stats["total_latency"] += time.perf_counter() - started
+        return True
+
+    def run_pending(self):
+        """지금 실행할 수 있는 작업을 모두 실행하고 실행한 개수 반환"""
+        count = 0
+        while self.run_one():
+            count += 1
+        return count
+
+    def _idle_wait(self, interval):
+        """빈 큐에서 기다릴 초: interval 과 다음 대기 작업의 run_at 중 이른 쪽"""
+        t = self.model.__table__
+        next_run_at = self.session.scalar(select(func.min(t.c.run_at)).where(t.c.status == QUEUED))
+        self.session.commit()
+        if next_run_at is None:
+            return interval
+        return max(0.0, min(interval, (next_run_at - _utcnow()).total_seconds()))
+
+    def _loop(self, app):
+        with app.app_context():
+            interval = self.poll_interval
+            while not self._stop.is_set():
+                self._wake.clear()
+                try:
+                    if self.run_one():
+                        interval = self.poll_interval
+                        continue
+                    wait = self._idle_wait(interval)
+                except Exception as e:   # DB 잠김 등: 잠시 쉬고 다시
+                    self.session.rollback()
+                    app.logger.warning(f"작업자 오류: {e}")
+                    wait = interval
+                # 커밋으로 깨면 처음 간격부터, 아니면 빈 큐 확인 간격을 두 배로
+                if self._wake.wait(wait):
+                    interval = self.poll_interval
+                else:
+                    interval = min(interval * 2, self.max_poll_interval)
+            self.session.remove()
+
+    def start(self, app, workers=None):
+        """작업자 스레드 시작"""
+        with self._lock:
+            if self._threads:
+                return self._threads
+            self._stop.clear()
+            self._threads = [
+                threading.Thread(target=self._loop, args=(app,), name=f'job-worker-{i}', daemon=True)
+                for i in range(workers or self.workers)
+            ]
+            for thread in self._threads:
+                thread.start()
+            return self._threads
+
+    def shutdown(self, timeout=5):
+        """작업자 스레드 종료 (실행 중인 작업은 끝날 때까지 기다림)"""
+        with self._lock:
+            threads, self._threads = self._threads, []
+        self._stop.set()
+        self._wake.set()
+        for thread in threads:
+            thread.join(timeout)
+
+    def stats(self):
+        """이 프로세스의 작업자 지표"""
+        with self._lock:
+            finished = self._stats["completed"] + self._stats["failed"] + self._stats["retried"]
+            return {
+                "executor": self.mode,
+                "workers": len(self._threads),
+                "enqueued": self._stats["enqueued"],
+                "completed": self._stats["completed"],
+                "failed": self._stats["failed"],
+                "retried": self._stats["retried"],
+                "avg_latency_ms": round(self._stats["total_latency"] / finished * 1000, 2) if finished else 0.0
+            }
+
+    def queue_stats(self):
+        """상태별 작업 수와 가장 오래 기다린 대기 작업의 지연 (모든 작업자 공통, DB 조회)"""
+        t = self.model.__table__
+        counts = dict(self.session.execute(select(t.c.status, func.count()).group_by(t.c.status)).all())
+        oldest = self.session.scalar(
+            select(func.min(t.c.run_at)).where(t.c.status == QUEUED, t.c.run_at <= _utcnow())
+        )
+        return {
+            **{status: counts.get(status, 0) for status in (QUEUED, RUNNING, DONE, FAILED)},
+            "oldest_queued_seconds": round((_utcnow() - oldest).total_seconds(), 3) if oldest else 0.0
+        }
+
+    def purge(self):
+        """보관 시간이 지난 done / failed 작업 삭제, 지운 행 수 반환"""
+        t = self.model.__table__
+        result = self.session.execute(delete(t).where(
+            t.c.status.in_((DONE, FAILED)),
+            t.c.finished_at < _utcnow() - timedelta(seconds=self.ttl)
+        ))
+        self.session.commit()
+        return result.rowcount
+
+
+@click.command('jobs-worker')
+@click.option('--workers', type=int, default=None, help='작업자 스레드 수 (기본 JOBS_WORKERS)')
+@click.option('--once', is_flag=True, help='지금 실행할 수 있는 작업만 처리하고 종료')
+@with_appcontext
+def worker_command(workers, once):
+    """작업 큐 작업자 실행 (Ctrl+C 로 종료)"""
+    queue = current_app.extensions['jobs']
+    if once:
+        click.echo(f"{queue.run_pending()}개의 작업을 실행했습니다")
+        return
+
+    queue.start(current_app._get_current_object(), workers)
+    click.echo(f"작업자 {len(queue._threads)}개 실행 중")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        queue.shutdown()
+
+
+@click.command('purge-jobs')
+@with_appcontext
+def purge_command():
+    """보관 시간이 지난 작업 삭제"""
+    deleted = current_app.extensions['jobs'].purge()
+    click.echo(f"{deleted}개의 작업을 삭제했습니다")
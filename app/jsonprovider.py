@@ -0,0 +1,67 @@
+"""빠른 JSON 직렬화 (orjson 이 설치돼 있으면 사용)
+
+설정 (app.config)
+    JSON_BACKEND: 'auto' | 'orjson' | 'std' (기본 'auto')
+        auto:   orjson 을 import 할 수 있으면 사용, 없으면 Flask 기본
+        orjson: orjson 사용 (없으면 시작 시 오류)
+        std:    Flask 기본 (표준 json 모듈)
+
+orjson 은 비ASCII 문자를 \\uXXXX 로 바꾸지 않고 UTF-8 그대로 내보낸다.
+키 정렬, 들여쓰기(디버그 모드), 날짜 형식(HTTP date) 은 Flask 기본과 같다.
+"""
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:     # 선택 의존성
+    orjson = None
+
+# Flask 기본 응답이 넘기는 간결 출력 구분자 (orjson 은 원래 간결 출력)
+_COMPACT_SEPARATORS = (",", ":")
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """orjson 기반 JSON 공급자
+
+    orjson 이 표현할 수 없는 옵션(indent=4, ensure_ascii 등)이 넘어오면
+    Flask 기본 구현으로 처리한다.
+    """
+
+    def _option(self):
+        # datetime 은 default 로 넘겨서 Flask 기본과 같은 HTTP date 형식 유지
+        option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return option
+
+    def dumps(self, obj, **kwargs):
+        indent = kwargs.get('indent')
+        separators = tuple(kwargs.get('separators', _COMPACT_SEPARATORS))
+        if indent not in (None, 2) or separators != _COMPACT_SEPARATORS \
+                or set(kwargs) - {'indent', 'separators'}:
+            return super().dumps(obj, **kwargs)
+
+        option = self._option()
+        if indent == 2:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+
+    def loads(self, s, **kwargs):
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+
+def init_app(app):
+    """JSON_BACKEND 설정에 맞춰 app.json 교체"""
+    backend = app.config.get('JSON_BACKEND', 'auto')
+    if backend not in ('auto', 'orjson', 'std'):
+        raise ValueError(f"알 수 없는 JSON_BACKEND: {backend}")
+    if backend == 'std':
+        return
+
+    if orjson is None:
+        if backend == 'orjson':
+            raise RuntimeError("JSON_BACKEND='orjson' 을 쓰려면 orjson 패키지가 필요합니다")
+        return
+    app.json = OrjsonProvider(app)
@@ -0,0 +1,238 @@
+"""비싼 API 의 요청 한도 (rate limit) 와 동시 실행 한도 (admission control)
+
+@limits.limit(name) 을 붙인 라우트는 두 단계를 거친다. @idempotency.idempotent 와
+함께 쓸 때는 그 안쪽에 붙여서 재시도 응답이 토큰을 쓰지 않게 한다.
+
+    1) 토큰 버킷: 클라이언트(REMOTE_ADDR) x 라우트 이름마다 버킷 하나.
+       요청마다 RATELIMIT_COSTS[name] 토큰을 쓰고, 모자라면 429 + Retry-After
+    2) 동시 실행 한도: ADMISSION_LIMITS[name] = (동시 실행 수, 대기열 길이).
+       실행 중인 요청이 한도면 대기열에서 ADMISSION_QUEUE_TIMEOUT 초까지
+       기다리고, 대기열도 차 있거나 시간이 지나면 바로 503 + Retry-After
+
+과부하 때 요청이 스레드 / 해시 풀 앞에 끝없이 쌓여 모든 클라이언트의 꼬리
+지연시간이 늘어나는 대신, 넘치는 요청을 빨리 거절한다. 스트리밍 응답
+(내보내기) 은 본문을 다 보낼 때까지 자리를 차지한다.
+
+버킷 백엔드
+    memory: 프로세스 내 토큰 버킷 (기본, 워커 프로세스마다 따로)
+    redis:  Redis 호환 클라이언트 (incr / expire 만 사용). 워커끼리 공유하며
+            용량 / 보충 속도 만큼의 고정 창 카운터로 근사한다
+    null:   요청 한도 없음 (동시 실행 한도는 그대로)
+
+프록시 뒤에서는 REMOTE_ADDR 가 프록시 주소이므로 ProxyFix 등으로 실제
+클라이언트 주소를 넣어야 클라이언트별 한도가 된다.
+
+설정 (app.config)
+    RATELIMIT_BACKEND: 'memory' | 'redis' | 'null'
+    RATELIMIT_CAPACITY: 버킷 크기 (토큰, 기본 60)
+    RATELIMIT_REFILL_RATE: 초당 보충 토큰 (기본 2)
+    RATELIMIT_COSTS: {라우트 이름: 요청 한 번의 토큰} (없으면 1)
+    RATELIMIT_MAXSIZE: memory 백엔드가 기억할 버킷 수 (기본 10000)
+    RATELIMIT_REDIS_URL: redis 백엔드 접속 주소
+    RATELIMIT_REDIS_CLIENT: redis 대신 쓸 호환 클라이언트 객체 (테스트용)
+    ADMISSION_LIMITS: {라우트 이름: (동시 실행 수, 대기열 길이)}
+    ADMISSION_QUEUE_TIMEOUT: 대기열에서 기다리는 최대 시간 (초, 기본 2)
+"""
+from collections import OrderedDict
+from functools import wraps
+import math
+import threading
+import time
+
+from flask import jsonify, request
+from werkzeug.wrappers import Response
+
+RATE_LIMITED = "요청이 너무 많습니다. 잠시 후 다시 시도해주세요"
+OVERLOADED = "서버가 바쁩니다. 잠시 후 다시 시도해주세요"
+
+
+class NullBuckets:
+    """요청 한도 없음"""
+
+    def take(self, key, cost):
+        return 0
+
+
+class MemoryBuckets:
+    """프로세스 내 토큰 버킷 (오래 안 쓴 버킷부터 잊음, 잊힌 버킷은 가득 찬 상태로 다시 시작)"""
+
+    def __init__(self, capacity=60, rate=2.0, maxsize=10000):
+        self.capacity = capacity
+        self.rate = rate
+        self.maxsize = maxsize
+        self._buckets = OrderedDict()
+        self._lock = threading.Lock()
+
+    def take(self, key, cost):
+        """cost 토큰을 쓰면 0, 모자라면 다시 시도할 때까지의 초"""
+        cost = min(cost, self.capacity)
+        now = time.monotonic()
+        with self._lock:
+            tokens, stamp = self._buckets.get(key, (self.capacity, now))
+            tokens = min(self.capacity, tokens + (now - stamp) * self.rate)
+            wait = 0
+            if tokens >= cost:
+                tokens -= cost
+            else:
+                wait = (cost - tokens) / self.rate
+            self._buckets[key] = (tokens, now)
+            self._buckets.move_to_end(key)
+            while len(self._buckets) > self.maxsize:
+                self._buckets.popitem(last=False)
+            return wait
+
+
+class RedisBuckets:
+    """Redis 호환 클라이언트 백엔드 (capacity / rate 초 고정 창마다 capacity 토큰)"""
+
+    def __init__(self, client, capacity=60, rate=2.0, prefix='bungeoppang:'):
+        self.client = client
+        self.capacity = capacity
+        self.window = capacity / rate
+        self.prefix = prefix
+
+    def take(self, key, cost):
+        now = time.time()
+        slot = int(now // self.window)
+        name = f"{self.prefix}ratelimit:{key}:{slot}"
+        used = self.client.incr(name, min(cost, self.capacity))
+        if used == min(cost, self.capacity):
+            self.client.expire(name, math.ceil(self.window) + 1)
+        if used > self.capacity:
+            return (slot + 1) * self.window - now
+        return 0
+
+
+class Gate:
+    """동시 실행 수 limit + 대기열 queue 의 입장 제어"""
+
+    def __init__(self, limit, queue=0, timeout=2.0):
+        self.limit = limit
+        self.queue = queue
+        self.timeout = timeout
+        self.running = 0
+        self.waiting = 0
+        self._cond = threading.Condition()
+
+    def enter(self, wait=True):
+        """자리를 잡으면 True. 대기열이 차 있거나 timeout 이 지나면 False"""
+        with self._cond:
+            if self.running < self.limit and not self.waiting:
+                self.running += 1
+                return True
+            if not wait or self.waiting >= self.queue:
+                return False
+            self.waiting += 1
+            try:
+                admitted = self._cond.wait_for(lambda: self.running < self.limit, self.timeout)
+            finally:
+                self.waiting -= 1
+            if admitted:
+                self.running += 1
+            return admitted
+
+    def leave(self):
+        with self._cond:
+            self.running -= 1
+            self._cond.notify()
+
+    def stats(self):
+        """running / waiting 을 같은 잠금 아래에서 읽은 스냅샷"""
+        with self._cond:
+            return {"limit": self.limit, "running": self.running,
+                    "queue": self.queue, "waiting": self.waiting}
+
+
+class Limits:
+    """라우트별 요청 한도 + 동시 실행 한도 + 거절 카운터"""
+
+    def __init__(self):
+        self.buckets = NullBuckets()
+        self.costs = {}
+        self.gates = {}
+        self._lock = threading.Lock()
+        self._limited = 0
+        self._shed = 0
+
+    def init_app(self, app):
+        backend = app.config.get('RATELIMIT_BACKEND', 'memory')
+        capacity = app.config.get('RATELIMIT_CAPACITY', 60)
+        rate = app.config.get('RATELIMIT_REFILL_RATE', 2.0)
+
+        if backend == 'memory':
+            self.buckets = MemoryBuckets(capacity, rate, app.config.get('RATELIMIT_MAXSIZE', 10000))
+        elif backend == 'redis':
+            client = app.config.get('RATELIMIT_REDIS_CLIENT')
+            if client is None:
+                try:
+                    import redis
+                except ImportError:
+                    raise RuntimeError("RATELIMIT_BACKEND='redis' 를 쓰려면 redis 패키지가 필요합니다")
+                client = redis.Redis.from_url(app.config['RATELIMIT_REDIS_URL'])
+            self.buckets = RedisBuckets(client, capacity, rate)
+        elif backend == 'null':
+            self.buckets = NullBuckets()
+        else:
+            raise ValueError(f"알 수 없는 요청 한도 백엔드입니다: {backend}")
+
+        self.costs = dict(app.config.get('RATELIMIT_COSTS') or {})
+        timeout = app.config.get('ADMISSION_QUEUE_TIMEOUT', 2.0)
+        self.gates = {
+            name: Gate(limit, queue, timeout)
+            for name, (limit, queue) in (app.config.get('ADMISSION_LIMITS') or {}).items()
+        }
+        app.extensions['limits'] = self
+
+    def acquire(self, name, client, wait=True):
+        """통과하면 None (동시 실행 자리를 잡음, 끝나면 release), 거절이면 (payload, status, headers)"""
+        retry_after = self.buckets.take(f"{name}:{client}", self.costs.get(name, 1))
+        if retry_after:
+            with self._lock:
+                self._limited += 1
+            return {"error": RATE_LIMITED}, 429, {"Retry-After": str(math.ceil(retry_after))}
+
+        gate = self.gates.get(name)
+        if gate is not None and not gate.enter(wait):
+            with self._lock:
+                self._shed += 1
+            return {"error": OVERLOADED}, 503, {"Retry-After": "1"}
+        return None
+
+    def release(self, name):
+        gate = self.gates.get(name)
+        if gate is not None:
+            gate.leave()
+
+    def limit(self, name):
+        """라우트에 요청 한도 / 동시 실행 한도 적용 (name: 설정의 라우트 이름)"""
+        def decorator(view):
+            @wraps(view)
+            def wrapper(*args, **kwargs):
+                rejected = self.acquire(name, request.remote_addr)
+                if rejected is not None:
+                    payload, status, headers = rejected
+                    return jsonify(payload), status, headers
+
+                streaming = False
+                try:
+                    rv = view(*args, **kwargs)
+                    # 스트리밍 응답은 본문을 다 보낸 뒤 (close) 자리를 돌려줌
+                    if isinstance(rv, Response) and rv.is_streamed:
+                        rv.call_on_close(lambda: self.release(name))
+                        streaming = True
+                    return rv
+                finally:
+                    if not streaming:
+                        self.release(name)
+            return wrapper
+        return decorator
+
+    def stats(self):
+        with self._lock:
+            limited, shed = self._limited, self._shed
+        return {
+            "backend": type(self.buckets).__name__,
+            "rate_limited": limited,
+            "shed": shed,
+            "routes": {name: gate.stats() for name, gate in self.gates.items()}
+        }
@@ -1,5 +1,9 @@
 from datetime import datetime
-from . import db
+from . import db, cache, versions, idempotency, jobs
+from .archive import archive_table
+from .codes import install_sequence_row
+from .search import install_search_index
+from .stats import install_store_stats
 from enum import Enum
 
 # Enum 정의
@@ -14,6 +18,12 @@ class PositionEnum(Enum):
 # User 모델
 class User(db.Model):
     __tablename__ = 'users'
+    __table_args__ = (
+        # 활성 사용자 목록 (keyset 페이지) - 지원하는 DB 에서는 부분 인덱스
+        db.Index('ix_users_active_id', 'id',
+                 sqlite_where=db.text('is_active = 1'),
+                 postgresql_where=db.text('is_active')),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     first_name = db.Column(db.String(50))
@@ -25,6 +35,7 @@ class User(db.Model):
     gender = db.Column(db.Enum(GenderEnum), nullable=False)
     is_active = db.Column(db.Boolean, nullable=False, default=True)
     is_staff = db.Column(db.Boolean, nullable=False, default=False)
+    deactivated_at = db.Column(db.DateTime)     # 비활성화 시각 (보관 기준)
     
     # 관계 설정
     employees = db.relationship('Employee', back_populates='user')
@@ -35,12 +46,19 @@ class User(db.Model):
 # Store 모델
 class Store(db.Model):
     __tablename__ = 'stores'
+    __table_args__ = (
+        # 활성 가게 목록 (keyset 페이지) - 지원하는 DB 에서는 부분 인덱스
+        db.Index('ix_stores_active_id', 'id',
+                 sqlite_where=db.text('is_active = 1'),
+                 postgresql_where=db.text('is_active')),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(50), nullable=False)
     address = db.Column(db.String(255))
     contact = db.Column(db.String(50))
     is_active = db.Column(db.Boolean, nullable=False, default=True)
+    deactivated_at = db.Column(db.DateTime)     # 비활성화 시각 (보관 기준)
     
     # 관계 설정
     employees = db.relationship('Employee', back_populates='store')
@@ -51,6 +69,17 @@ class Store(db.Model):
 # Employee 모델
 class Employee(db.Model):
     __tablename__ = 'employees'
+    __table_args__ = (
+        # 가게별 직원 조회 / 사용자별 직원 조회 (JOIN 키)
+        db.Index('ix_employees_store_id_is_active', 'store_id', 'is_active'),
+        db.Index('ix_employees_user_id', 'user_id'),
+        # 한 사용자는 한 가게에 한 번만 등록 (POS 재시도 중복 방지)
+        db.Index('uq_employees_user_id_store_id', 'user_id', 'store_id', unique=True),
+        # 활성 직원 목록 (keyset 페이지) - 지원하는 DB 에서는 부분 인덱스
+        db.Index('ix_employees_active_id', 'id',
+                 sqlite_where=db.text('is_active = 1'),
+                 postgresql_where=db.text('is_active')),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     code = db.Column(db.Integer, unique=True, nullable=False)
@@ -61,9 +90,94 @@ class Employee(db.Model):
     user_id = db.Column(db.Integer, db.ForeignKey('users.id', ondelete='CASCADE'), nullable=False)
     store_id = db.Column(db.Integer, db.ForeignKey('stores.id', ondelete='CASCADE'), nullable=False)
     
+    deactivated_at = db.Column(db.DateTime)     # 비활성화 시각 (보관 기준)
+    
     # 관계 설정
     user = db.relationship('User', back_populates='employees')
     store = db.relationship('Store', back_populates='employees')
     
     def __repr__(self):
         return f'<Employee {self.code}>'
+
+# 오래된 비활성 행 보관 테이블 (flask archive-inactive)
+users_archive = archive_table(User.__table__)
+stores_archive = archive_table(Store.__table__)
+employees_archive = archive_table(Employee.__table__)
+
+# 가게별 직급 인원 집계 (employees 트리거가 같은 트랜잭션에서 갱신)
+class StoreStat(db.Model):
+    __tablename__ = 'store_stats'
+    
+    store_id = db.Column(db.Integer, db.ForeignKey('stores.id', ondelete='CASCADE'), primary_key=True)
+    position = db.Column(db.Enum(PositionEnum), primary_key=True)
+    headcount = db.Column(db.Integer, nullable=False, default=0)
+
+install_store_stats(db.metadata)
+
+# 사용자 / 직원 검색 색인 (SQLite: FTS5 + 동기화 트리거, PostgreSQL: 접두어 인덱스)
+install_search_index(db.metadata)
+
+# 직원번호 발급 카운터 (단일 행)
+class EmployeeCodeSequence(db.Model):
+    __tablename__ = 'employee_code_sequence'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    next_value = db.Column(db.Integer, nullable=False, default=0)
+
+install_sequence_row(EmployeeCodeSequence.__table__)
+
+# 테이블별 변경 버전 (목록 API ETag 용)
+class TableVersion(db.Model):
+    __tablename__ = 'table_versions'
+    
+    table_name = db.Column(db.String(50), primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, nullable=False)
+
+versions.watch(db.session, TableVersion, ('users', 'stores', 'employees', 'store_stats'))
+
+# Idempotency-Key 별 첫 응답 (쓰기 API 재시도용)
+class IdempotencyKey(db.Model):
+    __tablename__ = 'idempotency_keys'
+    
+    key = db.Column(db.String(255), primary_key=True)
+    path = db.Column(db.String(255), primary_key=True)
+    fingerprint = db.Column(db.String(64), nullable=False)
+    status_code = db.Column(db.Integer)      # NULL 이면 처리 중
+    response = db.Column(db.Text)
+    created_at = db.Column(db.DateTime, nullable=False, index=True)
+
+idempotency.watch(db.session, IdempotencyKey)
+
+# 쓰기 뒤에 처리할 작업 (jobs.enqueue 로 요청과 같은 트랜잭션에 추가)
+class Job(db.Model):
+    __tablename__ = 'jobs'
+    __table_args__ = (
+        # 작업자가 실행할 작업을 고르는 조건 (status, run_at 순)
+        db.Index('ix_jobs_status_run_at', 'status', 'run_at'),
+    )
+    
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(100), nullable=False)
+    payload = db.Column(db.Text, nullable=False)          # JSON 키워드 인자
+    status = db.Column(db.String(20), nullable=False)     # queued | running | done | failed
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    max_attempts = db.Column(db.Integer, nullable=False)
+    run_at = db.Column(db.DateTime, nullable=False)
+    locked_until = db.Column(db.DateTime)                 # running 행을 넘겨받을 수 있는 시각
+    last_error = db.Column(db.Text)
+    result = db.Column(db.Text)                           # JSON 반환값
+    created_at = db.Column(db.DateTime, nullable=False)
+    finished_at = db.Column(db.DateTime)
+
+jobs.watch(db.session, Job)
+
+# 캐시 무효화 대상: {변경된 테이블: (무효화할 캐시 namespace, ...)}
+CACHE_DEPENDENCIES = {
+    'users': ('user', 'users', 'employees'),
+    'stores': ('store', 'stores', 'employees'),
+    'employees': ('employees',),
+    'store_stats': ('employees',)
+}
+
+cache.watch(db.session, CACHE_DEPENDENCIES)
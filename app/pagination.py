@@ -0,0 +1,122 @@
+"""목록 API 공통 커서(keyset) 페이지네이션 / 필드 선택 도우미"""
+
+DEFAULT_LIMIT = 100
+MAX_LIMIT = 1000
+
+
+def parse_page_args(args):
+    """?after=<id>&limit=N 파싱 (잘못된 값이면 ValueError)"""
+    after = args.get('after')
+    limit = args.get('limit')
+
+    try:
+        after = int(after) if after not in (None, '') else None
+        limit = int(limit) if limit not in (None, '') else DEFAULT_LIMIT
+    except ValueError:
+        raise ValueError("after, limit 은 정수여야 합니다")
+
+    if limit < 1:
+        raise ValueError("limit 은 1 이상이어야 합니다")
+    return after, min(limit, MAX_LIMIT)
+
+
+def parse_fields(args, spec, default):
+    """?fields=a,b,c 파싱 (spec 에 없는 필드면 ValueError)"""
+    raw = args.get('fields')
+    if not raw:
+        return list(default)
+
+    fields = [f.strip() for f in raw.split(',') if f.strip()]
+    unknown = [f for f in fields if f not in spec]
+    if unknown:
+        raise ValueError(f"알 수 없는 필드입니다: {', '.join(unknown)}")
+    return fields
+
+
+def raw(value):
+    """컬럼 값을 그대로 내보내는 포맷 함수"""
+    return value
+
+
+def project(spec, fields, id_column):
+    """필드 목록을 (SELECT 할 컬럼 목록, row -> dict 변환 함수) 로 바꾼다
+
+    spec 은 {필드명: ((컬럼, ...), 포맷 함수)} 형태이고, 포맷 함수는
+    해당 컬럼 값들을 순서대로 인자로 받는다.
+    id 는 커서 계산을 위해 항상 첫 번째 컬럼으로 조회한다.
+
+    변환 함수는 Core 결과 행(튜플)을 인덱스로 바로 읽는다. 포맷이 raw 인
+    단일 컬럼 필드는 함수 호출 없이 값을 복사하고, 여러 컬럼 필드만 슬라이스한다.
+    """
+    columns = [id_column]
+    plain = []      # (필드명, 인덱스)
+    single = []     # (필드명, 인덱스, 포맷)
+    multi = []      # (필드명, 시작, 끝, 포맷)
+    for name in fields:
+        cols, fmt = spec[name]
+        start = len(columns)
+        if len(cols) > 1:
+            multi.append((name, start, start + len(cols), fmt))
+        elif fmt is raw:
+            plain.append((name, start))
+        else:
+            single.append((name, start, fmt))
+        columns.extend(cols)
+
+    def to_dict(row):
+        item = {name: row[index] for name, index in plain}
+        for name, index, fmt in single:
+            item[name] = fmt(row[index])
+        for name, start, end, fmt in multi:
+            item[name] = fmt(*row[start:end])
+        return item
+
+    return columns, to_dict
+
+
+def _page(rows, limit, to_dict):
+    """limit + 1 개 읽은 행을 (dict 목록, next_cursor) 로"""
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    next_cursor = rows[-1][0] if has_more else None
+    return [to_dict(row) for row in rows], next_cursor
+
+
+def keyset_page(query, id_column, spec, fields, after=None, limit=DEFAULT_LIMIT):
+    """요청한 필드의 컬럼만 SELECT 해서 id 기준으로 한 페이지를 가져온다
+
+    반환값: (dict 목록, next_cursor)
+    """
+    columns, to_dict = project(spec, fields, id_column)
+
+    query = query.with_entities(*columns)
+    if after is not None:
+        query = query.filter(id_column > after)
+
+    # limit + 1 개를 읽어서 다음 페이지 존재 여부 판단
+    # (ORM 결과 처리 없이 Connection 에서 바로 행 튜플을 받음, clause 를 넘겨야 복제본으로 감)
+    statement = query.order_by(id_column).limit(limit + 1).statement
+    rows = query.session.connection(bind_arguments={"clause": statement}).execute(statement).all()
+    return _page(rows, limit, to_dict)
+
+
+async def keyset_page_async(connection, statement, id_column, spec, fields, after=None, limit=DEFAULT_LIMIT):
+    """keyset_page 의 비동기 버전
+
+    statement: FROM / JOIN / WHERE 까지 정한 select() (컬럼은 바꿔 끼움)
+    connection: AsyncConnection
+    """
+    columns, to_dict = project(spec, fields, id_column)
+
+    statement = statement.with_only_columns(*columns)
+    if after is not None:
+        statement = statement.where(id_column > after)
+
+    result = await connection.execute(statement.order_by(id_column).limit(limit + 1))
+    return _page(result.all(), limit, to_dict)
+
+
+def spec_tables(spec, fields):
+    """선택한 필드가 참조하는 테이블 집합 (필요한 JOIN 만 하기 위해 사용)"""
+    return {col.table for name in fields for col in spec[name][0]}
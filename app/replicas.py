@@ -0,0 +1,131 @@
+"""읽기 전용 복제본으로 목록 / 검색 / 내보내기 조회 보내기
+
+SQLALCHEMY_REPLICA_URIS 의 주소마다 Flask-SQLAlchemy bind (replica_0,
+replica_1 ...) 를 만들고, @replicas.reads 를 붙인 GET 라우트의 SELECT 는
+요청마다 고른 복제본 하나로 보낸다. 나머지는 모두 기본(주) DB 로 간다.
+
+    flush / INSERT / UPDATE / DELETE, text() SQL: 항상 주 DB
+    같은 트랜잭션에서 이미 쓴 뒤의 SELECT: 주 DB (방금 쓴 행을 읽도록)
+
+read-your-writes: 요청에서 쓰기를 커밋하면 응답에 READ_PRIMARY_COOKIE
+(주 DB 를 읽을 만료 시각) 를 READ_YOUR_WRITES_SECONDS 동안 심는다. 그
+쿠키를 보내는 클라이언트의 읽기는 만료 전까지 주 DB 에서 처리하므로
+복제 지연이 있어도 자기가 쓴 내용은 바로 보인다. 다른 클라이언트는 지연
+만큼 늦게 볼 수 있다. 읽기 캐시 키에는 읽은 bind (복제본 키 또는
+'primary') 가 들어가므로 (cache.key_scope), 복제본에서 읽어 캐시한 응답이
+주 DB 를 읽는 클라이언트에게 나가지 않는다.
+
+로컬에서는 같은 SQLite 파일을 복제본 주소로 주면 query_only 연결 풀이
+따로 생기고 (쓰기 시도는 오류), 다른 파일을 주면 지연이 큰 복제본처럼
+동작한다.
+
+설정 (app.config)
+    SQLALCHEMY_REPLICA_URIS: 복제본 주소 목록 (환경변수 DATABASE_REPLICA_URLS, 쉼표 구분)
+    READ_YOUR_WRITES_SECONDS: 쓰기 후 주 DB 를 읽는 시간 (초, 기본 5, 0 이면 끔)
+"""
+from functools import wraps
+import random
+import threading
+import time
+
+from flask import g, has_request_context, request
+from flask_sqlalchemy.session import Session
+from sqlalchemy import Select, event
+
+from .cache import key_scope
+from .changes import changed_tables, track_changes
+from .database import REPLICA_BIND
+
+READ_PRIMARY_COOKIE = 'read_primary_until'
+# 요청이 읽을 복제본 bind 키 (stream_with_context 는 새 앱 컨텍스트 / 세션에서
+# 응답을 만들므로 세션이 아니라 요청 environ 에 둔다)
+ENVIRON_KEY = 'bungeoppang.replica'
+
+
+def _request_replica():
+    return request.environ.get(ENVIRON_KEY) if has_request_context() else None
+
+
+class RoutingSession(Session):
+    """@replicas.reads 요청 안이면 SELECT 를 그 요청의 복제본 엔진으로 보내는 세션"""
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        replica = _request_replica()
+        if (replica is not None and bind is None and not self._flushing
+                and isinstance(clause, Select) and not changed_tables(self)):
+            return self._db.engines[replica]
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+class Replicas:
+    """복제본 bind 등록 + 읽기 라우트 데코레이터 + read-your-writes 쿠키"""
+
+    def __init__(self):
+        self.bind_keys = []
+        self.window = 5
+        self._lock = threading.Lock()
+        self._watching = False
+        self._replica_reads = 0
+        self._primary_reads = 0
+
+    def init_app(self, app, db):
+        """db.init_app 전에 호출 (복제본 주소를 SQLALCHEMY_BINDS 에 추가)"""
+        uris = app.config.get('SQLALCHEMY_REPLICA_URIS') or []
+        binds = app.config.setdefault('SQLALCHEMY_BINDS', {})
+        self.bind_keys = [REPLICA_BIND.format(i) for i in range(len(uris))]
+        binds.update(zip(self.bind_keys, uris))
+        self.window = app.config.get('READ_YOUR_WRITES_SECONDS', 5)
+        if not self._watching:
+            self._watching = True
+            track_changes(db.session)
+
+            @event.listens_for(db.session, 'after_commit')
+            def after_commit(sess):
+                if changed_tables(sess) and has_request_context():
+                    g.read_primary = True
+
+        @app.after_request
+        def set_read_primary_cookie(response):
+            if g.get('read_primary') and self.bind_keys and self.window:
+                response.set_cookie(READ_PRIMARY_COOKIE, str(int(time.time() + self.window)),
+                                    max_age=self.window, httponly=True, samesite='Lax')
+            return response
+
+        app.extensions['replicas'] = self
+
+    @staticmethod
+    def read_primary(cookies):
+        """이 클라이언트가 최근에 썼으면 True (쿠키의 만료 시각 전)"""
+        try:
+            return float(cookies.get(READ_PRIMARY_COOKIE, 0)) > time.time()
+        except ValueError:
+            return False
+
+    def choose(self, cookies):
+        """이번 요청이 읽을 복제본 bind 키 (복제본이 없거나 최근에 쓴 클라이언트면 None)"""
+        if not self.bind_keys:
+            return None
+        if self.read_primary(cookies):
+            with self._lock:
+                self._primary_reads += 1
+            return None
+        with self._lock:
+            self._replica_reads += 1
+        return random.choice(self.bind_keys)
+
+    def reads(self, view):
+        """이 라우트의 SELECT 를 복제본으로 (스트리밍 응답 본문까지), 캐시 키는 bind 별로"""
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            replica = request.environ[ENVIRON_KEY] = self.choose(request.cookies)
+            with key_scope(replica or 'primary'):
+                return view(*args, **kwargs)
+        return wrapper
+
+    def stats(self):
+        with self._lock:
+            return {
+                "replicas": len(self.bind_keys),
+                "replica_reads": self._replica_reads,
+                "primary_reads": self._primary_reads
+            }
@@ -1,93 +1,384 @@
 from flask import Blueprint, request, jsonify
 from .services import (
-    create_user, create_store, register_employee,
-    get_all_users, get_all_stores, get_all_employees
+    create_user, create_users_bulk, create_store,
+    register_employee, register_employees_bulk,
+    get_all_users, get_all_stores, get_all_employees, active_employee_query, get_store_stats,
+    get_store_employees, get_user_stores, search_users, search_employees,
+    deactivate_user, reactivate_user, deactivate_store, reactivate_store,
+    deactivate_employee, reactivate_employee,
+    parse_position, parse_gender, parse_active, parse_store_id,
+    USER_FIELDS, STORE_FIELDS, EMPLOYEE_FIELDS, USER_STORE_FIELDS, STORE_STATS_FIELDS
 )
+from .models import User, Store, Employee
+from .export import stream_ndjson
+from .pagination import parse_fields, parse_page_args
+from .search import parse_terms
+from .hashing import hash_stats
+from . import cache, versions, idempotency, jobs, replicas, limits
 
 # Blueprint 생성
 api_bp = Blueprint('api', __name__, url_prefix='/api')
 
 @api_bp.route('/')
+@api_bp.route('')
 def welcome():
-    """API 환영 메시지"""
+    """API 문서"""
     return jsonify({
-        "message": "🥮 붕어빵 시스템 API에 오신 것을 환영합니다!",
+        "message": "🥮 붕어빵 API v2.0",
+        "description": "User, Store, Employee 관리 시스템",
+        "idempotency": "POST 요청에 Idempotency-Key 헤더를 보내면 재시도 시 첫 응답을 그대로 반환",
+        "limits": "가입 / 직원 목록 / 내보내기는 클라이언트별 요청 한도(429) 와 동시 실행 한도(503) 가 있음, Retry-After 후 재시도",
         "endpoints": {
             "users": {
-                "POST /api/users/signup": "사용자 생성",
-                "GET /api/users": "사용자 목록 조회"
+                "POST /api/users/signup": "사용자 가입",
+                "POST /api/users/bulk": "사용자 일괄 가입",
+                "GET /api/users": "사용자 목록 조회",
+                "GET /api/users/search": "사용자 검색 (?q=&gender=&active=)",
+                "POST /api/users/<id>/deactivate": "사용자 비활성화 (직원 행도 함께)",
+                "POST /api/users/<id>/reactivate": "사용자 활성화"
             },
             "stores": {
                 "POST /api/stores": "가게 생성",
-                "GET /api/stores": "가게 목록 조회"
+                "GET /api/stores": "가게 목록 조회",
+                "GET /api/stores/stats": "가게별 직급 인원 집계 (대시보드용)",
+                "POST /api/stores/<id>/deactivate": "가게 비활성화 (직원 행도 함께)",
+                "POST /api/stores/<id>/reactivate": "가게 활성화"
             },
             "employees": {
                 "POST /api/employees": "직원 등록",
-                "GET /api/employees": "직원 목록 조회"
+                "POST /api/employees/bulk": "직원 일괄 등록",
+                "GET /api/employees": "직원 목록 조회",
+                "GET /api/employees/search": "직원 검색 (?q=&position=&store_id=&gender=&active=)",
+                "GET /api/stores/<id>/employees": "가게별 직원 명단 (?position=)",
+                "GET /api/users/<id>/stores": "사용자별 근무 가게 (?position=)",
+                "POST /api/employees/<id>/deactivate": "직원 비활성화",
+                "POST /api/employees/<id>/reactivate": "직원 활성화"
+            },
+            "jobs": {
+                "GET /api/jobs/<id>": "작업 상태 조회 (쓰기 응답의 job_id, WEBHOOK_URL 이 있을 때)",
+                "GET /api/metrics/jobs": "작업 큐 지표",
+                "GET /api/metrics/limits": "요청 한도 / 동시 실행 한도 지표"
+            },
+            "export": {
+                "GET /api/export/users": "사용자 전체 내보내기 (NDJSON)",
+                "GET /api/export/stores": "가게 전체 내보내기 (NDJSON)",
+                "GET /api/export/employees": "직원 전체 내보내기 (NDJSON)"
             }
         }
     })
 
 # 사용자 관련 API
 @api_bp.route('/users/signup', methods=['POST'])
+@idempotency.idempotent
+@limits.limit('signup')
 def signup_user():
     """사용자 회원가입"""
     data = request.get_json()
     if not data:
         return jsonify({"error": "데이터가 제공되지 않았습니다"}), 400
-    
+
     response, status = create_user(data)
     return jsonify(response), status
 
+@api_bp.route('/users/bulk', methods=['POST'])
+@idempotency.idempotent
+@limits.limit('signup_bulk')
+def signup_users_bulk():
+    """사용자 일괄 회원가입 (JSON 배열, 한 트랜잭션으로 저장)"""
+    data = request.get_json()
+    if not data or not isinstance(data, list):
+        return jsonify({"error": "사용자 배열이 제공되지 않았습니다"}), 400
+
+    response, status = create_users_bulk(data)
+    return jsonify(response), status
+
+@api_bp.route('/metrics/hashing', methods=['GET'])
+def hashing_metrics():
+    """비밀번호 해시 실행기 지표 조회"""
+    return jsonify(hash_stats())
+
+@api_bp.route('/metrics/cache', methods=['GET'])
+def cache_metrics():
+    """캐시 적중/실패 지표 조회"""
+    return jsonify(cache.stats())
+
+@api_bp.route('/metrics/jobs', methods=['GET'])
+def jobs_metrics():
+    """작업 큐 지표 조회 (상태별 작업 수는 모든 작업자 공통)"""
+    try:
+        return jsonify({**jobs.stats(), **jobs.queue_stats()})
+    except Exception as e:
+        return jsonify({"error": f"작업 큐 지표 조회 실패: {str(e)}"}), 500
+
+@api_bp.route('/metrics/limits', methods=['GET'])
+def limits_metrics():
+    """요청 한도 / 동시 실행 한도 지표 조회 (이 프로세스 기준)"""
+    return jsonify(limits.stats())
+
+@api_bp.route('/jobs/<int:job_id>', methods=['GET'])
+def job_status(job_id):
+    """작업 상태 조회 (쓰기 응답의 job_id)"""
+    try:
+        job = jobs.get(job_id)
+    except Exception as e:
+        return jsonify({"error": f"작업 조회 실패: {str(e)}"}), 500
+    if job is None:
+        return jsonify({"error": "존재하지 않는 작업입니다"}), 404
+    return jsonify(job)
+
 @api_bp.route('/users', methods=['GET'])
+@replicas.reads
+@versions.conditional('users')
 def list_users():
-    """모든 사용자 조회"""
-    users = get_all_users()
-    return jsonify({
-        "message": "사용자 목록 조회 성공",
-        "users": users, 
-        "count": len(users)
-    })
+    """사용자 목록 조회 (?after=<id>&limit=N&fields=a,b)"""
+    try:
+        after, limit = parse_page_args(request.args)
+        fields = parse_fields(request.args, USER_FIELDS, USER_FIELDS)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    try:
+        return jsonify(get_all_users(after, limit, fields))
+    except Exception as e:
+        return jsonify({"error": f"사용자 목록 조회 실패: {str(e)}"}), 500
+
+@api_bp.route('/users/search', methods=['GET'])
+@replicas.reads
+@versions.conditional('users')
+def search_users_route():
+    """사용자 검색 (?q=이메일/이름/연락처 접두어&gender=&active=true|false|all)"""
+    try:
+        after, limit = parse_page_args(request.args)
+        fields = parse_fields(request.args, USER_FIELDS, USER_FIELDS)
+        terms = parse_terms(request.args.get('q'))
+        gender = parse_gender(request.args)
+        active = parse_active(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    try:
+        return jsonify(search_users(terms, gender, active, after, limit, fields))
+    except Exception as e:
+        return jsonify({"error": f"사용자 검색 실패: {str(e)}"}), 500
 
 # 가게 관련 API
 @api_bp.route('/stores', methods=['POST'])
+@idempotency.idempotent
 def create_store_route():
     """가게 생성"""
     data = request.get_json()
     if not data:
         return jsonify({"error": "데이터가 제공되지 않았습니다"}), 400
-    
+
     response, status = create_store(data)
     return jsonify(response), status
 
 @api_bp.route('/stores', methods=['GET'])
+@replicas.reads
+@versions.conditional('stores')
 def list_stores():
-    """모든 가게 조회"""
-    stores = get_all_stores()
-    return jsonify({
-        "message": "가게 목록 조회 성공",
-        "stores": stores,
-        "count": len(stores)
-    })
+    """가게 목록 조회 (?after=<id>&limit=N&fields=a,b)"""
+    try:
+        after, limit = parse_page_args(request.args)
+        fields = parse_fields(request.args, STORE_FIELDS, STORE_FIELDS)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    try:
+        return jsonify(get_all_stores(after, limit, fields))
+    except Exception as e:
+        return jsonify({"error": f"가게 목록 조회 실패: {str(e)}"}), 500
+
+@api_bp.route('/stores/stats', methods=['GET'])
+@replicas.reads
+@versions.conditional('stores', 'employees', 'store_stats')
+def store_stats():
+    """가게별 직급 인원 집계 (?after=<가게 id>&limit=N&fields=a,b)"""
+    try:
+        after, limit = parse_page_args(request.args)
+        fields = parse_fields(request.args, STORE_STATS_FIELDS, STORE_STATS_FIELDS)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    try:
+        return jsonify(get_store_stats(after, limit, fields))
+    except Exception as e:
+        return jsonify({"error": f"가게별 인원 집계 조회 실패: {str(e)}"}), 500
 
 # 직원 관련 API
 @api_bp.route('/employees', methods=['POST'])
+@idempotency.idempotent
 def register_employee_route():
     """직원 등록"""
     data = request.get_json()
     if not data:
         return jsonify({"error": "데이터가 제공되지 않았습니다"}), 400
-    
+
     response, status = register_employee(data)
     return jsonify(response), status
 
+@api_bp.route('/employees/bulk', methods=['POST'])
+@idempotency.idempotent
+def register_employees_bulk_route():
+    """직원 일괄 등록 (신규 가게 오픈용, 한 트랜잭션으로 저장)"""
+    data = request.get_json()
+    if not data or 'store_id' not in data or not isinstance(data.get('employees'), list):
+        return jsonify({"error": "store_id 와 employees 배열이 필요합니다"}), 400
+
+    response, status = register_employees_bulk(data['store_id'], data['employees'])
+    return jsonify(response), status
+
 @api_bp.route('/employees', methods=['GET'])
+@replicas.reads
+@versions.conditional('users', 'stores', 'employees')
+@limits.limit('employees')
 def list_employees():
-    """모든 직원 조회"""
-    employees = get_all_employees()
-    return jsonify({
-        "message": "직원 목록 조회 성공",
-        "employees": employees,
-        "count": len(employees)
-    })
+    """직원 목록 조회 (?after=<id>&limit=N&fields=a,b)"""
+    try:
+        after, limit = parse_page_args(request.args)
+        fields = parse_fields(request.args, EMPLOYEE_FIELDS, EMPLOYEE_FIELDS)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    try:
+        return jsonify(get_all_employees(after, limit, fields))
+    except Exception as e:
+        return jsonify({"error": f"직원 목록 조회 실패: {str(e)}"}), 500
+
+@api_bp.route('/employees/search', methods=['GET'])
+@replicas.reads
+@versions.conditional('users', 'stores', 'employees')
+def search_employees_route():
+    """직원 검색 (?q=&position=&store_id=&gender=&active=true|false|all)"""
+    try:
+        after, limit = parse_page_args(request.args)
+        fields = parse_fields(request.args, EMPLOYEE_FIELDS, EMPLOYEE_FIELDS)
+        terms = parse_terms(request.args.get('q'))
+        position = parse_position(request.args)
+        store_id = parse_store_id(request.args)
+        gender = parse_gender(request.args)
+        active = parse_active(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    try:
+        return jsonify(search_employees(terms, position, store_id, gender, active,
+                                        after, limit, fields))
+    except Exception as e:
+        return jsonify({"error": f"직원 검색 실패: {str(e)}"}), 500
+
+@api_bp.route('/stores/<int:store_id>/employees', methods=['GET'])
+@replicas.reads
+@versions.conditional('users', 'stores', 'employees')
+def list_store_employees(store_id):
+    """가게별 직원 명단 (?position=매니저&after=<id>&limit=N&fields=a,b)"""
+    try:
+        after, limit = parse_page_args(request.args)
+        fields = parse_fields(request.args, EMPLOYEE_FIELDS, EMPLOYEE_FIELDS)
+        position = parse_position(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    try:
+        response, status = get_store_employees(store_id, position, after, limit, fields)
+        return jsonify(response), status
+    except Exception as e:
+        return jsonify({"error": f"가게 직원 목록 조회 실패: {str(e)}"}), 500
+
+@api_bp.route('/users/<int:user_id>/stores', methods=['GET'])
+@replicas.reads
+@versions.conditional('users', 'stores', 'employees')
+def list_user_stores(user_id):
+    """사용자별 근무 가게 목록 (?position=매니저&after=<직원 id>&limit=N&fields=a,b)"""
+    try:
+        after, limit = parse_page_args(request.args)
+        fields = parse_fields(request.args, USER_STORE_FIELDS, USER_STORE_FIELDS)
+        position = parse_position(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    try:
+        response, status = get_user_stores(user_id, position, after, limit, fields)
+        return jsonify(response), status
+    except Exception as e:
+        return jsonify({"error": f"사용자 근무 가게 목록 조회 실패: {str(e)}"}), 500
+
+# 비활성화 / 활성화 API (행은 지우지 않고 is_active 만 변경)
+@api_bp.route('/users/<int:user_id>/deactivate', methods=['POST'])
+def deactivate_user_route(user_id):
+    """사용자 비활성화"""
+    response, status = deactivate_user(user_id)
+    return jsonify(response), status
+
+@api_bp.route('/users/<int:user_id>/reactivate', methods=['POST'])
+def reactivate_user_route(user_id):
+    """사용자 활성화"""
+    response, status = reactivate_user(user_id)
+    return jsonify(response), status
+
+@api_bp.route('/stores/<int:store_id>/deactivate', methods=['POST'])
+def deactivate_store_route(store_id):
+    """가게 비활성화"""
+    response, status = deactivate_store(store_id)
+    return jsonify(response), status
+
+@api_bp.route('/stores/<int:store_id>/reactivate', methods=['POST'])
+def reactivate_store_route(store_id):
+    """가게 활성화"""
+    response, status = reactivate_store(store_id)
+    return jsonify(response), status
+
+@api_bp.route('/employees/<int:employee_id>/deactivate', methods=['POST'])
+def deactivate_employee_route(employee_id):
+    """직원 비활성화"""
+    response, status = deactivate_employee(employee_id)
+    return jsonify(response), status
+
+@api_bp.route('/employees/<int:employee_id>/reactivate', methods=['POST'])
+def reactivate_employee_route(employee_id):
+    """직원 활성화"""
+    response, status = reactivate_employee(employee_id)
+    return jsonify(response), status
+
+# 대용량 내보내기 API (NDJSON 스트리밍, ?fields=a,b)
+@api_bp.route('/export/users', methods=['GET'])
+@replicas.reads
+@limits.limit('export')
+def export_users():
+    """사용자 전체 내보내기"""
+    try:
+        fields = parse_fields(request.args, USER_FIELDS, USER_FIELDS)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    return stream_ndjson(
+        User.query.filter_by(is_active=True), User.id, USER_FIELDS, fields
+    )
+
+@api_bp.route('/export/stores', methods=['GET'])
+@replicas.reads
+@limits.limit('export')
+def export_stores():
+    """가게 전체 내보내기"""
+    try:
+        fields = parse_fields(request.args, STORE_FIELDS, STORE_FIELDS)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    return stream_ndjson(
+        Store.query.filter_by(is_active=True), Store.id, STORE_FIELDS, fields
+    )
+
+@api_bp.route('/export/employees', methods=['GET'])
+@replicas.reads
+@limits.limit('export')
+def export_employees():
+    """직원 전체 내보내기"""
+    try:
+        fields = parse_fields(request.args, EMPLOYEE_FIELDS, EMPLOYEE_FIELDS)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
 
+    return stream_ndjson(
+        active_employee_query(fields), Employee.id, EMPLOYEE_FIELDS, fields
+    )
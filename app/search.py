@@ -0,0 +1,157 @@
+"""사용자 / 직원 검색 (이메일, 성/이름, 연락처 접두어)
+
+검색어를 공백으로 나눈 각 단어가 email / first_name / last_name / contact 중
+하나의 접두어이면 일치한다 (여러 단어는 AND).
+
+SQLite: FTS5 가상 테이블
+    users_fts      rowid = users.id (내용은 저장하지 않음, contentless)
+    employees_fts  rowid = employees.id, 값은 그 직원의 사용자 컬럼
+    unicode61 토크나이저에 '@.-_+' 를 단어 문자로 넣어서 이메일과 연락처가
+    통째로 한 단어가 된다 (이메일 접두어 검색). users / employees 의
+    INSERT / UPDATE / DELETE 트리거가 같은 트랜잭션 안에서 색인을 고치므로
+    Core executemany 로 넣은 행도 빠지지 않는다. 두 색인 모두 rowid 순서로
+    읽히므로 id 커서 페이지가 정렬 없이 limit 에서 멈춘다.
+    employees_fts 는 사용자 행이 먼저 지워져도 rowid 로 지울 수 있도록
+    내용을 저장한다.
+그 외 DB (또는 색인이 없는 SQLite): 컬럼별 LIKE 'q%'
+    PostgreSQL 은 varchar_pattern_ops 인덱스를 타고, 대소문자를 구분한다.
+"""
+import weakref
+
+from sqlalchemy import column, event, func, or_, select, table
+
+SEARCH_COLUMNS = ('email', 'first_name', 'last_name', 'contact')
+
+MAX_QUERY_LENGTH = 100
+MAX_TERMS = 5
+
+# 엔진별 FTS 색인 존재 여부
+_fts_engines = weakref.WeakKeyDictionary()
+
+# FTS5 가상 테이블 (rowid 와 MATCH 용 숨은 컬럼만 사용)
+users_fts = table('users_fts', column('rowid'), column('users_fts'))
+employees_fts = table('employees_fts', column('rowid'), column('employees_fts'))
+# 색인 존재 확인용
+_sqlite_master = table('sqlite_master', column('type'), column('name'))
+
+_COLUMNS = ', '.join(SEARCH_COLUMNS)
+_OPTIONS = "tokenize=\"unicode61 tokenchars '@.-_+'\", prefix='2 3'"
+
+
+def _values(prefix):
+    return ', '.join(f"{prefix}.{name}" for name in SEARCH_COLUMNS)
+
+
+def _employee_rows(employee_id, user_id):
+    """employees_fts 에 넣을 (rowid, 사용자 컬럼) SELECT"""
+    return f"SELECT {employee_id}, {_values('u')} FROM users u WHERE u.id = {user_id}"
+
+
+_SQLITE_DDL = [
+    # 사용자 색인
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS users_fts USING fts5({_COLUMNS}, content='', {_OPTIONS})",
+    f"INSERT INTO users_fts (rowid, {_COLUMNS}) SELECT id, {_COLUMNS} FROM users",
+    "CREATE TRIGGER IF NOT EXISTS users_fts_insert AFTER INSERT ON users BEGIN "
+    f"INSERT INTO users_fts (rowid, {_COLUMNS}) VALUES (new.id, {_values('new')}); END",
+    "CREATE TRIGGER IF NOT EXISTS users_fts_delete AFTER DELETE ON users BEGIN "
+    f"INSERT INTO users_fts (users_fts, rowid, {_COLUMNS}) VALUES ('delete', old.id, {_values('old')}); "
+    "DELETE FROM employees_fts WHERE rowid IN (SELECT id FROM employees WHERE user_id = old.id); END",
+    f"CREATE TRIGGER IF NOT EXISTS users_fts_update AFTER UPDATE OF {_COLUMNS} ON users BEGIN "
+    f"INSERT INTO users_fts (users_fts, rowid, {_COLUMNS}) VALUES ('delete', old.id, {_values('old')}); "
+    f"INSERT INTO users_fts (rowid, {_COLUMNS}) VALUES (new.id, {_values('new')}); "
+    "UPDATE employees_fts SET "
+    + ', '.join(f"{name} = new.{name}" for name in SEARCH_COLUMNS)
+    + " WHERE rowid IN (SELECT id FROM employees WHERE user_id = new.id); END",
+
+    # 직원 색인 (사용자 컬럼을 직원 행마다 복사)
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS employees_fts USING fts5({_COLUMNS}, {_OPTIONS})",
+    f"INSERT INTO employees_fts (rowid, {_COLUMNS}) "
+    f"SELECT e.id, {_values('u')} FROM employees e JOIN users u ON u.id = e.user_id",
+    "CREATE TRIGGER IF NOT EXISTS employees_fts_insert AFTER INSERT ON employees BEGIN "
+    f"INSERT INTO employees_fts (rowid, {_COLUMNS}) {_employee_rows('new.id', 'new.user_id')}; END",
+    "CREATE TRIGGER IF NOT EXISTS employees_fts_delete AFTER DELETE ON employees BEGIN "
+    "DELETE FROM employees_fts WHERE rowid = old.id; END",
+    "CREATE TRIGGER IF NOT EXISTS employees_fts_update AFTER UPDATE OF user_id ON employees BEGIN "
+    "DELETE FROM employees_fts WHERE rowid = old.id; "
+    f"INSERT INTO employees_fts (rowid, {_COLUMNS}) {_employee_rows('new.id', 'new.user_id')}; END"
+]
+
+_SQLITE_DROP = [
+    "DROP TRIGGER IF EXISTS employees_fts_update",
+    "DROP TRIGGER IF EXISTS employees_fts_delete",
+    "DROP TRIGGER IF EXISTS employees_fts_insert",
+    "DROP TABLE IF EXISTS employees_fts",
+    "DROP TRIGGER IF EXISTS users_fts_update",
+    "DROP TRIGGER IF EXISTS users_fts_delete",
+    "DROP TRIGGER IF EXISTS users_fts_insert",
+    "DROP TABLE IF EXISTS users_fts"
+]
+
+_POSTGRESQL_DDL = [
+    f"CREATE INDEX IF NOT EXISTS ix_users_{name}_pattern ON users ({name} varchar_pattern_ops)"
+    for name in SEARCH_COLUMNS
+]
+
+
+def search_ddl(dialect_name):
+    """검색 색인을 만드는 SQL 목록 (users / employees 테이블이 있어야 함)"""
+    if dialect_name == 'sqlite':
+        return list(_SQLITE_DDL)
+    if dialect_name == 'postgresql':
+        return list(_POSTGRESQL_DDL)
+    return []
+
+
+def install_search_index(metadata):
+    """create_all / drop_all 때 검색 색인도 함께 만들고 지우도록 등록"""
+    @event.listens_for(metadata, 'after_create')
+    def create_search_index(target, connection, **kw):
+        for statement in search_ddl(connection.dialect.name):
+            connection.exec_driver_sql(statement)
+
+    @event.listens_for(metadata, 'before_drop')
+    def drop_search_index(target, connection, **kw):
+        if connection.dialect.name == 'sqlite':
+            for statement in _SQLITE_DROP:
+                connection.exec_driver_sql(statement)
+
+
+def has_fts(session):
+    """검색 쿼리를 실행할 DB 에 FTS5 검색 색인이 있으면 True (엔진별로 한 번만 확인)
+
+    확인 쿼리도 SELECT 라서 검색 쿼리와 같은 bind (복제본 읽기 요청이면
+    복제본) 로 간다.
+    """
+    probe = select(func.count()).select_from(_sqlite_master).where(
+        _sqlite_master.c.type == 'table', _sqlite_master.c.name.in_(('users_fts', 'employees_fts'))
+    )
+    engine = session.get_bind(clause=probe)
+    if engine not in _fts_engines:
+        _fts_engines[engine] = engine.dialect.name == 'sqlite' and session.execute(probe).scalar() == 2
+    return _fts_engines[engine]
+
+
+def parse_terms(value):
+    """?q= 를 검색 단어 목록으로 (너무 길면 ValueError)"""
+    value = (value or '').strip()
+    if len(value) > MAX_QUERY_LENGTH:
+        raise ValueError(f"검색어는 {MAX_QUERY_LENGTH}자 이하여야 합니다")
+    terms = value.split()
+    if len(terms) > MAX_TERMS:
+        raise ValueError(f"검색어는 {MAX_TERMS}단어 이하여야 합니다")
+    return terms
+
+
+def fts_query(terms):
+    """단어 목록 -> FTS5 MATCH 식 (각 단어를 따옴표로 감싼 접두어 검색)"""
+    return ' '.join('"{}"*'.format(term.replace('"', '""')) for term in terms)
+
+
+def fts_match(fts_table, terms):
+    """fts_table 에서 terms 와 일치하는 조건 (fts_table 을 FROM 에 넣어야 함)"""
+    return fts_table.c[fts_table.name].op('MATCH')(fts_query(terms))
+
+
+def like_match(columns, terms):
+    """FTS 가 없을 때: 각 단어가 columns 중 하나의 접두어"""
+    return [or_(*(col.startswith(term, autoescape=True) for col in columns)) for term in terms]
@@ -1,133 +1,892 @@
-from werkzeug.security import generate_password_hash
-from .models import User, Store, Employee
-from . import db
-import random
+from datetime import datetime, timezone
+from flask import current_app
+from sqlalchemy import case, exists, func, insert, update
+from sqlalchemy.exc import IntegrityError
+from .models import (
+    User, Store, Employee, EmployeeCodeSequence, StoreStat, GenderEnum, PositionEnum,
+    users_archive, stores_archive, employees_archive
+)
+from .archive import archive_rows
+from .codes import DEFAULT_KEY, allocate_codes
+from .hashing import hash_password, hash_passwords, parallelism
+from .pagination import DEFAULT_LIMIT, keyset_page, raw, spec_tables
+from .search import employees_fts, fts_match, has_fts, like_match, users_fts
+from .tasks import notify
+from . import db, cache
+
+# 일괄 처리 최대 건수
+MAX_BULK_SIZE = 5000
+# 한 사용자를 같은 가게에 두 번 등록할 때
+DUPLICATE_EMPLOYEE = "이미 이 가게에 등록된 직원입니다"
+DUPLICATE_EMPLOYEE_INDEX = 'uq_employees_user_id_store_id'
+
+# 사용자 입력의 문자열 필드 (필수 / 선택)
+USER_REQUIRED_FIELDS = ('last_name', 'email', 'password', 'gender')
+USER_OPTIONAL_FIELDS = ('first_name', 'address', 'contact')
+
+# 목록 조회 필드 정의: {필드명: ((조회할 컬럼, ...), 포맷 함수)}
+def _full_name(first_name, last_name):
+    return f"{first_name} {last_name}".strip()
+
+def _enum_value(value):
+    return value.value if value else None
+
+USER_FIELDS = {
+    "id": ((User.id,), raw),
+    "name": ((User.first_name, User.last_name), _full_name),
+    "email": ((User.email,), raw),
+    "contact": ((User.contact,), raw),
+    "gender": ((User.gender,), _enum_value),
+    "address": ((User.address,), raw)
+}
+
+STORE_FIELDS = {
+    "id": ((Store.id,), raw),
+    "name": ((Store.name,), raw),
+    "address": ((Store.address,), raw),
+    "contact": ((Store.contact,), raw)
+}
+
+EMPLOYEE_FIELDS = {
+    "id": ((Employee.id,), raw),
+    "employee_code": ((Employee.code,), raw),
+    "user_name": ((User.first_name, User.last_name), _full_name),
+    "store_name": ((Store.name,), raw),
+    "position": ((Employee.type,), _enum_value),
+    "user_email": ((User.email,), raw)
+}
+
+# 사용자별 근무 가게 목록 필드 (직원 행 기준)
+USER_STORE_FIELDS = {
+    "store_id": ((Store.id,), raw),
+    "store_name": ((Store.name,), raw),
+    "address": ((Store.address,), raw),
+    "contact": ((Store.contact,), raw),
+    "employee_code": ((Employee.code,), raw),
+    "position": ((Employee.type,), _enum_value)
+}
+
+# 가게별 직급 인원 필드 (store_stats 를 가게 id 로 GROUP BY)
+def _headcount(position=None):
+    count = StoreStat.headcount if position is None else \
+        case((StoreStat.position == position, StoreStat.headcount), else_=0)
+    return func.coalesce(func.sum(count), 0)
+
+STORE_STATS_FIELDS = {
+    "store_id": ((Store.id,), raw),
+    "store_name": ((Store.name,), raw),
+    "managers": ((_headcount(PositionEnum.MANAGER),), raw),
+    "staff": ((_headcount(PositionEnum.STAFF),), raw),
+    "total": ((_headcount(),), raw)
+}
+
+# 잘못된 Enum 입력 값의 오류 메시지
+INVALID_ENUM = {GenderEnum: "잘못된 성별 값입니다", PositionEnum: "잘못된 직급 값입니다"}
+
+def parse_enum(enum, value):
+    """입력 값을 enum 멤버로 변환 (잘못된 값이면 ValueError)"""
+    try:
+        return enum(value)
+    except (TypeError, ValueError):
+        raise ValueError(INVALID_ENUM[enum])
+
+def parse_position(args):
+    """?position= 파싱 (PositionEnum 값, 잘못된 값이면 ValueError)"""
+    value = args.get('position')
+    return parse_enum(PositionEnum, value) if value else None
+
+def parse_gender(args):
+    """?gender= 파싱 (GenderEnum 값, 잘못된 값이면 ValueError)"""
+    value = args.get('gender')
+    return parse_enum(GenderEnum, value) if value else None
+
+def parse_active(args):
+    """?active=true|false|all 파싱 (기본 true, all 이면 None)"""
+    value = (args.get('active') or 'true').lower()
+    if value in ('true', '1'):
+        return True
+    if value in ('false', '0'):
+        return False
+    if value == 'all':
+        return None
+    raise ValueError("active 는 true, false, all 중 하나여야 합니다")
+
+def parse_store_id(args):
+    """?store_id= 파싱 (정수가 아니면 ValueError)"""
+    value = args.get('store_id')
+    if value in (None, ''):
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError("store_id 는 정수여야 합니다")
+
+def get_user_summary(user_id):
+    """활성 사용자 id/이름 조회 (캐시 경유, 없거나 비활성이면 None)"""
+    def load():
+        row = db.session.query(User.id, User.first_name, User.last_name) \
+            .filter(User.id == user_id, User.is_active.is_(True)).first()
+        return {"id": row.id, "name": _full_name(row.first_name, row.last_name)} if row else None
+    return cache.get_or_load('user', user_id, load)
+
+def get_store_summary(store_id):
+    """활성 가게 id/이름 조회 (캐시 경유, 없거나 비활성이면 None)"""
+    def load():
+        row = db.session.query(Store.id, Store.name) \
+            .filter(Store.id == store_id, Store.is_active.is_(True)).first()
+        return {"id": row.id, "name": row.name} if row else None
+    return cache.get_or_load('store', store_id, load)
+
+def _is_id(value):
+    """정수 id 인지 (JSON true / false 는 제외)"""
+    return isinstance(value, int) and not isinstance(value, bool)
+
+def _invalid_user_field(row):
+    """문자열이 아닌 사용자 필드 이름 (모두 맞으면 None, 선택 필드는 null 허용)"""
+    for field in USER_REQUIRED_FIELDS:
+        if not isinstance(row[field], str):
+            return field
+    for field in USER_OPTIONAL_FIELDS:
+        if row.get(field) is not None and not isinstance(row[field], str):
+            return field
+    return None
 
 def create_user(data):
     """사용자 생성"""
     try:
+        # 필수 필드 확인
+        for field in USER_REQUIRED_FIELDS:
+            if field not in data:
+                return {"error": f"{field} 필드가 필요합니다"}, 400
+        invalid = _invalid_user_field(data)
+        if invalid:
+            return {"error": f"{invalid} 필드는 문자열이어야 합니다"}, 400
+        try:
+            gender = parse_enum(GenderEnum, data['gender'])
+        except ValueError as e:
+            return {"error": str(e)}, 400
+
         # 이메일 중복 체크
         if User.query.filter_by(email=data['email']).first():
             return {"error": "이미 존재하는 이메일입니다"}, 400
-        
-        # 비밀번호 해시화
-        hashed_password = generate_password_hash(data['password'])
-        
+
+        # 비밀번호 해시화 (요청 스레드 대신 해시 실행기에서 처리)
+        hashed_password = hash_password(data['password'])
+
         # 새 사용자 생성
         new_user = User(
-            first_name=data.get('first_name'),
+            first_name=data.get('first_name', ''),
             last_name=data['last_name'],
             email=data['email'],
             password=hashed_password,
-            address=data.get('address'),
-            contact=data.get('contact'),
-            gender=data.get('gender')
+            address=data.get('address', ''),
+            contact=data.get('contact', ''),
+            gender=gender
         )
-        
+
         db.session.add(new_user)
+        db.session.flush()
+        # 후속 작업(웹훅)은 같은 트랜잭션에 넣고 작업자가 처리
+        job = notify('user.created', user_id=new_user.id, email=new_user.email)
         db.session.commit()
-        
+
         return {
             "message": "사용자가 성공적으로 생성되었습니다",
             "user_id": new_user.id,
-            "name": f"{new_user.first_name} {new_user.last_name}"
+            "name": _full_name(new_user.first_name, new_user.last_name),
+            "email": new_user.email,
+            "job_id": job and job.id
         }, 201
-        
+
     except Exception as e:
         db.session.rollback()
         return {"error": f"사용자 생성 실패: {str(e)}"}, 500
 
+def create_users_bulk(rows):
+    """사용자 일괄 생성 (이메일 확인 1회, 병렬 해시, 한 트랜잭션 저장)
+
+    해시 작업자마다 BULK_SIGNUP_ROWS_PER_HASH_WORKER 건 (PBKDF2 한 번 0.4~0.6 초,
+    기본 20 건 ≈ 10 초) 씩 나눠 해시하므로 한 번에 그 x 작업자 수 명까지 받는다.
+    작업자 수와 관계없이 요청 시간이 WEB_TIMEOUT 안에 머문다.
+
+    처리량: 요청 한도 기본값 (signup_bulk 30 토큰, 초당 2 토큰 보충) 에서
+    클라이언트 하나는 15 초에 한 번 보낼 수 있다. 코어 8 개 / gunicorn 워커
+    1 개 (작업자 8) 면 한 번에 160 명, 5,000 명은 32 번 (약 8 분) 이다. 코어를
+    다 쓰는 PBKDF2 자체의 한계 (약 5 분) 에 가깝다.
+    """
+    limit = current_app.config['BULK_SIGNUP_ROWS_PER_HASH_WORKER'] * parallelism()
+    if len(rows) > limit:
+        return {"error": f"한 번에 최대 {limit}명까지 가입할 수 있습니다"}, 400
+
+    results = [None] * len(rows)
+    valid = []
+
+    # 필수 필드 / 성별 / 요청 내 이메일 중복 확인
+    seen_emails = set()
+    for index, row in enumerate(rows):
+        if not isinstance(row, dict):
+            results[index] = {"index": index, "status": 400, "error": "잘못된 사용자 데이터입니다"}
+            continue
+        missing = [f for f in USER_REQUIRED_FIELDS if f not in row]
+        if missing:
+            results[index] = {"index": index, "status": 400, "error": f"{missing[0]} 필드가 필요합니다"}
+            continue
+        invalid = _invalid_user_field(row)
+        if invalid:
+            results[index] = {"index": index, "status": 400, "error": f"{invalid} 필드는 문자열이어야 합니다"}
+            continue
+        try:
+            gender = parse_enum(GenderEnum, row['gender'])
+        except ValueError as e:
+            results[index] = {"index": index, "status": 400, "error": str(e)}
+            continue
+        if row['email'] in seen_emails:
+            results[index] = {"index": index, "status": 400, "error": "요청 안에 중복된 이메일입니다"}
+            continue
+        seen_emails.add(row['email'])
+        valid.append((index, row, gender))
+
+    try:
+        # 이미 가입된 이메일은 IN 쿼리 한 번으로 확인
+        existing = set()
+        if seen_emails:
+            existing = {email for (email,) in db.session.query(User.email)
+                        .filter(User.email.in_(seen_emails))}
+        for index, row, gender in valid:
+            if row['email'] in existing:
+                results[index] = {"index": index, "status": 400, "error": "이미 존재하는 이메일입니다"}
+        valid = [item for item in valid if item[1]['email'] not in existing]
+
+        # 비밀번호는 프로세스 풀에서 병렬로 해시
+        hashed = hash_passwords(row['password'] for _, row, _ in valid)
+
+        mappings = [{
+            "first_name": row.get('first_name', ''),
+            "last_name": row['last_name'],
+            "email": row['email'],
+            "password": hashed_password,
+            "address": row.get('address', ''),
+            "contact": row.get('contact', ''),
+            "gender": gender,
+            "is_active": True,
+            "is_staff": False
+        } for (_, row, gender), hashed_password in zip(valid, hashed)]
+
+        # executemany + RETURNING 으로 한 번에 저장하고 한 번만 커밋
+        user_ids = []
+        if mappings:
+            user_ids = db.session.scalars(
+                insert(User).returning(User.id, sort_by_parameter_order=True),
+                mappings
+            ).all()
+        job = notify('users.created', user_ids=user_ids) if user_ids else None
+        db.session.commit()
+
+    except Exception as e:
+        db.session.rollback()
+        return {"error": f"사용자 일괄 생성 실패: {str(e)}"}, 500
+
+    for (index, row, _), user_id in zip(valid, user_ids):
+        results[index] = {"index": index, "status": 201, "user_id": user_id, "email": row['email']}
+
+    created = len(user_ids)
+    status = 201 if created == len(rows) else (207 if created else 400)
+    return {
+        "message": f"{created}명의 사용자가 생성되었습니다",
+        "created": created,
+        "failed": len(rows) - created,
+        "job_id": job and job.id,
+        "results": results
+    }, status
+
 def create_store(data):
     """가게 생성"""
     try:
+        # 필수 필드 확인
+        if 'name' not in data:
+            return {"error": "가게 이름이 필요합니다"}, 400
+
         new_store = Store(
             name=data['name'],
-            address=data.get('address'),
-            contact=data.get('contact')
+            address=data.get('address', ''),
+            contact=data.get('contact', '')
         )
-        
+
         db.session.add(new_store)
         db.session.commit()
-        
+
         return {
             "message": "가게가 성공적으로 생성되었습니다",
             "store_id": new_store.id,
-            "name": new_store.name
+            "name": new_store.name,
+            "address": new_store.address
         }, 201
-        
+
     except Exception as e:
         db.session.rollback()
         return {"error": f"가게 생성 실패: {str(e)}"}, 500
 
+def next_employee_codes(count=1):
+    """중복 확인 반복 조회 없이 직원번호 count 개 발급"""
+    return allocate_codes(
+        db.session, EmployeeCodeSequence.__table__, Employee.code, count,
+        current_app.config.get('EMPLOYEE_CODE_KEY', DEFAULT_KEY)
+    )
+
+def _is_duplicate_employee(error):
+    """IntegrityError 가 (user_id, store_id) 유니크 인덱스 위반인지
+
+    PostgreSQL 은 드라이버가 알려주는 제약 이름으로, SQLite 는 오류 메시지의
+    컬럼 목록으로 구분한다 (다른 UNIQUE / NOT NULL / 외래키 위반은 False).
+    """
+    orig = error.orig
+    constraint = getattr(getattr(orig, 'diag', None), 'constraint_name', None)
+    if constraint is not None:
+        return constraint == DUPLICATE_EMPLOYEE_INDEX
+    message = str(orig)
+    return DUPLICATE_EMPLOYEE_INDEX in message or 'employees.user_id, employees.store_id' in message
+
+def _duplicate_employee_error(employee_id, is_active):
+    """이미 등록된 직원 응답 (비활성 직원이면 다시 활성화 API 안내)"""
+    if is_active:
+        return {"error": DUPLICATE_EMPLOYEE, "employee_id": employee_id}
+    return {
+        "error": "비활성화된 직원입니다. 새로 등록하지 말고 다시 활성화하세요",
+        "employee_id": employee_id,
+        "reactivate": f"POST /api/employees/{employee_id}/reactivate"
+    }
+
+def _existing_employee_error(user_id, store_id):
+    """이 가게에 이미 등록된 사용자면 오류 payload, 아니면 None"""
+    row = db.session.query(Employee.id, Employee.is_active) \
+        .filter_by(user_id=user_id, store_id=store_id).first()
+    return _duplicate_employee_error(row.id, row.is_active) if row else None
+
 def register_employee(data):
     """직원 등록"""
     try:
-        # 사용자와 가게 존재 확인
-        user = User.query.get(data['user_id'])
-        store = Store.query.get(data['store_id'])
-        
+        # 필수 필드 확인
+        for field in ['user_id', 'store_id', 'type']:
+            if field not in data:
+                return {"error": f"{field} 필드가 필요합니다"}, 400
+        for field in ['user_id', 'store_id']:
+            if not _is_id(data[field]):
+                return {"error": f"{field} 는 정수여야 합니다"}, 400
+        try:
+            position = parse_enum(PositionEnum, data['type'])
+        except ValueError as e:
+            return {"error": str(e)}, 400
+
+        # 사용자와 가게 존재 확인 (캐시 경유)
+        user = get_user_summary(data['user_id'])
+        store = get_store_summary(data['store_id'])
+
         if not user:
             return {"error": "존재하지 않는 사용자입니다"}, 404
         if not store:
             return {"error": "존재하지 않는 가게입니다"}, 404
-        
-        # 직원번호 생성 (100000~999999)
-        employee_code = random.randint(100000, 999999)
-        
-        # 직원번호 중복 체크
-        while Employee.query.filter_by(code=employee_code).first():
-            employee_code = random.randint(100000, 999999)
-        
+
+        # 같은 가게에 이미 등록된 사용자인지 확인 (번호 발급 전에)
+        existing = _existing_employee_error(data['user_id'], data['store_id'])
+        if existing:
+            return existing, 400
+
+        # 직원번호 발급 (100000~999999, 카운터 + Feistel 순열)
+        employee_code = next_employee_codes(1)[0]
+
         new_employee = Employee(
             code=employee_code,
             user_id=data['user_id'],
             store_id=data['store_id'],
-            type=data['type']
+            type=position
         )
-        
+
         db.session.add(new_employee)
+        db.session.flush()
+        # 후속 작업(웹훅)은 같은 트랜잭션에 넣고 작업자가 처리
+        job = notify('employee.registered', employee_id=new_employee.id,
+                     employee_code=new_employee.code, user_id=data['user_id'],
+                     store_id=data['store_id'], position=new_employee.type.value)
         db.session.commit()
-        
+
         return {
             "message": "직원이 성공적으로 등록되었습니다",
             "employee_id": new_employee.id,
             "employee_code": new_employee.code,
-            "user_name": f"{user.first_name} {user.last_name}",
-            "store_name": store.name
+            "user_name": user["name"],
+            "store_name": store["name"],
+            "position": new_employee.type.value,
+            "job_id": job and job.id
         }, 201
-        
+
+    except IntegrityError as e:
+        db.session.rollback()
+        # 동시에 들어온 같은 등록 요청 (uq_employees_user_id_store_id) 만 중복으로 안내
+        if _is_duplicate_employee(e):
+            return _existing_employee_error(data['user_id'], data['store_id']) \
+                or {"error": DUPLICATE_EMPLOYEE}, 400
+        return {"error": f"직원 등록 실패: {str(e.orig)}"}, 500
     except Exception as e:
         db.session.rollback()
         return {"error": f"직원 등록 실패: {str(e)}"}, 500
 
-def get_all_users():
-    """모든 사용자 조회"""
-    users = User.query.filter_by(is_active=True).all()
-    return [{
-        "id": user.id,
-        "name": f"{user.first_name} {user.last_name}",
-        "email": user.email,
-        "contact": user.contact,
-        "gender": user.gender.value if user.gender else None
-    } for user in users]
-
-def get_all_stores():
-    """모든 가게 조회"""
-    stores = Store.query.filter_by(is_active=True).all()
-    return [{
-        "id": store.id,
-        "name": store.name,
-        "address": store.address,
-        "contact": store.contact
-    } for store in stores]
-
-def get_all_employees():
-    """모든 직원 조회"""
-    employees = Employee.query.filter_by(is_active=True).all()
-    return [{
-        "id": employee.id,
-        "employee_code": employee.code,
-        "user_name": f"{employee.user.first_name} {employee.user.last_name}",
-        "store_name": employee.store.name,
-        "position": employee.type.value
-    } for employee in employees]
+def register_employees_bulk(store_id, items):
+    """직원 일괄 등록 (사용자 확인 1회, 번호 일괄 발급, 한 트랜잭션 저장)"""
+    if len(items) > MAX_BULK_SIZE:
+        return {"error": f"한 번에 최대 {MAX_BULK_SIZE}명까지 등록할 수 있습니다"}, 400
+    if not _is_id(store_id):
+        return {"error": "store_id 는 정수여야 합니다"}, 400
+
+    # 필드 / 형식 확인 (DB 조회 전에)
+    results = [None] * len(items)
+    candidates = []
+    for index, item in enumerate(items):
+        if not isinstance(item, dict) or 'user_id' not in item or 'type' not in item:
+            results[index] = {"index": index, "status": 400, "error": "user_id, type 필드가 필요합니다"}
+            continue
+        if not _is_id(item['user_id']):
+            results[index] = {"index": index, "status": 400, "error": "user_id 는 정수여야 합니다"}
+            continue
+        try:
+            position = parse_enum(PositionEnum, item['type'])
+        except ValueError as e:
+            results[index] = {"index": index, "status": 400, "error": str(e)}
+            continue
+        candidates.append((index, item['user_id'], position))
+
+    try:
+        store = get_store_summary(store_id)
+        if not store:
+            return {"error": "존재하지 않는 가게입니다"}, 404
+
+        # 사용자 존재 여부는 IN 쿼리 한 번으로 확인
+        user_ids = {user_id for _, user_id, _ in candidates}
+        users = {user_id: _full_name(first_name, last_name)
+                 for user_id, first_name, last_name in db.session.query(
+                     User.id, User.first_name, User.last_name
+                 ).filter(User.id.in_(user_ids), User.is_active.is_(True))}
+
+        # 이미 이 가게에 등록된 사용자도 IN 쿼리 한 번으로 확인
+        registered = {user_id: (employee_id, is_active) for user_id, employee_id, is_active in
+                      db.session.query(Employee.user_id, Employee.id, Employee.is_active).filter(
+                          Employee.store_id == store["id"], Employee.user_id.in_(users)
+                      )}
+
+        valid, seen = [], set()
+        for index, user_id, position in candidates:
+            if user_id not in users:
+                results[index] = {"index": index, "status": 404, "error": "존재하지 않는 사용자입니다"}
+                continue
+            if user_id in registered:
+                results[index] = {"index": index, "status": 400,
+                                  **_duplicate_employee_error(*registered[user_id])}
+                continue
+            if user_id in seen:     # 같은 요청 안의 중복
+                results[index] = {"index": index, "status": 400, "error": DUPLICATE_EMPLOYEE}
+                continue
+            seen.add(user_id)
+            valid.append((index, user_id, position))
+
+        # 직원번호는 카운터에서 한 번에 발급
+        codes = next_employee_codes(len(valid)) if valid else []
+
+        mappings = [{
+            "code": code,
+            "user_id": user_id,
+            "store_id": store["id"],
+            "type": position,
+            "is_active": True
+        } for (_, user_id, position), code in zip(valid, codes)]
+
+        # executemany + RETURNING 으로 한 번에 저장하고 한 번만 커밋
+        employee_ids = []
+        if mappings:
+            employee_ids = db.session.scalars(
+                insert(Employee).returning(Employee.id, sort_by_parameter_order=True),
+                mappings
+            ).all()
+        job = notify('employees.registered', store_id=store["id"],
+                     employee_ids=employee_ids) if employee_ids else None
+        db.session.commit()
+
+    except Exception as e:
+        db.session.rollback()
+        return {"error": f"직원 일괄 등록 실패: {str(e)}"}, 500
+
+    for (index, user_id, position), code, employee_id in zip(valid, codes, employee_ids):
+        results[index] = {
+            "index": index,
+            "status": 201,
+            "employee_id": employee_id,
+            "employee_code": code,
+            "user_name": users[user_id],
+            "position": position.value
+        }
+
+    created = len(employee_ids)
+    status = 201 if created == len(items) else (207 if created else 400)
+    return {
+        "message": f"{created}명의 직원이 등록되었습니다",
+        "store_name": store["name"],
+        "created": created,
+        "failed": len(items) - created,
+        "job_id": job and job.id,
+        "results": results
+    }, status
+
+def _utcnow():
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+# 활성/비활성 응답 메시지용 이름과 조사
+LABELS = {User: ("사용자", "가"), Store: ("가게", "가"), Employee: ("직원", "이")}
+
+# 비활성화가 직원에게 전파되는 모델: (직원 FK, 다시 활성화할 때 함께 활성이어야 하는 쪽)
+CASCADES = {
+    User: (Employee.user_id, Employee.store_id, Store),
+    Store: (Employee.store_id, Employee.user_id, User)
+}
+
+def _set_rows(model, conditions, **values):
+    """조건에 맞는 행을 UPDATE 한 번으로 변경 (행을 불러오지 않음), 바뀐 행 수 반환"""
+    return db.session.execute(
+        update(model).where(*conditions).values(**values)
+        .execution_options(synchronize_session=False)
+    ).rowcount
+
+def _deactivate(model, row_id):
+    """model 행 비활성화 + 활성 직원 행에 같은 시각으로 전파"""
+    label, particle = LABELS[model]
+    try:
+        row = db.session.query(model.is_active).filter(model.id == row_id).first()
+        if not row:
+            return {"error": f"존재하지 않는 {label}입니다"}, 404
+
+        cascaded = 0
+        if row.is_active:
+            now = _utcnow()
+            _set_rows(model, (model.id == row_id,), is_active=False, deactivated_at=now)
+            if model in CASCADES:
+                fk = CASCADES[model][0]
+                cascaded = _set_rows(Employee, (fk == row_id, Employee.is_active.is_(True)),
+                                     is_active=False, deactivated_at=now)
+            db.session.commit()
+
+        response = {"message": f"{label}{particle} 비활성화되었습니다", "id": row_id}
+        if model in CASCADES:
+            response["deactivated_employees"] = cascaded
+        return response, 200
+
+    except Exception as e:
+        db.session.rollback()
+        return {"error": f"{label} 비활성화 실패: {str(e)}"}, 500
+
+def _reactivate(model, row_id):
+    """model 행 활성화 + 같이 비활성화됐던 직원 행 복구 (상대 쪽도 활성인 직원만)"""
+    label, particle = LABELS[model]
+    try:
+        row = db.session.query(model.is_active, model.deactivated_at) \
+            .filter(model.id == row_id).first()
+        if not row:
+            return {"error": f"존재하지 않는 {label}입니다"}, 404
+
+        restored = 0
+        if not row.is_active:
+            _set_rows(model, (model.id == row_id,), is_active=True, deactivated_at=None)
+            if model in CASCADES and row.deactivated_at is not None:
+                fk, other_fk, other = CASCADES[model]
+                restored = _set_rows(Employee, (
+                    fk == row_id,
+                    Employee.is_active.is_(False),
+                    Employee.deactivated_at == row.deactivated_at,
+                    exists().where(other.id == other_fk, other.is_active.is_(True))
+                ), is_active=True, deactivated_at=None)
+            db.session.commit()
+
+        response = {"message": f"{label}{particle} 활성화되었습니다", "id": row_id}
+        if model in CASCADES:
+            response["reactivated_employees"] = restored
+        return response, 200
+
+    except Exception as e:
+        db.session.rollback()
+        return {"error": f"{label} 활성화 실패: {str(e)}"}, 500
+
+def deactivate_user(user_id):
+    """사용자 비활성화 (근무 중인 직원 행도 함께)"""
+    return _deactivate(User, user_id)
+
+def reactivate_user(user_id):
+    """사용자 활성화 (함께 비활성화됐던 직원 행도 복구)"""
+    return _reactivate(User, user_id)
+
+def deactivate_store(store_id):
+    """가게 비활성화 (소속 직원 행도 UPDATE 한 번으로 함께)"""
+    return _deactivate(Store, store_id)
+
+def reactivate_store(store_id):
+    """가게 활성화 (함께 비활성화됐던 직원 행도 복구)"""
+    return _reactivate(Store, store_id)
+
+def deactivate_employee(employee_id):
+    """직원 비활성화"""
+    return _deactivate(Employee, employee_id)
+
+def reactivate_employee(employee_id):
+    """직원 활성화 (사용자와 가게가 모두 활성이어야 함)"""
+    row = db.session.query(Employee.user_id, Employee.store_id) \
+        .filter(Employee.id == employee_id).first()
+    if row and not (get_user_summary(row.user_id) and get_store_summary(row.store_id)):
+        return {"error": "비활성 사용자나 가게의 직원은 활성화할 수 없습니다"}, 400
+    return _reactivate(Employee, employee_id)
+
+def archive_inactive(cutoff, batch_size=1000):
+    """cutoff 이전에 비활성화된 행을 보관 테이블로 이동 ({테이블: 행 수})
+
+    직원을 먼저 옮기고, 사용자 / 가게는 남은 직원 행이 없을 때만 옮긴다.
+    """
+    def inactive(model):
+        return [model.is_active.is_(False), model.deactivated_at < cutoff]
+
+    return {
+        "employees": archive_rows(db.session, Employee, employees_archive,
+                                  inactive(Employee), batch_size),
+        "users": archive_rows(db.session, User, users_archive, inactive(User) + [
+            ~exists().where(Employee.user_id == User.id)
+        ], batch_size),
+        "stores": archive_rows(db.session, Store, stores_archive, inactive(Store) + [
+            ~exists().where(Employee.store_id == Store.id)
+        ], batch_size)
+    }
+
+def page_key(after, limit, fields):
+    """목록 캐시 키 (동기/비동기 라우트가 같은 키를 쓴다)"""
+    return f"{after}:{limit}:{','.join(fields)}"
+
+def store_employees_key(store_id, position, after, limit, fields):
+    """가게별 직원 명단 캐시 키"""
+    return f"stores/{store_id}:{position and position.name}:{page_key(after, limit, fields)}"
+
+def user_stores_key(user_id, position, after, limit, fields):
+    """사용자별 근무 가게 캐시 키"""
+    return f"users/{user_id}:{position and position.name}:{page_key(after, limit, fields)}"
+
+def get_all_users(after=None, limit=DEFAULT_LIMIT, fields=USER_FIELDS):
+    """사용자 목록 조회 (id 커서 기반 페이지, 캐시 경유)"""
+    def load():
+        user_list, next_cursor = keyset_page(
+            User.query.filter_by(is_active=True), User.id,
+            USER_FIELDS, fields, after, limit
+        )
+        return {
+            "message": "사용자 목록 조회 성공",
+            "users": user_list,
+            "count": len(user_list),
+            "next_cursor": next_cursor
+        }
+    return cache.get_or_load('users', page_key(after, limit, fields), load)
+
+def get_all_stores(after=None, limit=DEFAULT_LIMIT, fields=STORE_FIELDS):
+    """가게 목록 조회 (id 커서 기반 페이지, 캐시 경유)"""
+    def load():
+        store_list, next_cursor = keyset_page(
+            Store.query.filter_by(is_active=True), Store.id,
+            STORE_FIELDS, fields, after, limit
+        )
+        return {
+            "message": "가게 목록 조회 성공",
+            "stores": store_list,
+            "count": len(store_list),
+            "next_cursor": next_cursor
+        }
+    return cache.get_or_load('stores', page_key(after, limit, fields), load)
+
+def get_store_stats(after=None, limit=DEFAULT_LIMIT, fields=STORE_STATS_FIELDS):
+    """가게별 직급 인원 (store_stats 집계 행만 읽음, 캐시 경유)
+
+    첫 페이지에는 전체 합계도 함께 반환한다.
+    """
+    def load():
+        query = Store.query.filter_by(is_active=True) \
+            .outerjoin(StoreStat, StoreStat.store_id == Store.id).group_by(Store.id)
+        store_list, next_cursor = keyset_page(
+            query, Store.id, STORE_STATS_FIELDS, fields, after, limit
+        )
+        payload = {
+            "message": "가게별 인원 집계 조회 성공",
+            "stores": store_list,
+            "count": len(store_list),
+            "next_cursor": next_cursor
+        }
+        if after is None:
+            totals = dict(db.session.query(StoreStat.position, func.sum(StoreStat.headcount))
+                          .join(Store, Store.id == StoreStat.store_id)
+                          .filter(Store.is_active.is_(True))
+                          .group_by(StoreStat.position).all())
+            payload["totals"] = {
+                "managers": totals.get(PositionEnum.MANAGER) or 0,
+                "staff": totals.get(PositionEnum.STAFF) or 0,
+                "total": sum(v or 0 for v in totals.values())
+            }
+        return payload
+    return cache.get_or_load('employees', f"stores/stats:{page_key(after, limit, fields)}", load)
+
+def active_employee_query(fields=EMPLOYEE_FIELDS, spec=EMPLOYEE_FIELDS, query=None):
+    """선택한 필드에 필요한 테이블만 JOIN 한 활성 직원 쿼리
+
+    query 에 select(Employee.id) 를 넘기면 같은 조건의 Core SELECT 를 만든다 (비동기 라우트용)
+    """
+    tables = spec_tables(spec, fields)
+    query = (Employee.query if query is None else query).filter_by(is_active=True)
+    if User.__table__ in tables:
+        query = query.join(User, Employee.user_id == User.id)
+    if Store.__table__ in tables:
+        query = query.join(Store, Employee.store_id == Store.id)
+    return query
+
+def get_all_employees(after=None, limit=DEFAULT_LIMIT, fields=EMPLOYEE_FIELDS):
+    """직원 목록 조회 (필요한 테이블만 JOIN 한 단일 쿼리, 캐시 경유)"""
+    def load():
+        employee_list, next_cursor = keyset_page(
+            active_employee_query(fields), Employee.id,
+            EMPLOYEE_FIELDS, fields, after, limit
+        )
+        return {
+            "message": "직원 목록 조회 성공",
+            "employees": employee_list,
+            "count": len(employee_list),
+            "next_cursor": next_cursor
+        }
+    return cache.get_or_load('employees', page_key(after, limit, fields), load)
+
+def get_store_employees(store_id, position=None, after=None, limit=DEFAULT_LIMIT,
+                        fields=EMPLOYEE_FIELDS):
+    """가게별 직원 명단 ((store_id, is_active) 인덱스를 타는 단일 쿼리)"""
+    store = get_store_summary(store_id)
+    if not store:
+        return {"error": "존재하지 않는 가게입니다"}, 404
+
+    def load():
+        query = active_employee_query(fields).filter(Employee.store_id == store_id)
+        if position:
+            query = query.filter(Employee.type == position)
+        employee_list, next_cursor = keyset_page(
+            query, Employee.id, EMPLOYEE_FIELDS, fields, after, limit
+        )
+        return {
+            "message": "가게 직원 목록 조회 성공",
+            "store": store,
+            "employees": employee_list,
+            "count": len(employee_list),
+            "next_cursor": next_cursor
+        }
+
+    key = store_employees_key(store_id, position, after, limit, fields)
+    return cache.get_or_load('employees', key, load), 200
+
+def get_user_stores(user_id, position=None, after=None, limit=DEFAULT_LIMIT,
+                    fields=USER_STORE_FIELDS):
+    """사용자별 근무 가게 목록 ((user_id) 인덱스를 타는 단일 쿼리)"""
+    user = get_user_summary(user_id)
+    if not user:
+        return {"error": "존재하지 않는 사용자입니다"}, 404
+
+    def load():
+        query = active_employee_query(fields, USER_STORE_FIELDS) \
+            .filter(Employee.user_id == user_id)
+        if position:
+            query = query.filter(Employee.type == position)
+        store_list, next_cursor = keyset_page(
+            query, Employee.id, USER_STORE_FIELDS, fields, after, limit
+        )
+        return {
+            "message": "사용자 근무 가게 목록 조회 성공",
+            "user": user,
+            "stores": store_list,
+            "count": len(store_list),
+            "next_cursor": next_cursor
+        }
+
+    key = user_stores_key(user_id, position, after, limit, fields)
+    return cache.get_or_load('employees', key, load), 200
+
+# 검색 대상 사용자 컬럼 (FTS 가 없을 때 LIKE 접두어 검색)
+USER_SEARCH_COLUMNS = (User.email, User.first_name, User.last_name, User.contact)
+
+def search_key(terms, *filters):
+    """검색 캐시 키 (검색어와 필터 값)"""
+    return ':'.join([' '.join(terms)] + [getattr(f, 'name', str(f)) for f in filters])
+
+def search_users(terms, gender=None, active=True, after=None, limit=DEFAULT_LIMIT,
+                 fields=USER_FIELDS):
+    """사용자 검색 (SQLite 는 users_fts 를 rowid 순서로 읽어 limit 에서 멈춤)"""
+    def load():
+        query = User.query
+        id_column = User.id
+        if terms and has_fts(db.session):
+            query = query.join(users_fts, users_fts.c.rowid == User.id) \
+                .filter(fts_match(users_fts, terms))
+            id_column = users_fts.c.rowid
+        elif terms:
+            query = query.filter(*like_match(USER_SEARCH_COLUMNS, terms))
+        if gender:
+            query = query.filter(User.gender == gender)
+        if active is not None:
+            query = query.filter(User.is_active == active)
+
+        user_list, next_cursor = keyset_page(query, id_column, USER_FIELDS, fields, after, limit)
+        return {
+            "message": "사용자 검색 성공",
+            "users": user_list,
+            "count": len(user_list),
+            "next_cursor": next_cursor
+        }
+
+    key = f"search/{search_key(terms, gender, active)}:{page_key(after, limit, fields)}"
+    return cache.get_or_load('users', key, load)
+
+def search_employees(terms, position=None, store_id=None, gender=None, active=True,
+                     after=None, limit=DEFAULT_LIMIT, fields=EMPLOYEE_FIELDS):
+    """직원 검색 (검색어는 직원의 사용자 정보에 적용)
+
+    가게를 지정하면 (store_id, is_active) 인덱스로 그 가게 직원만 읽고 LIKE 로
+    거른다. 아니면 SQLite 는 employees_fts 를 직원 id 순서로 읽는다.
+    """
+    def load():
+        use_fts = bool(terms) and store_id is None and has_fts(db.session)
+        like_terms = terms if terms and not use_fts else []
+        tables = spec_tables(EMPLOYEE_FIELDS, fields)
+
+        query = Employee.query
+        id_column = Employee.id
+        if use_fts:
+            query = query.join(employees_fts, employees_fts.c.rowid == Employee.id) \
+                .filter(fts_match(employees_fts, terms))
+            id_column = employees_fts.c.rowid
+        if User.__table__ in tables or gender or like_terms:
+            query = query.join(User, Employee.user_id == User.id)
+        if Store.__table__ in tables:
+            query = query.join(Store, Employee.store_id == Store.id)
+
+        if like_terms:
+            query = query.filter(*like_match(USER_SEARCH_COLUMNS, like_terms))
+        if store_id is not None:
+            query = query.filter(Employee.store_id == store_id)
+        if position:
+            query = query.filter(Employee.type == position)
+        if gender:
+            query = query.filter(User.gender == gender)
+        if active is not None:
+            query = query.filter(Employee.is_active == active)
+
+        employee_list, next_cursor = keyset_page(
+            query, id_column, EMPLOYEE_FIELDS, fields, after, limit
+        )
+        return {
+            "message": "직원 검색 성공",
+            "employees": employee_list,
+            "count": len(employee_list),
+            "next_cursor": next_cursor
+        }
+
+    key = f"search/{search_key(terms, position, store_id, gender, active)}:{page_key(after, limit, fields)}"
+    return cache.get_or_load('employees', key, load)
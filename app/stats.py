@@ -0,0 +1,120 @@
+"""가게별 직급 인원 집계 (store_stats)
+
+store_stats 는 (store_id, position) 마다 활성 직원 수를 가진다.
+employees 의 INSERT / UPDATE(is_active, type, store_id) / DELETE 트리거가
+같은 트랜잭션 안에서 해당 행을 +1 / -1 하므로 ORM 등록, Core executemany
+일괄 등록, 가게 / 사용자 비활성화의 집합 UPDATE, 보관 DELETE 가 모두
+반영된다. 대시보드(GET /api/stores/stats) 는 직원 수와 관계없이 가게 수
+만큼의 작은 행만 읽는다.
+
+SQLite: 트리거 (UPSERT), 가게 행이 지워지면 집계 행도 삭제
+PostgreSQL: PL/pgSQL 트리거 함수 (가게 삭제는 FK ON DELETE CASCADE)
+
+집계가 어긋났다고 의심되면 flask rebuild-store-stats 로 GROUP BY 한 번에
+다시 만든다.
+"""
+import click
+from flask.cli import with_appcontext
+from sqlalchemy import delete, event, func, insert, select
+
+_SQLITE_DDL = [
+    "CREATE TRIGGER IF NOT EXISTS store_stats_insert AFTER INSERT ON employees "
+    "WHEN new.is_active BEGIN "
+    "INSERT INTO store_stats (store_id, position, headcount) VALUES (new.store_id, new.type, 1) "
+    "ON CONFLICT (store_id, position) DO UPDATE SET headcount = headcount + 1; END",
+    "CREATE TRIGGER IF NOT EXISTS store_stats_delete AFTER DELETE ON employees "
+    "WHEN old.is_active BEGIN "
+    "UPDATE store_stats SET headcount = headcount - 1 "
+    "WHERE store_id = old.store_id AND position = old.type; END",
+    "CREATE TRIGGER IF NOT EXISTS store_stats_update "
+    "AFTER UPDATE OF is_active, type, store_id ON employees BEGIN "
+    "UPDATE store_stats SET headcount = headcount - 1 "
+    "WHERE old.is_active AND store_id = old.store_id AND position = old.type; "
+    "INSERT INTO store_stats (store_id, position, headcount) "
+    "SELECT new.store_id, new.type, 1 WHERE new.is_active "
+    "ON CONFLICT (store_id, position) DO UPDATE SET headcount = headcount + 1; END",
+    "CREATE TRIGGER IF NOT EXISTS store_stats_store_delete AFTER DELETE ON stores BEGIN "
+    "DELETE FROM store_stats WHERE store_id = old.id; END"
+]
+
+_SQLITE_DROP = [
+    "DROP TRIGGER IF EXISTS store_stats_store_delete",
+    "DROP TRIGGER IF EXISTS store_stats_update",
+    "DROP TRIGGER IF EXISTS store_stats_delete",
+    "DROP TRIGGER IF EXISTS store_stats_insert"
+]
+
+_POSTGRESQL_DDL = [
+    "CREATE OR REPLACE FUNCTION store_stats_apply() RETURNS trigger AS $$ "
+    "BEGIN "
+    "IF TG_OP <> 'INSERT' THEN "
+    "IF OLD.is_active THEN "
+    "UPDATE store_stats SET headcount = headcount - 1 "
+    "WHERE store_id = OLD.store_id AND position = OLD.type; "
+    "END IF; "
+    "END IF; "
+    "IF TG_OP <> 'DELETE' THEN "
+    "IF NEW.is_active THEN "
+    "INSERT INTO store_stats (store_id, position, headcount) VALUES (NEW.store_id, NEW.type, 1) "
+    "ON CONFLICT (store_id, position) DO UPDATE SET headcount = store_stats.headcount + 1; "
+    "END IF; "
+    "END IF; "
+    "RETURN NULL; "
+    "END $$ LANGUAGE plpgsql",
+    "DROP TRIGGER IF EXISTS employees_store_stats ON employees",
+    "CREATE TRIGGER employees_store_stats "
+    "AFTER INSERT OR DELETE OR UPDATE OF is_active, type, store_id ON employees "
+    "FOR EACH ROW EXECUTE FUNCTION store_stats_apply()"
+]
+
+_POSTGRESQL_DROP = [
+    "DROP TRIGGER IF EXISTS employees_store_stats ON employees",
+    "DROP FUNCTION IF EXISTS store_stats_apply()"
+]
+
+
+def store_stats_ddl(dialect_name):
+    """집계 트리거를 만드는 SQL 목록 (employees / stores / store_stats 테이블이 있어야 함)"""
+    if dialect_name == 'sqlite':
+        return list(_SQLITE_DDL)
+    if dialect_name == 'postgresql':
+        return list(_POSTGRESQL_DDL)
+    return []
+
+
+def install_store_stats(metadata):
+    """create_all / drop_all 때 집계 트리거도 함께 만들고 지우도록 등록"""
+    @event.listens_for(metadata, 'after_create')
+    def create_store_stats_triggers(target, connection, **kw):
+        for statement in store_stats_ddl(connection.dialect.name):
+            connection.exec_driver_sql(statement)
+
+    @event.listens_for(metadata, 'before_drop')
+    def drop_store_stats_triggers(target, connection, **kw):
+        drops = {'sqlite': _SQLITE_DROP, 'postgresql': _POSTGRESQL_DROP}
+        for statement in drops.get(connection.dialect.name, []):
+            connection.exec_driver_sql(statement)
+
+
+def rebuild_store_stats(session, stat_model, employee_model):
+    """store_stats 를 활성 직원 GROUP BY 한 번으로 다시 만들고 집계 행 수 반환 (커밋은 호출한 쪽)"""
+    session.execute(delete(stat_model).execution_options(synchronize_session=False))
+    result = session.execute(insert(stat_model).from_select(
+        ['store_id', 'position', 'headcount'],
+        select(employee_model.store_id, employee_model.type, func.count())
+        .where(employee_model.is_active.is_(True))
+        .group_by(employee_model.store_id, employee_model.type)
+    ))
+    return result.rowcount
+
+
+@click.command('rebuild-store-stats')
+@with_appcontext
+def rebuild_command():
+    """가게별 직급 인원 집계를 직원 테이블에서 다시 계산"""
+    from . import db
+    from .models import Employee, StoreStat
+
+    count = rebuild_store_stats(db.session, StoreStat, Employee)
+    db.session.commit()
+    click.echo(f"{count}개의 집계 행을 다시 만들었습니다")
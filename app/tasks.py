@@ -0,0 +1,43 @@
+"""작업 큐에서 실행하는 후속 작업
+
+쓰기 API 가 같은 트랜잭션에서 jobs.enqueue(...) 로 넣고, 작업자(스레드 / flask
+jobs-worker)가 실행한다. 작업 함수는 payload 를 키워드 인자로 받고, 반환값은
+작업 결과로 저장된다 (GET /api/jobs/<id>).
+
+웹훅: WEBHOOK_URL 이 설정되어 있으면 가입 / 직원 등록이 커밋될 때 이벤트를
+그 주소로 JSON POST 한다 (급여 / 인사 시스템 연동 등). 외부 서버가 느리거나
+죽어 있어도 쓰기 응답은 기다리지 않고, 연결 오류나 2xx 가 아닌 응답은 작업
+큐의 재시도 규칙대로 다시 보낸다. 재시도 때문에 같은 이벤트가 두 번 갈 수
+있으므로 받는 쪽은 X-Event-Id 헤더로 중복을 거른다.
+
+설정 (app.config)
+    WEBHOOK_URL: 이벤트를 받을 주소 (None 이면 작업을 넣지 않음)
+    WEBHOOK_TIMEOUT: 요청 한 번의 제한 시간 (초, 기본 5)
+"""
+import json
+import urllib.request
+import uuid
+
+from flask import current_app
+
+from . import jobs
+
+
+def notify(event, **data):
+    """WEBHOOK_URL 이 있으면 웹훅 작업을 현재 세션에 추가하고 반환 (없으면 None)"""
+    if not current_app.config.get('WEBHOOK_URL'):
+        return None
+    return jobs.enqueue('notify_webhook', event=event, event_id=uuid.uuid4().hex, data=data)
+
+
+@jobs.task('notify_webhook')
+def notify_webhook(event, event_id, data):
+    """이벤트를 WEBHOOK_URL 로 POST (2xx 가 아니면 예외 → 재시도)"""
+    request = urllib.request.Request(
+        current_app.config['WEBHOOK_URL'],
+        data=json.dumps({"event": event, "data": data}, ensure_ascii=False).encode(),
+        headers={"Content-Type": "application/json", "X-Event-Id": event_id},
+        method='POST'
+    )
+    with urllib.request.urlopen(request, timeout=current_app.config.get('WEBHOOK_TIMEOUT', 5)) as response:
+        return {"status": response.status}
@@ -0,0 +1,111 @@
+"""테이블 버전 관리와 조건부 GET (ETag / Last-Modified)
+
+쓰기 트랜잭션이 커밋될 때 변경된 테이블의 버전 행을 같은 트랜잭션 안에서
+올린다. 목록 API 는 버전 행만 읽어서 ETag 를 만들고, If-None-Match 가
+일치하면 행 조회나 JSON 직렬화 없이 304 를 돌려준다. 뷰는 그 버전을
+캐시 키 범위(cache.key_scope) 로 두고 실행되므로, 캐시된 본문은 항상 같은
+ETag 의 것이다.
+"""
+from datetime import datetime, timezone
+from functools import wraps
+import zlib
+
+from flask import current_app, make_response, request
+from sqlalchemy import event, insert, update
+
+from .cache import key_scope
+from .changes import changed_tables, track_changes
+
+
+def _utcnow():
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class TableVersions:
+    """테이블별 버전 카운터 + 조건부 GET 데코레이터"""
+
+    def __init__(self):
+        self.session = None
+        self.table = None
+
+    def watch(self, session, model, tables):
+        """model: (table_name, version, updated_at) 컬럼을 가진 버전 모델
+        tables: 버전을 관리할 테이블 이름 목록
+        """
+        self.session = session
+        self.table = model.__table__
+        tracked = set(tables)
+        track_changes(session)
+
+        @event.listens_for(self.table, 'after_create')
+        def seed(target, connection, **kw):
+            connection.execute(insert(target), [
+                {"table_name": name, "version": 0, "updated_at": _utcnow()}
+                for name in tables
+            ])
+
+        @event.listens_for(session, 'before_commit')
+        def before_commit(sess):
+            # 커밋 직전 flush 까지 끝내고 변경된 테이블 버전을 같은 트랜잭션에서 올림
+            sess.flush()
+            names = changed_tables(sess) & tracked
+            if names:
+                sess.connection().execute(
+                    update(self.table)
+                    .where(self.table.c.table_name.in_(names))
+                    .values(version=self.table.c.version + 1, updated_at=_utcnow())
+                )
+
+    def validators(self, tables):
+        """(ETag, Last-Modified) 계산 - 버전 행이 없으면 (None, None)"""
+        rows = self.session.execute(
+            self.table.select().where(self.table.c.table_name.in_(tables))
+        ).all()
+        return self._validators(rows, tables)
+
+    async def validators_async(self, connection, tables):
+        """validators 의 비동기 버전 (connection: AsyncConnection)"""
+        result = await connection.execute(
+            self.table.select().where(self.table.c.table_name.in_(tables))
+        )
+        return self._validators(result.all(), tables)
+
+    @staticmethod
+    def _validators(rows, tables):
+        if len(rows) != len(tables):
+            return None, None
+
+        versions = {row.table_name: row.version for row in rows}
+        etag = '-'.join(f"{name}{versions[name]}" for name in tables)
+        last_modified = max(row.updated_at for row in rows).replace(tzinfo=timezone.utc)
+        return etag, last_modified
+
+    @staticmethod
+    def query_etag(etag, query_string):
+        """같은 테이블 버전이라도 쿼리스트링이 다르면 다른 응답"""
+        return f"{etag}-{zlib.crc32(query_string):08x}"
+
+    def conditional(self, *tables):
+        """If-None-Match 가 현재 ETag 와 같으면 뷰를 실행하지 않고 304 반환"""
+        def decorator(view):
+            @wraps(view)
+            def wrapper(*args, **kwargs):
+                etag, last_modified = self.validators(tables)
+                if etag is None:
+                    return view(*args, **kwargs)
+
+                scope = etag
+                etag = self.query_etag(etag, request.query_string)
+                if request.if_none_match.contains_weak(etag):
+                    response = current_app.response_class(status=304)
+                else:
+                    with key_scope(scope):
+                        response = make_response(view(*args, **kwargs))
+                    if response.status_code != 200:
+                        return response
+
+                response.set_etag(etag, weak=True)
+                response.last_modified = last_modified
+                return response
+            return wrapper
+        return decorator
@@ -0,0 +1,16 @@
+"""운영 서버(ASGI) 진입점 - 목록 조회 API 를 asyncio 엔진으로 처리
+
+    uvicorn asgi:app --workers 4
+    gunicorn -k uvicorn.workers.UvicornWorker asgi:app
+
+사용자/가게/직원 목록과 가게별·사용자별 목록(app/async_routes.py) 은 이벤트
+루프에서 비동기로 처리하고 (SQLite: aiosqlite, PostgreSQL: asyncpg), 나머지
+경로는 WSGI 앱 (app.create_app) 이 그대로 처리한다. 응답 JSON, ETag, 캐시 키는
+동기 라우트와 같다.
+"""
+from app import create_app, db
+from app.asgi import AsyncApp
+from app.async_routes import routes
+
+flask_app = create_app()
+app = AsyncApp(flask_app, db, routes)
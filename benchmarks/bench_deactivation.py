@@ -0,0 +1,118 @@
+"""비활성화 / 보관 벤치마크
+
+사용법:
+    python benchmarks/bench_deactivation.py [직원 수 (기본 1000000)] [--batch-size 1000]
+
+사용자 N / 10 명, 가게 N / 2000 곳(가게당 직원 약 2000명), 직원 N 명을 채운 뒤
+    1) 가게 비활성화: 직원 행을 ORM 으로 불러와 하나씩 바꾸는 방식 vs
+       deactivate_store() 의 UPDATE 한 번 (가게마다 다른 가게로 측정)
+    2) 보관: 가게 30% 를 비활성화한 뒤 archive_inactive() 로 옮기는 시간과
+       행/초, 보관 전후 employees 테이블 / 인덱스 크기와 목록 쿼리 지연시간
+을 JSON 으로 출력한다.
+"""
+import argparse
+import json
+import os
+import statistics
+import tempfile
+import time
+from datetime import timedelta
+
+from sqlalchemy import text
+
+from common import db, make_app, models, seed, services
+
+REPEAT = 5
+
+
+def deactivate_per_row(store_id):
+    """비교용: 직원 객체를 모두 불러와 하나씩 비활성화"""
+    now = services._utcnow()
+    store = db.session.get(models.Store, store_id)
+    store.is_active, store.deactivated_at = False, now
+    for employee in models.Employee.query.filter_by(store_id=store_id, is_active=True):
+        employee.is_active, employee.deactivated_at = False, now
+    db.session.commit()
+
+
+def timed(fn, *args):
+    started = time.perf_counter()
+    fn(*args)
+    return (time.perf_counter() - started) * 1000
+
+
+def table_kb(table):
+    """table 과 그 인덱스가 차지하는 크기 KB (dbstat)"""
+    return db.session.execute(text(
+        "SELECT sum(pgsize) / 1024 FROM dbstat WHERE name = :t OR name IN "
+        "(SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = :t)"
+    ), {"t": table}).scalar()
+
+
+def list_latency(client, count):
+    timings = []
+    for i in range(20):
+        started = time.perf_counter()
+        client.get(f"/api/employees?after={count * i // 20}&limit=100")
+        timings.append((time.perf_counter() - started) * 1000)
+    return round(statistics.median(timings), 3)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('employees', nargs='?', type=int, default=1000000)
+    parser.add_argument('--batch-size', type=int, default=1000)
+    args = parser.parse_args()
+
+    count = args.employees
+    users, stores = max(1, count // 10), max(2 * REPEAT + 1, count // 2000)
+    with tempfile.TemporaryDirectory() as tmp:
+        app = make_app(os.path.join(tmp, 'bench.db'), CACHE_BACKEND='null')
+        client = app.test_client()
+        with app.app_context():
+            seed(users, stores, count)
+
+            per_row = [timed(deactivate_per_row, store_id) for store_id in range(1, REPEAT + 1)]
+            set_based = [timed(services.deactivate_store, store_id)
+                         for store_id in range(REPEAT + 1, 2 * REPEAT + 1)]
+            roster = db.session.query(models.Employee).filter_by(store_id=1).count()
+
+            # 가게 30% 비활성화 (직원 약 30%)
+            for store_id in range(2 * REPEAT + 1, stores + 1):
+                if store_id % 10 < 3:
+                    services.deactivate_store(store_id)
+            inactive = db.session.query(models.Employee).filter_by(is_active=False).count()
+            db.session.execute(text("ANALYZE"))
+            before = {"employees_kb": table_kb('employees'), "list_p50_ms": list_latency(client, count)}
+
+            started = time.perf_counter()
+            moved = services.archive_inactive(services._utcnow() + timedelta(seconds=1), args.batch_size)
+            elapsed = time.perf_counter() - started
+            db.session.commit()
+            with db.engine.connect().execution_options(isolation_level='AUTOCOMMIT') as conn:
+                conn.exec_driver_sql("VACUUM")
+            after = {"employees_kb": table_kb('employees'), "list_p50_ms": list_latency(client, count)}
+
+    print(json.dumps({
+        "employees": count,
+        "users": users,
+        "stores": stores,
+        "store_deactivation": {
+            "employees_per_store": roster,
+            "per_row_orm_ms": round(statistics.median(per_row), 2),
+            "set_based_update_ms": round(statistics.median(set_based), 2)
+        },
+        "archive": {
+            "batch_size": args.batch_size,
+            "inactive_employees": inactive,
+            "moved": moved,
+            "seconds": round(elapsed, 2),
+            "rows_per_second": round(sum(moved.values()) / elapsed) if elapsed else None,
+            "before": before,
+            "after_vacuum": after
+        }
+    }, ensure_ascii=False, indent=2))
+
+
+if __name__ == '__main__':
+    main()
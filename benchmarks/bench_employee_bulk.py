@@ -0,0 +1,53 @@
+"""직원 등록 벤치마크: POST /api/employees 를 N번 vs POST /api/employees/bulk 1번
+
+사용법:
+    python benchmarks/bench_employee_bulk.py [직원 수]
+
+결과는 JSON 으로 출력한다.
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+
+from common import make_app, models, seed
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    position = models.PositionEnum.STAFF.value
+
+    with tempfile.TemporaryDirectory() as tmp:
+        app = make_app(os.path.join(tmp, 'bench.db'))
+        with app.app_context():
+            seed(count, 2, 0)
+        client = app.test_client()
+
+        started = time.perf_counter()
+        for user_id in range(1, count + 1):
+            response = client.post('/api/employees', json={
+                "user_id": user_id, "store_id": 1, "type": position
+            })
+            assert response.status_code == 201, response.get_json()
+        per_row = time.perf_counter() - started
+
+        started = time.perf_counter()
+        response = client.post('/api/employees/bulk', json={
+            "store_id": 2,
+            "employees": [{"user_id": user_id, "type": position}
+                          for user_id in range(1, count + 1)]
+        })
+        bulk = time.perf_counter() - started
+        assert response.status_code == 201, response.get_json()
+
+    print(json.dumps({
+        "employees": count,
+        "per_row_seconds": round(per_row, 4),
+        "bulk_seconds": round(bulk, 4),
+        "speedup": round(per_row / bulk, 1)
+    }, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,234 @@
+"""API 엔드포인트 부하 / 마이크로 벤치마크
+
+사용법:
+    python benchmarks/bench_endpoints.py [--scales 1000,100000,1000000]
+                                         [--requests 200] [--concurrency 8]
+                                         [--no-server] [--output result.json]
+
+규모(scale)마다 임시 SQLite DB 에 사용자 scale 명, 가게 scale / 200 곳,
+직원 min(scale, 800000) 명을 채운 뒤 앱의 모든 엔드포인트를
+    1) Flask 테스트 클라이언트로 순차 실행
+    2) 실제 WSGI 서버(werkzeug, 스레드) 에 HTTP 로 동시 실행
+해서 처리량, p50/p95/p99 지연시간, 요청당 SQL 수를 JSON 으로 출력한다.
+직원 등록은 seed 와 앞 단계에서 쓰지 않은 (사용자, 가게) 쌍만 보내므로 중복
+거절(400) 이 아니라 실제 등록 경로를 잰다.
+"""
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+import json
+import os
+import random
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+
+from sqlalchemy import event
+from werkzeug.serving import WSGIRequestHandler, make_server
+
+from common import db, make_app, models, seed, seeded_stores
+
+MAX_EMPLOYEES = 800000      # 직원번호 공간(900000) 안에서 신규 등록 여유를 남김
+
+
+def scenarios(ctx):
+    """(이름, 메서드, 경로 함수, 본문 함수, 반복 비율) 목록"""
+    rng = random.Random(7 + ctx["run"])     # 단계마다 다른 순서
+    position = models.PositionEnum.STAFF.value
+
+    def random_user(i):
+        return rng.randint(1, ctx["users"])
+
+    def random_store(i):
+        return rng.randint(1, ctx["stores"])
+
+    def new_users(store_id, count):
+        """store_id 에 아직 등록되지 않은 사용자 count 명 (WSGI 단계는 여러 스레드에서 호출)"""
+        picked = []
+        with ctx["lock"]:
+            while len(picked) < count:
+                user_id = random_user(None)
+                if (user_id, store_id) in ctx["registered"] or \
+                        store_id in seeded_stores(user_id, ctx["users"], ctx["stores"], ctx["employees"]):
+                    continue
+                ctx["registered"].add((user_id, store_id))
+                picked.append(user_id)
+        return picked
+
+    def new_employee(i):
+        store_id = random_store(i)
+        return {"user_id": new_users(store_id, 1)[0], "store_id": store_id, "type": position}
+
+    def new_employees_bulk(i):
+        store_id = random_store(i)
+        return {"store_id": store_id,
+                "employees": [{"user_id": user_id, "type": position} for user_id in new_users(store_id, 20)]}
+
+    return [
+        ("home", "GET", lambda i: "/", None, 0.5),
+        ("api_home", "GET", lambda i: "/api", None, 0.5),
+        ("list_users", "GET", lambda i: "/api/users", None, 1),
+        ("list_users_mid_page", "GET", lambda i: f"/api/users?after={ctx['users'] // 2}&limit=100", None, 1),
+        ("list_stores", "GET", lambda i: "/api/stores", None, 1),
+        ("list_employees", "GET", lambda i: "/api/employees", None, 1),
+        ("list_employees_projected", "GET",
+         lambda i: f"/api/employees?after={ctx['employees'] // 2}&fields=id,employee_code,position", None, 1),
+        ("store_roster", "GET", lambda i: f"/api/stores/{random_store(i)}/employees", None, 1),
+        ("user_stores", "GET", lambda i: f"/api/users/{random_user(i)}/stores", None, 1),
+        ("export_stores", "GET", lambda i: "/api/export/stores", None, 0.05),
+        ("export_employees", "GET", lambda i: "/api/export/employees", None, 0.01),
+        ("create_store", "POST", lambda i: "/api/stores",
+         lambda i: {"name": f"신규매장{i}"}, 0.5),
+        ("register_employee", "POST", lambda i: "/api/employees", new_employee, 0.5),
+        ("register_employees_bulk", "POST", lambda i: "/api/employees/bulk", new_employees_bulk, 0.1),
+        # PBKDF2 해시 비용 때문에 가입은 적게 실행
+        ("signup_user", "POST", lambda i: "/api/users/signup",
+         lambda i: {"last_name": "부하", "email": f"load-{ctx['run']}-{i}@example.com",
+                    "password": "pw", "gender": models.GenderEnum.MALE.value}, 0.02),
+        ("signup_users_bulk", "POST", lambda i: "/api/users/bulk",
+         lambda i: [{"last_name": "부하", "email": f"bulk-{ctx['run']}-{i}-{n}@example.com",
+                     "password": "pw", "gender": models.GenderEnum.MALE.value} for n in range(5)], 0.01),
+        ("hashing_metrics", "GET", lambda i: "/api/metrics/hashing", None, 0.2),
+        ("cache_metrics", "GET", lambda i: "/api/metrics/cache", None, 0.2),
+    ]
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def summarize(latencies, elapsed, queries, statuses):
+    return {
+        "requests": len(latencies),
+        "throughput_rps": round(len(latencies) / elapsed, 1) if elapsed else None,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+        "queries_per_request": round(queries / len(latencies), 2),
+        "statuses": sorted(set(statuses))
+    }
+
+
+class QueryCounter:
+    def __init__(self, engine):
+        self.count = 0
+        self._lock = threading.Lock()
+        event.listen(engine, 'before_cursor_execute', self._count)
+
+    def _count(self, *args):
+        with self._lock:
+            self.count += 1
+
+
+def iterations(requests, weight):
+    return max(1, int(requests * weight))
+
+
+def bench_test_client(app, ctx, counter, requests):
+    client = app.test_client()
+    results = {}
+    for name, method, path, body, weight in scenarios(ctx):
+        latencies, statuses = [], []
+        before = counter.count
+        started = time.perf_counter()
+        for i in range(iterations(requests, weight)):
+            t0 = time.perf_counter()
+            response = client.open(path(i), method=method, json=body(i) if body else None)
+            response.get_data()
+            latencies.append(time.perf_counter() - t0)
+            statuses.append(response.status_code)
+        elapsed = time.perf_counter() - started
+        results[name] = summarize(latencies, elapsed, counter.count - before, statuses)
+    return results
+
+
+class QuietHandler(WSGIRequestHandler):
+    def log_request(self, *args, **kwargs):
+        pass
+
+
+def bench_wsgi(app, ctx, counter, requests, concurrency):
+    server = make_server('127.0.0.1', 0, app, threaded=True, request_handler=QuietHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base = f"http://127.0.0.1:{server.server_port}"
+
+    def call(method, url, payload):
+        data = json.dumps(payload).encode() if payload is not None else None
+        req = urllib.request.Request(url, data=data, method=method,
+                                     headers={"Content-Type": "application/json"})
+        t0 = time.perf_counter()
+        try:
+            with urllib.request.urlopen(req) as response:
+                response.read()
+                status = response.status
+        except urllib.error.HTTPError as e:
+            e.read()
+            status = e.code
+        return time.perf_counter() - t0, status
+
+    results = {}
+    try:
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            for name, method, path, body, weight in scenarios(ctx):
+                count = iterations(requests, weight)
+                before = counter.count
+                started = time.perf_counter()
+                outcomes = list(pool.map(
+                    lambda i: call(method, base + path(i), body(i) if body else None), range(count)
+                ))
+                elapsed = time.perf_counter() - started
+                results[name] = summarize([o[0] for o in outcomes], elapsed,
+                                          counter.count - before, [o[1] for o in outcomes])
+    finally:
+        server.shutdown()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scales', default='1000,100000,1000000')
+    parser.add_argument('--requests', type=int, default=200, help='시나리오당 기본 요청 수')
+    parser.add_argument('--concurrency', type=int, default=8, help='WSGI 서버 동시 요청 수')
+    parser.add_argument('--no-server', action='store_true', help='WSGI 서버 실행 생략')
+    parser.add_argument('--cache', default='null', help="CACHE_BACKEND (기본 null = DB 경로 측정)")
+    parser.add_argument('--hash-executor', default='process', help='PASSWORD_HASH_EXECUTOR')
+    parser.add_argument('--output', help='결과 JSON 저장 경로 (기본: 표준 출력)')
+    args = parser.parse_args()
+
+    report = {"config": vars(args), "scales": {}}
+    for scale in [int(s) for s in args.scales.split(',')]:
+        with tempfile.TemporaryDirectory() as tmp:
+            app = make_app(os.path.join(tmp, 'bench.db'), CACHE_BACKEND=args.cache,
+                           PASSWORD_HASH_EXECUTOR=args.hash_executor)
+            ctx = {"users": scale, "stores": max(1, scale // 200),
+                   "employees": min(scale, MAX_EMPLOYEES), "run": 0,
+                   "registered": set(), "lock": threading.Lock()}
+
+            started = time.perf_counter()
+            with app.app_context():
+                seed(ctx["users"], ctx["stores"], ctx["employees"])
+                counter = QueryCounter(db.engine)
+            seeded = time.perf_counter() - started
+
+            result = {"seed_seconds": round(seeded, 2),
+                      **{k: ctx[k] for k in ("users", "stores", "employees")}}
+            result["test_client"] = bench_test_client(app, ctx, counter, args.requests)
+            if not args.no_server:
+                ctx["run"] = 1
+                result["wsgi"] = bench_wsgi(app, ctx, counter, args.requests, args.concurrency)
+            report["scales"][str(scale)] = result
+
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output + '\n')
+    else:
+        print(output)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+"""인덱스 벤치마크: 인덱스 없을 때 vs 있을 때 쿼리 계획과 지연시간 비교
+
+사용법:
+    python benchmarks/bench_indexes.py [직원 수 (기본 1000000)]
+
+사용자/가게/직원을 합성 데이터로 채운 SQLite DB 를 만들고, 모델에 선언된
+인덱스를 지운 상태와 다시 만든 상태에서 핫 패스 쿼리를 실행해 비교한다.
+결과는 JSON 으로 출력한다.
+"""
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+from sqlalchemy import text
+
+from common import db, make_app, models, seed, services
+
+REPEAT = 20
+
+
+def hot_queries(count, users, stores):
+    """(이름, Query) 목록 - 실제 API 가 만드는 쿼리와 같은 형태"""
+    fields = list(services.EMPLOYEE_FIELDS)
+    return [
+        ("employees_page", services.active_employee_query(fields)
+            .with_entities(models.Employee.id, models.Employee.code, models.User.last_name, models.Store.name)
+            .filter(models.Employee.id > count // 2)
+            .order_by(models.Employee.id).limit(100)),
+        ("employees_by_store", models.Employee.query
+            .filter_by(store_id=stores // 2, is_active=True)
+            .with_entities(models.Employee.id, models.Employee.code)),
+        ("employees_by_user", models.Employee.query
+            .filter_by(user_id=users // 2)
+            .with_entities(models.Employee.id, models.Employee.store_id)),
+        ("users_page", models.User.query.filter_by(is_active=True)
+            .with_entities(models.User.id, models.User.email)
+            .filter(models.User.id > users // 2)
+            .order_by(models.User.id).limit(100)),
+    ]
+
+
+def measure(queries):
+    dialect = db.engine.dialect
+    results = {}
+    for name, query in queries:
+        sql = str(query.statement.compile(dialect=dialect, compile_kwargs={"literal_binds": True}))
+        plan = [row[-1] for row in db.session.execute(text(f"EXPLAIN QUERY PLAN {sql}"))]
+
+        timings = []
+        for _ in range(REPEAT):
+            started = time.perf_counter()
+            query.all()
+            timings.append((time.perf_counter() - started) * 1000)
+        results[name] = {
+            "plan": plan,
+            "p50_ms": round(statistics.median(timings), 3),
+            "max_ms": round(max(timings), 3)
+        }
+    return results
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+
+    with tempfile.TemporaryDirectory() as tmp:
+        app = make_app(os.path.join(tmp, 'bench.db'))
+        users, stores = max(1, count // 10), max(1, count // 200)
+        with app.app_context():
+            # 비활성 행을 약 30% 섞어서 부분 인덱스 효과가 드러나게 함
+            seed(users, stores, count, inactive_ratio=0.3)
+
+            indexes = [index for model in (models.User, models.Store, models.Employee)
+                       for index in model.__table__.indexes]
+            for index in indexes:
+                index.drop(db.engine)
+            db.session.execute(text("ANALYZE"))
+            before = measure(hot_queries(count, users, stores))
+
+            for index in indexes:
+                index.create(db.engine)
+            db.session.execute(text("ANALYZE"))
+            after = measure(hot_queries(count, users, stores))
+
+    print(json.dumps({
+        "employees": count,
+        "users": users,
+        "stores": stores,
+        "indexes": [index.name for index in indexes],
+        "before": before,
+        "after": after
+    }, ensure_ascii=False, indent=2))
+
+
+if __name__ == '__main__':
+    main()
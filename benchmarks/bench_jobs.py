@@ -0,0 +1,129 @@
+"""작업 큐 벤치마크
+
+사용법:
+    python benchmarks/bench_jobs.py [직원 수 (기본 1000000)] [--requests 200] [--idle 10]
+
+사용자 N / 10, 가게 N / 2000 곳, 직원 N 명을 채운 뒤
+    1) 작업 시작 지연: 작업을 넣고 커밋한 뒤 같은 프로세스의 작업자가 끝낼
+       때까지의 시간 (커밋 시 깨우기)
+    2) 빈 큐 확인: 작업 없이 --idle 초 동안 작업자가 jobs 테이블에 보낸 SQL 수
+       (고정 간격 0.05 초 vs 0.05 초부터 두 배씩 늘리는 간격)
+    3) 작업자 처리량: 대기 작업 N 개를 작업자 1 / 4 개로 비우는 시간
+을 JSON 으로 출력한다. 작업은 가게 직원 명단 첫 페이지 조회 (bench_roster).
+"""
+import argparse
+import json
+import os
+import statistics
+import tempfile
+import time
+
+from sqlalchemy import event
+
+from common import db, make_app, seed
+from app import jobs
+from app.services import get_store_employees
+
+DRAIN = 2000
+
+
+@jobs.task('bench_roster')
+def bench_roster(store_id):
+    roster, status = get_store_employees(store_id)
+    return roster["count"] if status == 200 else None
+
+
+def percentile(timings, q):
+    return round(sorted(timings)[min(len(timings) - 1, int(len(timings) * q))], 2)
+
+
+def summary(timings):
+    return {"p50_ms": round(statistics.median(timings), 2), "p99_ms": percentile(timings, 0.99)}
+
+
+def pickup(app, requests):
+    """작업 하나를 넣고 커밋한 뒤 done 이 될 때까지의 ms 목록 (작업자 1개)"""
+    timings = []
+    with app.app_context():
+        jobs.start(app, 1)
+        time.sleep(0.5)     # 작업자가 빈 큐를 확인하고 기다리는 상태로
+        for i in range(requests):
+            started = time.perf_counter()
+            job = jobs.enqueue('bench_roster', store_id=i % 10 + 1)
+            db.session.commit()
+            while jobs.get(job.id)["status"] != 'done':
+                db.session.commit()
+                time.sleep(0.0005)
+            timings.append((time.perf_counter() - started) * 1000)
+        jobs.shutdown()
+    return timings
+
+
+def idle_queries(app, seconds, max_interval):
+    """작업 없이 seconds 초 동안 작업자 1개가 보낸 SQL 수"""
+    jobs.max_poll_interval = max_interval
+    statements = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        if 'jobs' in statement:
+            statements.append(statement)
+
+    with app.app_context():
+        engine = db.engine
+    event.listen(engine, 'before_cursor_execute', count)
+    jobs.start(app, 1)
+    time.sleep(seconds)
+    jobs.shutdown()
+    event.remove(engine, 'before_cursor_execute', count)
+    return len(statements)
+
+
+def drain(app, workers):
+    """bench_roster 작업 DRAIN 개를 넣고 작업자 workers 개로 모두 처리하는 데 걸린 초"""
+    with app.app_context():
+        for i in range(DRAIN):
+            jobs.enqueue('bench_roster', store_id=i % 10 + 1)
+        db.session.commit()
+        jobs.shutdown()
+        started = time.perf_counter()
+        jobs.start(app, workers)
+        while jobs.queue_stats()["queued"] or jobs.queue_stats()["running"]:
+            time.sleep(0.05)
+        elapsed = time.perf_counter() - started
+        jobs.shutdown()
+        return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('employees', nargs='?', type=int, default=1000000)
+    parser.add_argument('--requests', type=int, default=200)
+    parser.add_argument('--idle', type=float, default=10)
+    args = parser.parse_args()
+
+    count = args.employees
+    users, stores = max(1, count // 10), max(10, count // 2000)
+    with tempfile.TemporaryDirectory() as tmp:
+        app = make_app(os.path.join(tmp, 'bench.db'), JOBS_EXECUTOR='external', JOBS_POLL_INTERVAL=0.05)
+        with app.app_context():
+            seed(users, stores, count)
+
+        latency = pickup(app, args.requests)
+        fixed = idle_queries(app, args.idle, 0.05)
+        backoff = idle_queries(app, args.idle, app.config['JOBS_POLL_MAX_INTERVAL'])
+        one, four = drain(app, 1), drain(app, 4)
+
+    print(json.dumps({
+        "employees": count,
+        "pickup": {"requests": args.requests, **summary(latency)},
+        "idle_queries": {"seconds": args.idle, "fixed_interval": fixed, "backoff": backoff},
+        "drain": {
+            "jobs": DRAIN,
+            "workers_1_per_second": round(DRAIN / one),
+            "workers_4_per_second": round(DRAIN / four)
+        }
+    }, ensure_ascii=False, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,122 @@
+"""요청 한도 / 동시 실행 한도 벤치마크
+
+사용법:
+    python benchmarks/bench_limits.py [직원 수 (기본 100000)] [--abusers 16] [--rtt 0.05] [--seconds 10]
+
+사용자 N / 10, 가게 N / 2000 곳, 직원 N 명을 채운 뒤, 한 클라이언트가 연결
+--abusers 개로 POST /api/users/signup 을 (응답마다 왕복 시간 --rtt 초만 쉬고)
+계속 보내는 동안, 2 초 뒤부터 다른 한 클라이언트가 0.1 초마다
+GET /api/employees, 2 초마다 가입을 보낸다.
+요청 한도 / 동시 실행 한도를 끈 경우(off) 와 기본 설정(on) 에서
+    정상 클라이언트의 목록 / 가입 지연시간 p50 / p99
+    과다 클라이언트 요청의 상태 코드별 개수
+를 JSON 으로 출력한다. 비밀번호 해시는 thread 실행기 (CPU 코어 수).
+"""
+import argparse
+from collections import Counter
+import json
+import os
+import statistics
+import tempfile
+import threading
+import time
+
+from common import make_app, seed
+from app import create_app
+
+
+def summary(timings):
+    ordered = sorted(timings)
+    return {
+        "count": len(ordered),
+        "p50_ms": round(statistics.median(ordered), 2),
+        "p99_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))], 2)
+    }
+
+
+def run(path, args, limited, prefix):
+    config = {
+        'SQLALCHEMY_DATABASE_URI': f'sqlite:///{path}',
+        'PASSWORD_HASH_EXECUTOR': 'thread',
+        'JOBS_EXECUTOR': 'external'
+    }
+    if not limited:
+        config.update({'RATELIMIT_BACKEND': 'null', 'ADMISSION_LIMITS': {}})
+    app = create_app(config)
+    stop = threading.Event()
+    abuse = Counter()
+    lock = threading.Lock()
+
+    def signup(client, email, remote_addr):
+        return client.post('/api/users/signup', environ_base={'REMOTE_ADDR': remote_addr}, json={
+            "email": email, "password": "bench-password", "last_name": "벤치", "gender": "남성"
+        })
+
+    def abuser(n):
+        client = app.test_client()
+        i = 0
+        while not stop.is_set():
+            status = signup(client, f"{prefix}-abuse{n}-{i}@example.com", '10.0.0.66').status_code
+            with lock:
+                abuse[status] += 1
+            i += 1
+            time.sleep(args.rtt)
+
+    threads = [threading.Thread(target=abuser, args=(n,)) for n in range(args.abusers)]
+    for thread in threads:
+        thread.start()
+
+    time.sleep(2)
+    client = app.test_client()
+    lists, signups, statuses = [], [], Counter()
+    deadline = time.perf_counter() + args.seconds
+    i = 0
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        response = client.get('/api/employees?limit=100', environ_base={'REMOTE_ADDR': '10.0.0.1'})
+        lists.append((time.perf_counter() - started) * 1000)
+        statuses[f"list_{response.status_code}"] += 1
+        if i % 20 == 0:
+            started = time.perf_counter()
+            response = signup(client, f"{prefix}-good{i}@example.com", '10.0.0.1')
+            signups.append((time.perf_counter() - started) * 1000)
+            statuses[f"signup_{response.status_code}"] += 1
+        i += 1
+        time.sleep(0.1)
+
+    stop.set()
+    for thread in threads:
+        thread.join()
+    return {
+        "good_client": {"list": summary(lists), "signup": summary(signups), "statuses": dict(statuses)},
+        "abuser_statuses": {str(status): count for status, count in sorted(abuse.items())}
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('employees', nargs='?', type=int, default=100000)
+    parser.add_argument('--abusers', type=int, default=16)
+    parser.add_argument('--rtt', type=float, default=0.05)
+    parser.add_argument('--seconds', type=float, default=10)
+    args = parser.parse_args()
+
+    count = args.employees
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'bench.db')
+        app = make_app(path)
+        with app.app_context():
+            seed(max(1, count // 10), max(1, count // 2000), count)
+        results = {"off": run(path, args, False, 'off'), "on": run(path, args, True, 'on')}
+
+    print(json.dumps({
+        "employees": count,
+        "abusers": args.abusers,
+        "rtt": args.rtt,
+        "seconds": args.seconds,
+        **results
+    }, ensure_ascii=False, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,137 @@
+"""읽기 복제본 라우팅 벤치마크
+
+사용법:
+    python benchmarks/bench_replicas.py [직원 수 (기본 1000000)] [--exporters 2] [--writes 200]
+
+사용자 N / 10 (+ 등록용 사용자), 가게 N / 2000 곳, 직원 N 명을 채우고 같은
+내용의 복제본 파일을 만든 뒤, 두 구성에서
+    primary: 복제본 없음 (모든 조회와 쓰기가 주 DB)
+    replica: SQLALCHEMY_REPLICA_URIS = 복제본 파일
+    1) 부하 없는 GET /api/employees 지연시간 (라우팅 비용)
+    2) 내보내기(GET /api/export/employees) 스레드 --exporters 개가 계속 도는
+       동안 POST /api/employees --writes 번의 지연시간과 내보내기 행/초,
+       끝난 뒤 주 DB 의 WAL 파일 크기
+를 JSON 으로 출력한다.
+"""
+import argparse
+import json
+import os
+import shutil
+import statistics
+import tempfile
+import threading
+import time
+
+from sqlalchemy import insert, text
+
+from common import db, make_app, models, seed
+from app import create_app
+
+
+def percentile(timings, q):
+    return round(sorted(timings)[min(len(timings) - 1, int(len(timings) * q))], 2)
+
+
+def list_p50(client, count):
+    timings = []
+    for i in range(50):
+        started = time.perf_counter()
+        client.get(f"/api/employees?after={count * i // 50}&limit=100")
+        timings.append((time.perf_counter() - started) * 1000)
+    return round(statistics.median(timings), 3)
+
+
+def run(path, replica, args, first_user):
+    """한 구성의 측정 결과"""
+    config = {
+        'SQLALCHEMY_DATABASE_URI': f'sqlite:///{path}',
+        'PASSWORD_HASH_EXECUTOR': 'inline',
+        'CACHE_BACKEND': 'null',
+        'JOBS_EXECUTOR': 'external',
+        'RATELIMIT_BACKEND': 'null',
+        'ADMISSION_LIMITS': {},
+        'SQLALCHEMY_REPLICA_URIS': [f'sqlite:///{replica}'] if replica else []
+    }
+    app = create_app(config)
+    idle = list_p50(app.test_client(), args.employees)
+
+    stop = threading.Event()
+    exported = []
+
+    def export():
+        client = app.test_client()
+        while not stop.is_set():
+            response = client.get('/api/export/employees?fields=code,position', buffered=False)
+            for chunk in response.response:
+                exported.append(chunk.count(b'\n'))
+                if stop.is_set():
+                    break
+            response.close()
+
+    threads = [threading.Thread(target=export) for _ in range(args.exporters)]
+    for thread in threads:
+        thread.start()
+    time.sleep(1)
+
+    client = app.test_client()
+    writes = []
+    started_all = time.perf_counter()
+    for i in range(args.writes):
+        started = time.perf_counter()
+        client.post('/api/employees', json={"user_id": first_user + i, "store_id": 1, "type": "스태프"})
+        writes.append((time.perf_counter() - started) * 1000)
+    elapsed = time.perf_counter() - started_all
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    wal = path + '-wal'
+    return {
+        "idle_list_p50_ms": idle,
+        "write_p50_ms": round(statistics.median(writes), 2),
+        "write_p99_ms": percentile(writes, 0.99),
+        "export_rows_per_second": round(sum(exported) / (elapsed + 1)),
+        "primary_wal_kb": os.path.getsize(wal) // 1024 if os.path.exists(wal) else 0
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('employees', nargs='?', type=int, default=1000000)
+    parser.add_argument('--exporters', type=int, default=2)
+    parser.add_argument('--writes', type=int, default=200)
+    args = parser.parse_args()
+
+    count = args.employees
+    users, stores = max(1, count // 10), max(1, count // 2000)
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        path, replica = os.path.join(tmp, 'bench.db'), os.path.join(tmp, 'replica.db')
+        app = make_app(path)
+        with app.app_context():
+            seed(users, stores, count)
+            # 등록용 사용자 (구성마다 따로, 직원 행이 없어 어느 가게에든 등록 가능)
+            db.session.execute(insert(models.User), [{
+                "last_name": f"등록{i}", "email": f"register{i}@example.com", "password": "x",
+                "gender": models.GenderEnum.MALE, "is_active": True, "is_staff": False
+            } for i in range(2 * args.writes)])
+            db.session.commit()
+        with app.app_context():
+            db.session.execute(text("PRAGMA wal_checkpoint(TRUNCATE)"))
+        shutil.copy(path, replica)
+
+        results["primary"] = run(path, None, args, users + 1)
+        with app.app_context():
+            db.session.execute(text("PRAGMA wal_checkpoint(TRUNCATE)"))
+        results["replica"] = run(path, replica, args, users + args.writes + 1)
+
+    print(json.dumps({
+        "employees": count,
+        "exporters": args.exporters,
+        "writes": args.writes,
+        **results
+    }, ensure_ascii=False, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,123 @@
+"""검색 벤치마크: FTS5 색인 vs LIKE 'q%' 지연시간과 쿼리 계획 비교
+
+사용법:
+    python benchmarks/bench_search.py [사용자 수 (기본 1000000)] [--repeat 50]
+
+사용자 N 명, 가게 N / 200 곳, 직원 N / 2 명을 채운 SQLite DB 에서
+/api/users/search, /api/employees/search 를 테스트 클라이언트로 호출한다.
+캐시는 끄고(CACHE_BACKEND=null) 같은 요청을 FTS 색인으로 한 번, 색인이
+없는 DB 처럼 LIKE 로 한 번 실행해 p50/p95 와 검색 SQL 의 쿼리 계획을
+JSON 으로 출력한다.
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+
+from sqlalchemy import event, text
+
+from common import db, make_app, seed
+from app import search
+
+
+def scenarios(users, stores):
+    """(이름, 경로) 목록 - 좁은 검색, 넓은 검색, 없는 검색어, 필터 조합"""
+    target = users // 2
+    return [
+        ("email_exact", f"/api/users/search?q=bench{target}@example.com"),
+        ("email_prefix", f"/api/users/search?q=bench{target // 100}"),
+        ("last_name_prefix", f"/api/users/search?q=사용자{target // 10}"),
+        ("contact_prefix", f"/api/users/search?q=010-{target // 10000:04d}"),
+        ("broad_first_name", "/api/users/search?q=벤치"),
+        ("two_terms", f"/api/users/search?q=벤치 사용자{target // 10}"),
+        ("miss", "/api/users/search?q=zzzz"),
+        ("gender_filter", f"/api/users/search?q=사용자{target // 10}&gender=여성"),
+        ("inactive", f"/api/users/search?q=사용자{target // 10}&active=false"),
+        ("employees_name", f"/api/employees/search?q=사용자{target // 10}"),
+        ("employees_broad_manager", "/api/employees/search?q=벤치&position=매니저"),
+        ("employees_store", f"/api/employees/search?q=사용자{target // 100}&store_id={stores // 2}"),
+        ("employees_miss", "/api/employees/search?q=zzzz"),
+    ]
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))]
+
+
+class LastSearch:
+    """요청 중 실행된 검색 SELECT (테이블 버전 조회 제외) 를 기억"""
+
+    def __init__(self, engine):
+        self.statement = None
+        event.listen(engine, 'before_cursor_execute', self._record)
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().startswith('SELECT') and 'table_versions' not in statement:
+            self.statement = (statement, parameters)
+
+    def plan(self):
+        statement, parameters = self.statement
+        rows = db.session.connection().exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+        return [row[-1] for row in rows]
+
+
+def measure(app, paths, repeat, last):
+    client = app.test_client()
+    results = {}
+    for name, path in paths:
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            response = client.get(path)
+            body = response.get_json()
+            timings.append((time.perf_counter() - started) * 1000)
+        with app.app_context():
+            plan = last.plan()
+        results[name] = {
+            "status": response.status_code,
+            "results": body.get("count"),
+            "p50_ms": round(percentile(timings, 50), 3),
+            "p95_ms": round(percentile(timings, 95), 3),
+            "plan": plan
+        }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('users', nargs='?', type=int, default=1000000)
+    parser.add_argument('--repeat', type=int, default=50, help='시나리오당 요청 수')
+    args = parser.parse_args()
+
+    users = args.users
+    stores, employees = max(1, users // 200), max(1, users // 2)
+    with tempfile.TemporaryDirectory() as tmp:
+        app = make_app(os.path.join(tmp, 'bench.db'), CACHE_BACKEND='null')
+        with app.app_context():
+            started = time.perf_counter()
+            seed(users, stores, employees, inactive_ratio=0.1)
+            seeded = time.perf_counter() - started
+            db.session.execute(text("ANALYZE"))
+            db.session.commit()
+            last = LastSearch(db.engine)
+            engine = db.engine
+
+        paths = scenarios(users, stores)
+        fts = measure(app, paths, args.repeat, last)
+        search._fts_engines[engine] = False       # 색인이 없는 DB 처럼 LIKE 로
+        like = measure(app, paths, args.repeat, last)
+
+    print(json.dumps({
+        "users": users,
+        "stores": stores,
+        "employees": employees,
+        "seed_seconds": round(seeded, 2),
+        "fts": fts,
+        "like": like
+    }, ensure_ascii=False, indent=2))
+
+
+if __name__ == '__main__':
+    main()
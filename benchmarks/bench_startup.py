@@ -0,0 +1,189 @@
+"""앱 시작 비용 / pre-fork 워커 메모리 벤치마크
+
+사용법:
+    python benchmarks/bench_startup.py [--runs 5] [--workers 4] [--requests 200]
+                                       [--output result.json]
+
+1) 콜드 스타트: 새 파이썬 프로세스에서 wsgi / asgi 를 import (앱 생성 포함)
+   하는 시간과 최대 RSS, 무거운 모듈(alembic, multiprocessing 등) 로드 여부
+2) 워커 메모리: gunicorn preload 처럼 앱을 불러온 프로세스에서 워커를
+   fork 하고, 워커마다 GET 요청과 전체 GC 를 한 뒤 /proc/self/smaps_rollup 의
+   PSS / private 메모리를 잰다. gc.freeze() 를 하지 않았을 때와 했을 때를
+   비교한다. (Linux 전용)
+
+결과는 JSON 으로 출력한다.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 시작 시 불러오지 않아야 하는 무거운 모듈
+LAZY_MODULES = ('flask_migrate', 'alembic', 'multiprocessing', 'redis', 'aiosqlite')
+
+COLD_START = """
+import json, resource, sys, time
+started = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - started
+print(json.dumps({{
+    "ms": elapsed * 1000,
+    "maxrss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    "modules": len(sys.modules),
+    "loaded": [name for name in {lazy!r} if name in sys.modules]
+}}))
+"""
+
+WORKER_PATHS = ('/api/users?limit=100', '/api/stores?limit=100', '/api/employees?limit=100',
+                '/api/stores/1/employees', '/api/users/1/stores')
+
+
+def _run_child(code, env):
+    result = subprocess.run([sys.executable, '-c', code], cwd=ROOT, env=env,
+                            capture_output=True, text=True, check=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def bench_cold_start(module, runs, env):
+    samples = [_run_child(COLD_START.format(module=module, lazy=LAZY_MODULES), env)
+               for _ in range(runs)]
+    times = [s["ms"] for s in samples]
+    return {
+        "median_ms": round(statistics.median(times), 1),
+        "min_ms": round(min(times), 1),
+        "maxrss_mb": round(statistics.median(s["maxrss_mb"] for s in samples), 1),
+        "modules": samples[-1]["modules"],
+        "heavy_modules_loaded": samples[-1]["loaded"]
+    }
+
+
+def _smaps_rollup():
+    values = {}
+    with open('/proc/self/smaps_rollup') as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) == 3 and parts[2] == 'kB':
+                values[parts[0].rstrip(':')] = int(parts[1])
+    return values
+
+
+def _worker(app, db, requests, ready_w, go_r, result_w, done_r):
+    """워커: 요청 처리 -> 준비 알림 -> 모두 준비되면 측정 -> 결과 전송 -> 종료 대기"""
+    import gc
+
+    with app.app_context():
+        db.engine.dispose(close=False)
+    client = app.test_client()
+    for i in range(requests):
+        client.get(WORKER_PATHS[i % len(WORKER_PATHS)])
+    gc.collect()                # 오래 도는 워커에서 언젠가 일어나는 전체 GC
+    os.write(ready_w, b'.')
+    os.read(go_r, 1)
+
+    mem = _smaps_rollup()
+    os.write(result_w, (json.dumps({
+        "pss_mb": mem["Pss"] / 1024,
+        "private_mb": (mem["Private_Clean"] + mem["Private_Dirty"]) / 1024,
+        "rss_mb": mem["Rss"] / 1024
+    }) + '\n').encode())
+    os.read(done_r, 1)
+
+
+def measure_workers(workers, requests, freeze):
+    """(자식 프로세스에서 실행) preload 한 앱에서 워커 fork 후 메모리 측정"""
+    import gc
+
+    sys.path.insert(0, ROOT)
+    from wsgi import app, db
+    from common import seed
+
+    with app.app_context():
+        db.create_all()
+        seed(2000, 20, 2000)
+    if freeze:
+        gc.freeze()
+
+    ready_r, ready_w = os.pipe()
+    go_r, go_w = os.pipe()
+    result_r, result_w = os.pipe()
+    done_r, done_w = os.pipe()
+    pids = []
+    for _ in range(workers):
+        pid = os.fork()
+        if pid == 0:
+            os.close(go_w)
+            os.close(done_w)
+            try:
+                _worker(app, db, requests, ready_w, go_r, result_w, done_r)
+            finally:
+                os._exit(0)
+        pids.append(pid)
+
+    for _ in range(workers):
+        os.read(ready_r, 1)
+    os.close(go_w)              # 모든 워커가 살아있는 상태에서 동시에 측정
+
+    results = []
+    with os.fdopen(result_r) as reader:
+        for _ in range(workers):
+            results.append(json.loads(reader.readline()))
+    os.close(done_w)
+    for pid in pids:
+        os.waitpid(pid, 0)
+
+    master = _smaps_rollup()
+    print(json.dumps({
+        "workers": workers,
+        "gc_freeze": freeze,
+        "master_rss_mb": round(master["Rss"] / 1024, 1),
+        "worker_pss_mb": round(statistics.mean(r["pss_mb"] for r in results), 1),
+        "worker_private_mb": round(statistics.mean(r["private_mb"] for r in results), 1),
+        "worker_rss_mb": round(statistics.mean(r["rss_mb"] for r in results), 1)
+    }))
+
+
+def bench_workers(workers, requests, freeze, env):
+    code = (f"import sys; sys.path.insert(0, {os.path.dirname(os.path.abspath(__file__))!r}); "
+            f"import bench_startup; bench_startup.measure_workers({workers}, {requests}, {freeze})")
+    return _run_child(code, env)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=5, help='콜드 스타트 반복 횟수')
+    parser.add_argument('--workers', type=int, default=4, help='fork 할 워커 수')
+    parser.add_argument('--requests', type=int, default=200, help='워커당 요청 수')
+    parser.add_argument('--output', help='결과 JSON 저장 경로 (기본: 표준 출력)')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ, DATABASE_URL=f"sqlite:///{os.path.join(tmp, 'bench.db')}",
+                   PYTHONDONTWRITEBYTECODE='1')
+        report = {
+            "config": vars(args),
+            "cold_start": {module: bench_cold_start(module, args.runs, env)
+                           for module in ('wsgi', 'asgi')}
+        }
+        if sys.platform.startswith('linux'):
+            report["workers"] = [
+                bench_workers(args.workers, args.requests, freeze, dict(
+                    env, DATABASE_URL=f"sqlite:///{os.path.join(tmp, f'workers{int(freeze)}.db')}"
+                ))
+                for freeze in (False, True)
+            ]
+
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output + '\n')
+    else:
+        print(output)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+"""가게별 직급 인원 집계 벤치마크
+
+사용법:
+    python benchmarks/bench_store_stats.py [직원 수 (기본 1000000)]
+
+사용자 N / 10 명, 가게 N / 2000 곳, 직원 N 명을 채운 뒤
+    1) 대시보드 집계: 직원 테이블을 바로 GROUP BY 하는 쿼리 vs
+       GET /api/stores/stats (store_stats 집계 행, 캐시 끔) 첫 페이지 / 전체 페이지
+    2) 쓰기 비용: 집계 트리거가 있을 때와 없을 때의 일괄 직원 등록 시간
+    3) rebuild-store-stats (GROUP BY 한 번으로 다시 만들기) 시간
+을 JSON 으로 출력한다.
+"""
+import argparse
+import json
+import os
+import statistics
+import tempfile
+import time
+
+from sqlalchemy import func, insert, text
+
+from common import db, make_app, models, seed
+from app.stats import _SQLITE_DDL, _SQLITE_DROP, rebuild_store_stats
+
+REPEAT = 10
+BULK = 20000
+
+
+def p50(fn):
+    timings = []
+    for _ in range(REPEAT):
+        started = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - started) * 1000)
+    return round(statistics.median(timings), 2)
+
+
+def group_by_employees():
+    """비교용: 활성 직원을 가게 / 직급으로 바로 집계"""
+    Employee = models.Employee
+    return db.session.query(Employee.store_id, Employee.type, func.count()) \
+        .filter(Employee.is_active.is_(True)).group_by(Employee.store_id, Employee.type).all()
+
+
+def all_pages(client, limit):
+    after = None
+    while True:
+        url = f"/api/stores/stats?limit={limit}" + (f"&after={after}" if after else "")
+        after = client.get(url).get_json()["next_cursor"]
+        if after is None:
+            return
+
+
+def bulk_register(start, users, stores):
+    """직원 BULK 명을 Core executemany 로 등록하고 ms 반환 (기존 쌍과 겹치지 않는 가게)"""
+    started = time.perf_counter()
+    db.session.execute(insert(models.Employee), [{
+        "code": 90000000 + i,
+        "type": models.PositionEnum.MANAGER if i % 10 == 0 else models.PositionEnum.STAFF,
+        "is_active": True,
+        "user_id": i % users + 1,
+        "store_id": stores + 1 + i % 2
+    } for i in range(start, start + BULK)])
+    db.session.commit()
+    return round((time.perf_counter() - started) * 1000, 2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('employees', nargs='?', type=int, default=1000000)
+    args = parser.parse_args()
+
+    count = args.employees
+    users, stores = max(1, count // 10), max(1, count // 2000)
+    with tempfile.TemporaryDirectory() as tmp:
+        app = make_app(os.path.join(tmp, 'bench.db'), CACHE_BACKEND='null')
+        client = app.test_client()
+        with app.app_context():
+            seed(users, stores, count)
+            # 일괄 등록용 가게 두 곳 (사용자와 겹치지 않도록 새 가게)
+            db.session.execute(insert(models.Store), [{"name": f"일괄{i}", "is_active": True} for i in range(2)])
+            db.session.commit()
+            db.session.execute(text("ANALYZE"))
+
+            reads = {
+                "group_by_employees_ms": p50(group_by_employees),
+                "stats_first_page_ms": p50(lambda: client.get("/api/stores/stats?limit=100")),
+                "stats_all_pages_ms": p50(lambda: all_pages(client, 500)),
+                "stats_rows": db.session.query(models.StoreStat).count()
+            }
+
+            with_trigger = bulk_register(0, users, stores)
+            for statement in _SQLITE_DROP:
+                db.session.execute(text(statement))
+            db.session.commit()
+            without_trigger = bulk_register(BULK, users, stores)
+            for statement in _SQLITE_DDL:
+                db.session.execute(text(statement))
+
+            started = time.perf_counter()
+            rows = rebuild_store_stats(db.session, models.StoreStat, models.Employee)
+            db.session.commit()
+            rebuild_ms = round((time.perf_counter() - started) * 1000, 2)
+
+    print(json.dumps({
+        "employees": count,
+        "stores": stores,
+        "dashboard": reads,
+        "bulk_register": {
+            "rows": BULK,
+            "with_trigger_ms": with_trigger,
+            "without_trigger_ms": without_trigger
+        },
+        "rebuild": {"rows": rows, "ms": rebuild_ms}
+    }, ensure_ascii=False, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+"""벤치마크 공용: 임시 SQLite 앱 생성과 합성 데이터 채우기"""
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import insert, update  # noqa: E402
+
+from app import create_app, db  # noqa: E402
+from app import models, services  # noqa: E402,F401
+from app.codes import CODE_MIN, CODE_SPACE, encode  # noqa: E402
+
+BATCH = 50000
+
+
+def make_app(path, **overrides):
+    """path 의 SQLite 파일을 쓰는 앱 (비밀번호 해시는 기본 inline, 요청 한도 없음)"""
+    config = {
+        'SQLALCHEMY_DATABASE_URI': f'sqlite:///{path}',
+        'PASSWORD_HASH_EXECUTOR': 'inline',
+        # 한 클라이언트가 계속 요청하므로 요청 한도 / 동시 실행 한도는 끔
+        'RATELIMIT_BACKEND': 'null',
+        'ADMISSION_LIMITS': {}
+    }
+    config.update(overrides)
+    app = create_app(config)
+    with app.app_context():
+        db.create_all()
+    return app
+
+
+def _store_for(i, users, stores):
+    """i 번째 직원의 가게: 사용자마다 흩어진 시작 가게에서 한 칸씩 (user, store) 중복 없음"""
+    return (i % users * 7919 + i // users) % stores + 1
+
+
+def seeded_stores(user_id, users, stores, employees):
+    """seed(users, stores, employees) 가 user_id 를 배정한 가게 id 집합"""
+    return {_store_for(i, users, stores) for i in range(user_id - 1, employees, users)}
+
+
+def seed(users, stores, employees, inactive_ratio=0.0, rng_seed=42):
+    """사용자/가게/직원 합성 데이터 (앱 컨텍스트 안에서 호출)
+
+    비밀번호 해시는 생략하고, 직원번호는 실제 발급기와 같은 순열로 채운 뒤
+    카운터를 그만큼 올려 둔다. (직원 수가 번호 공간보다 많으면 나머지는
+    범위 밖 번호를 쓴다.) 직원은 사용자를 차례로 돌며 배정하므로
+    employees <= users * stores 이면 (사용자, 가게) 쌍이 겹치지 않는다.
+    """
+    rng = random.Random(rng_seed)
+    session = db.session
+
+    for start in range(0, users, BATCH):
+        session.execute(insert(models.User), [{
+            "first_name": "벤치",
+            "last_name": f"사용자{i}",
+            "email": f"bench{i}@example.com",
+            "password": "x",
+            "contact": f"010-{i // 10000:04d}-{i % 10000:04d}",
+            "gender": models.GenderEnum.MALE if i % 2 else models.GenderEnum.FEMALE,
+            "is_active": rng.random() >= inactive_ratio,
+            "is_staff": False
+        } for i in range(start, min(users, start + BATCH))])
+
+    for start in range(0, stores, BATCH):
+        session.execute(insert(models.Store), [
+            {"name": f"매장{i}", "address": f"주소{i}", "is_active": rng.random() >= inactive_ratio}
+            for i in range(start, min(stores, start + BATCH))
+        ])
+
+    for start in range(0, employees, BATCH):
+        session.execute(insert(models.Employee), [{
+            "code": encode(i) if i < CODE_SPACE else CODE_MIN + i,
+            "type": models.PositionEnum.MANAGER if i % 10 == 0 else models.PositionEnum.STAFF,
+            "is_active": rng.random() >= inactive_ratio,
+            "user_id": i % users + 1,
+            "store_id": _store_for(i, users, stores)
+        } for i in range(start, min(employees, start + BATCH))])
+
+    table = models.EmployeeCodeSequence.__table__
+    session.execute(update(table).where(table.c.id == 1).values(next_value=min(employees, CODE_SPACE)))
+    session.commit()
@@ -0,0 +1,95 @@
+"""gunicorn 운영 설정
+
+실행:
+    gunicorn -c gunicorn.conf.py wsgi:app
+
+마스터 프로세스가 시작할 때 한 번만 마이그레이션을 적용하고(flask db upgrade
+와 같음) 앱을 미리 불러온 뒤 워커를 fork 한다. 워커들이 동시에 스키마를
+만들다 충돌하지 않는다.
+
+    워커 교체(설정 다시 읽기):  kill -HUP <마스터 pid>   (기존 요청은 끝까지 처리)
+    새 코드로 무중단 교체:      kill -USR2 <마스터 pid> 후 기존 마스터에 kill -TERM
+                                (preload_app 이므로 코드는 마스터가 새로 떠야 반영됨)
+    워커 수 조절:               kill -TTIN / -TTOU <마스터 pid>
+
+환경변수
+    BIND                  바인드 주소 (기본 0.0.0.0:8000)
+    WEB_CONCURRENCY       워커 프로세스 수 (기본 CPU 코어 수 * 2 + 1)
+    WEB_THREADS           워커당 스레드 수 (기본 2)
+    WEB_TIMEOUT           요청 처리 제한 시간 초 (기본 30)
+                          일괄 가입은 해시 작업자마다 BULK_SIGNUP_ROWS_PER_HASH_WORKER
+                          (기본 20) 번 x PBKDF2 한 번 (약 0.4~0.6 초) 만큼 걸리므로 (작업자
+                          수만큼 한 번에 받는 건수가 늘어남) 이 안에 끝나도록 함께 조정한다
+    WEB_KEEPALIVE         keep-alive 대기 시간 초 (기본 5)
+    WEB_MAX_REQUESTS      워커 재시작 전 최대 요청 수 (기본 1000, 0 이면 사용 안 함)
+    RUN_MIGRATIONS        0 이면 시작 시 마이그레이션 생략 (기본 1)
+"""
+import gc
+import multiprocessing
+import os
+
+bind = os.environ.get('BIND', '0.0.0.0:8000')
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+
+# sync 워커는 keep-alive 를 지원하지 않으므로 gthread 사용
+worker_class = 'gthread'
+threads = int(os.environ.get('WEB_THREADS', 2))
+keepalive = int(os.environ.get('WEB_KEEPALIVE', 5))
+
+timeout = int(os.environ.get('WEB_TIMEOUT', 30))
+graceful_timeout = 30
+
+# 메모리 누수 대비 주기적 워커 교체 (동시에 재시작하지 않도록 jitter)
+max_requests = int(os.environ.get('WEB_MAX_REQUESTS', 1000))
+max_requests_jitter = max_requests // 10
+
+# 마스터에서 앱을 한 번 불러와 워커끼리 메모리 공유 (copy-on-write)
+preload_app = True
+chdir = os.path.dirname(os.path.abspath(__file__))
+
+accesslog = '-'
+errorlog = '-'
+
+
+def on_starting(server):
+    """워커 fork 전에 마스터에서 한 번만 마이그레이션 적용"""
+    if os.environ.get('RUN_MIGRATIONS', '1') == '0':
+        return
+
+    from flask_migrate import upgrade
+    from app import init_migrations
+    from wsgi import app
+
+    with app.app_context():
+        init_migrations(app)
+        upgrade()
+    server.log.info("마이그레이션 적용 완료")
+
+
+def pre_fork(server, worker):
+    """fork 직전 마스터의 객체를 GC 대상에서 빼서 워커와 페이지를 계속 공유
+
+    GC 가 공유 객체의 헤더를 건드리면 copy-on-write 로 페이지가 복사된다.
+    """
+    gc.freeze()
+
+
+def post_fork(server, worker):
+    """워커 프로세스 초기화
+
+    - 마스터에서 열린 DB 연결을 워커가 공유하지 않도록 모든 엔진(주 DB, 복제본) 의 풀을 비움
+    - 비밀번호 해시 프로세스 풀은 워커마다 생기므로 작업자 수를 CPU 코어 수 / 워커 수
+      (최소 1) 로 나눠서 전체 해시 프로세스가 코어 수 근처에 머물게 함
+    """
+    from app import hashing
+    from wsgi import app, db
+
+    with app.app_context():
+        for engine in db.engines.values():
+            engine.dispose(close=False)
+
+    hashing.configure(
+        app.config.get('PASSWORD_HASH_EXECUTOR', 'process'),
+        app.config.get('PASSWORD_HASH_WORKERS')
+        or max(1, multiprocessing.cpu_count() // server.num_workers)
+    )
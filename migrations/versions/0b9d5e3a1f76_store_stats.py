@@ -0,0 +1,116 @@
+"""store stats
+
+가게별 직급 인원 집계 테이블 store_stats 와 employees 집계 트리거.
+기존 직원은 GROUP BY 한 번으로 채운다. app/stats.py 의 store_stats_ddl() 과
+같은 내용이다.
+
+Revision ID: 0b9d5e3a1f76
+Revises: e61b4c07d9a8
+Create Date: 2026-10-18 13:20:06.884512
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '0b9d5e3a1f76'
+down_revision = 'e61b4c07d9a8'
+branch_labels = None
+depends_on = None
+
+
+SQLITE_UPGRADE = [
+    "CREATE TRIGGER IF NOT EXISTS store_stats_insert AFTER INSERT ON employees "
+    "WHEN new.is_active BEGIN "
+    "INSERT INTO store_stats (store_id, position, headcount) VALUES (new.store_id, new.type, 1) "
+    "ON CONFLICT (store_id, position) DO UPDATE SET headcount = headcount + 1; END",
+    "CREATE TRIGGER IF NOT EXISTS store_stats_delete AFTER DELETE ON employees "
+    "WHEN old.is_active BEGIN "
+    "UPDATE store_stats SET headcount = headcount - 1 "
+    "WHERE store_id = old.store_id AND position = old.type; END",
+    "CREATE TRIGGER IF NOT EXISTS store_stats_update "
+    "AFTER UPDATE OF is_active, type, store_id ON employees BEGIN "
+    "UPDATE store_stats SET headcount = headcount - 1 "
+    "WHERE old.is_active AND store_id = old.store_id AND position = old.type; "
+    "INSERT INTO store_stats (store_id, position, headcount) "
+    "SELECT new.store_id, new.type, 1 WHERE new.is_active "
+    "ON CONFLICT (store_id, position) DO UPDATE SET headcount = headcount + 1; END",
+    "CREATE TRIGGER IF NOT EXISTS store_stats_store_delete AFTER DELETE ON stores BEGIN "
+    "DELETE FROM store_stats WHERE store_id = old.id; END"
+]
+
+SQLITE_DOWNGRADE = [
+    "DROP TRIGGER IF EXISTS store_stats_store_delete",
+    "DROP TRIGGER IF EXISTS store_stats_update",
+    "DROP TRIGGER IF EXISTS store_stats_delete",
+    "DROP TRIGGER IF EXISTS store_stats_insert"
+]
+
+POSTGRESQL_UPGRADE = [
+    "CREATE OR REPLACE FUNCTION store_stats_apply() RETURNS trigger AS $$ "
+    "BEGIN "
+    "IF TG_OP <> 'INSERT' THEN "
+    "IF OLD.is_active THEN "
+    "UPDATE store_stats SET headcount = headcount - 1 "
+    "WHERE store_id = OLD.store_id AND position = OLD.type; "
+    "END IF; "
+    "END IF; "
+    "IF TG_OP <> 'DELETE' THEN "
+    "IF NEW.is_active THEN "
+    "INSERT INTO store_stats (store_id, position, headcount) VALUES (NEW.store_id, NEW.type, 1) "
+    "ON CONFLICT (store_id, position) DO UPDATE SET headcount = store_stats.headcount + 1; "
+    "END IF; "
+    "END IF; "
+    "RETURN NULL; "
+    "END $$ LANGUAGE plpgsql",
+    "DROP TRIGGER IF EXISTS employees_store_stats ON employees",
+    "CREATE TRIGGER employees_store_stats "
+    "AFTER INSERT OR DELETE OR UPDATE OF is_active, type, store_id ON employees "
+    "FOR EACH ROW EXECUTE FUNCTION store_stats_apply()"
+]
+
+POSTGRESQL_DOWNGRADE = [
+    "DROP TRIGGER IF EXISTS employees_store_stats ON employees",
+    "DROP FUNCTION IF EXISTS store_stats_apply()"
+]
+
+
+def upgrade():
+    # positionenum 타입은 employees 와 공유 (PostgreSQL 에서는 이미 있음)
+    position = sa.Enum('MANAGER', 'STAFF', name='positionenum').with_variant(
+        postgresql.ENUM('MANAGER', 'STAFF', name='positionenum', create_type=False), 'postgresql'
+    )
+    op.create_table('store_stats',
+    sa.Column('store_id', sa.Integer(), nullable=False),
+    sa.Column('position', position, nullable=False),
+    sa.Column('headcount', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['store_id'], ['stores.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('store_id', 'position'),
+    if_not_exists=True
+    )
+
+    # 기존 활성 직원 집계 (트리거를 만들기 전에 한 번)
+    op.execute(
+        "INSERT INTO store_stats (store_id, position, headcount) "
+        "SELECT store_id, type, count(*) FROM employees WHERE is_active "
+        "GROUP BY store_id, type"
+    )
+    op.execute(
+        "INSERT INTO table_versions (table_name, version, updated_at) "
+        "SELECT 'store_stats', 0, CURRENT_TIMESTAMP "
+        "WHERE NOT EXISTS (SELECT 1 FROM table_versions WHERE table_name = 'store_stats')"
+    )
+
+    dialect = op.get_bind().dialect.name
+    for statement in {'sqlite': SQLITE_UPGRADE, 'postgresql': POSTGRESQL_UPGRADE}.get(dialect, []):
+        op.execute(statement)
+
+
+def downgrade():
+    dialect = op.get_bind().dialect.name
+    for statement in {'sqlite': SQLITE_DOWNGRADE, 'postgresql': POSTGRESQL_DOWNGRADE}.get(dialect, []):
+        op.execute(statement)
+    op.execute("DELETE FROM table_versions WHERE table_name = 'store_stats'")
+    op.drop_table('store_stats')
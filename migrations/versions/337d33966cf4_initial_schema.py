@@ -0,0 +1,92 @@
+"""initial schema
+
+지금까지 db.create_all() 로 만들어 온 테이블. 기존 DB 에서도 그대로
+upgrade 할 수 있도록 이미 있는 테이블은 건너뛴다.
+
+Revision ID: 337d33966cf4
+Revises: 
+Create Date: 2026-10-18 01:03:53.784893
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '337d33966cf4'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('users',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('first_name', sa.String(length=50), nullable=True),
+    sa.Column('last_name', sa.String(length=50), nullable=False),
+    sa.Column('email', sa.String(length=100), nullable=False),
+    sa.Column('password', sa.String(length=255), nullable=False),
+    sa.Column('address', sa.String(length=255), nullable=True),
+    sa.Column('contact', sa.String(length=50), nullable=True),
+    sa.Column('gender', sa.Enum('MALE', 'FEMALE', name='genderenum'), nullable=False),
+    sa.Column('is_active', sa.Boolean(), nullable=False),
+    sa.Column('is_staff', sa.Boolean(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('email'),
+    if_not_exists=True
+    )
+    op.create_table('stores',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=50), nullable=False),
+    sa.Column('address', sa.String(length=255), nullable=True),
+    sa.Column('contact', sa.String(length=50), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    if_not_exists=True
+    )
+    op.create_table('employees',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('code', sa.Integer(), nullable=False),
+    sa.Column('type', sa.Enum('MANAGER', 'STAFF', name='positionenum'), nullable=False),
+    sa.Column('is_active', sa.Boolean(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('store_id', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['store_id'], ['stores.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('code'),
+    if_not_exists=True
+    )
+    op.create_table('employee_code_sequence',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('next_value', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    if_not_exists=True
+    )
+    op.create_table('table_versions',
+    sa.Column('table_name', sa.String(length=50), nullable=False),
+    sa.Column('version', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('table_name'),
+    if_not_exists=True
+    )
+
+    # 직원번호 카운터 / 테이블 버전 초기 행 (이미 있으면 건너뜀)
+    op.execute(
+        "INSERT INTO employee_code_sequence (id, next_value) "
+        "SELECT 1, 0 WHERE NOT EXISTS (SELECT 1 FROM employee_code_sequence WHERE id = 1)"
+    )
+    for name in ('users', 'stores', 'employees'):
+        op.execute(
+            "INSERT INTO table_versions (table_name, version, updated_at) "
+            f"SELECT '{name}', 0, CURRENT_TIMESTAMP "
+            f"WHERE NOT EXISTS (SELECT 1 FROM table_versions WHERE table_name = '{name}')"
+        )
+
+
+def downgrade():
+    op.drop_table('table_versions')
+    op.drop_table('employee_code_sequence')
+    op.drop_table('employees')
+    op.drop_table('stores')
+    op.drop_table('users')
@@ -0,0 +1,99 @@
+"""search index
+
+/api/users/search, /api/employees/search 용 검색 색인.
+SQLite: users_fts / employees_fts (FTS5) 와 동기화 트리거, 기존 행 채우기.
+PostgreSQL: 검색 컬럼별 varchar_pattern_ops 인덱스 (LIKE 'q%').
+app/search.py 의 search_ddl() 과 같은 내용이다.
+
+Revision ID: 5c1e7a9d2f40
+Revises: 8978cf5a5b29
+Create Date: 2026-10-18 09:42:51.208113
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '5c1e7a9d2f40'
+down_revision = '8978cf5a5b29'
+branch_labels = None
+depends_on = None
+
+
+SQLITE_UPGRADE = [
+    # 사용자 색인
+    "CREATE VIRTUAL TABLE IF NOT EXISTS users_fts USING fts5("
+    "email, first_name, last_name, contact, content='', "
+    "tokenize=\"unicode61 tokenchars '@.-_+'\", prefix='2 3')",
+    "INSERT INTO users_fts (rowid, email, first_name, last_name, contact) "
+    "SELECT id, email, first_name, last_name, contact FROM users",
+    "CREATE TRIGGER IF NOT EXISTS users_fts_insert AFTER INSERT ON users BEGIN "
+    "INSERT INTO users_fts (rowid, email, first_name, last_name, contact) "
+    "VALUES (new.id, new.email, new.first_name, new.last_name, new.contact); END",
+    "CREATE TRIGGER IF NOT EXISTS users_fts_delete AFTER DELETE ON users BEGIN "
+    "INSERT INTO users_fts (users_fts, rowid, email, first_name, last_name, contact) "
+    "VALUES ('delete', old.id, old.email, old.first_name, old.last_name, old.contact); "
+    "DELETE FROM employees_fts WHERE rowid IN (SELECT id FROM employees WHERE user_id = old.id); END",
+    "CREATE TRIGGER IF NOT EXISTS users_fts_update "
+    "AFTER UPDATE OF email, first_name, last_name, contact ON users BEGIN "
+    "INSERT INTO users_fts (users_fts, rowid, email, first_name, last_name, contact) "
+    "VALUES ('delete', old.id, old.email, old.first_name, old.last_name, old.contact); "
+    "INSERT INTO users_fts (rowid, email, first_name, last_name, contact) "
+    "VALUES (new.id, new.email, new.first_name, new.last_name, new.contact); "
+    "UPDATE employees_fts SET email = new.email, first_name = new.first_name, "
+    "last_name = new.last_name, contact = new.contact "
+    "WHERE rowid IN (SELECT id FROM employees WHERE user_id = new.id); END",
+
+    # 직원 색인 (사용자 컬럼을 직원 행마다 복사)
+    "CREATE VIRTUAL TABLE IF NOT EXISTS employees_fts USING fts5("
+    "email, first_name, last_name, contact, "
+    "tokenize=\"unicode61 tokenchars '@.-_+'\", prefix='2 3')",
+    "INSERT INTO employees_fts (rowid, email, first_name, last_name, contact) "
+    "SELECT e.id, u.email, u.first_name, u.last_name, u.contact "
+    "FROM employees e JOIN users u ON u.id = e.user_id",
+    "CREATE TRIGGER IF NOT EXISTS employees_fts_insert AFTER INSERT ON employees BEGIN "
+    "INSERT INTO employees_fts (rowid, email, first_name, last_name, contact) "
+    "SELECT new.id, u.email, u.first_name, u.last_name, u.contact "
+    "FROM users u WHERE u.id = new.user_id; END",
+    "CREATE TRIGGER IF NOT EXISTS employees_fts_delete AFTER DELETE ON employees BEGIN "
+    "DELETE FROM employees_fts WHERE rowid = old.id; END",
+    "CREATE TRIGGER IF NOT EXISTS employees_fts_update AFTER UPDATE OF user_id ON employees BEGIN "
+    "DELETE FROM employees_fts WHERE rowid = old.id; "
+    "INSERT INTO employees_fts (rowid, email, first_name, last_name, contact) "
+    "SELECT new.id, u.email, u.first_name, u.last_name, u.contact "
+    "FROM users u WHERE u.id = new.user_id; END"
+]
+
+SQLITE_DOWNGRADE = [
+    "DROP TRIGGER IF EXISTS employees_fts_update",
+    "DROP TRIGGER IF EXISTS employees_fts_delete",
+    "DROP TRIGGER IF EXISTS employees_fts_insert",
+    "DROP TABLE IF EXISTS employees_fts",
+    "DROP TRIGGER IF EXISTS users_fts_update",
+    "DROP TRIGGER IF EXISTS users_fts_delete",
+    "DROP TRIGGER IF EXISTS users_fts_insert",
+    "DROP TABLE IF EXISTS users_fts"
+]
+
+SEARCH_COLUMNS = ('email', 'first_name', 'last_name', 'contact')
+
+
+def upgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == 'sqlite':
+        for statement in SQLITE_UPGRADE:
+            op.execute(statement)
+    elif dialect == 'postgresql':
+        for name in SEARCH_COLUMNS:
+            op.execute(f"CREATE INDEX IF NOT EXISTS ix_users_{name}_pattern "
+                       f"ON users ({name} varchar_pattern_ops)")
+
+
+def downgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == 'sqlite':
+        for statement in SQLITE_DOWNGRADE:
+            op.execute(statement)
+    elif dialect == 'postgresql':
+        for name in SEARCH_COLUMNS:
+            op.execute(f"DROP INDEX IF EXISTS ix_users_{name}_pattern")
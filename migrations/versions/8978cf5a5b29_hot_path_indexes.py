@@ -0,0 +1,47 @@
+"""hot path indexes
+
+목록 API 의 is_active 필터와 employees.user_id / store_id JOIN 용 인덱스.
+활성 행 인덱스는 SQLite / PostgreSQL 에서 부분 인덱스로 만들어진다.
+
+Revision ID: 8978cf5a5b29
+Revises: 337d33966cf4
+Create Date: 2026-10-18 01:10:12.412730
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8978cf5a5b29'
+down_revision = '337d33966cf4'
+branch_labels = None
+depends_on = None
+
+
+def _active_where():
+    return {
+        "sqlite_where": sa.text('is_active = 1'),
+        "postgresql_where": sa.text('is_active')
+    }
+
+
+def upgrade():
+    op.create_index('ix_users_active_id', 'users', ['id'], unique=False,
+                    if_not_exists=True, **_active_where())
+    op.create_index('ix_stores_active_id', 'stores', ['id'], unique=False,
+                    if_not_exists=True, **_active_where())
+    op.create_index('ix_employees_active_id', 'employees', ['id'], unique=False,
+                    if_not_exists=True, **_active_where())
+    op.create_index('ix_employees_store_id_is_active', 'employees', ['store_id', 'is_active'],
+                    unique=False, if_not_exists=True)
+    op.create_index('ix_employees_user_id', 'employees', ['user_id'], unique=False,
+                    if_not_exists=True)
+
+
+def downgrade():
+    op.drop_index('ix_employees_user_id', table_name='employees')
+    op.drop_index('ix_employees_store_id_is_active', table_name='employees')
+    op.drop_index('ix_employees_active_id', table_name='employees')
+    op.drop_index('ix_stores_active_id', table_name='stores')
+    op.drop_index('ix_users_active_id', table_name='users')
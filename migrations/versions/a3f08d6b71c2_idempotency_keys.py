@@ -0,0 +1,76 @@
+"""idempotency keys
+
+쓰기 API 의 Idempotency-Key 별 첫 응답 테이블과 employees (user_id, store_id)
+유니크 인덱스. 인덱스를 만들기 전에 이미 있는 중복 직원 행은 (사용자, 가게)
+마다 한 행만 남긴다. 활성 행을, 그중에서도 가장 나중에 등록된 행(id 최대)을
+남기고, 나머지는 employees_duplicates 로 옮긴 뒤 옮긴 행 수를 경고로 남긴다.
+운영자는 그 테이블을 보고 되살리거나 지운다 (downgrade 는 되돌려 넣는다).
+
+Revision ID: a3f08d6b71c2
+Revises: 5c1e7a9d2f40
+Create Date: 2026-10-18 10:27:14.530921
+
+"""
+import logging
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a3f08d6b71c2'
+down_revision = '5c1e7a9d2f40'
+branch_labels = None
+depends_on = None
+
+logger = logging.getLogger('alembic.env')
+
+COLUMNS = 'id, code, type, is_active, user_id, store_id'
+
+
+def upgrade():
+    op.create_table('idempotency_keys',
+    sa.Column('key', sa.String(length=255), nullable=False),
+    sa.Column('path', sa.String(length=255), nullable=False),
+    sa.Column('fingerprint', sa.String(length=64), nullable=False),
+    sa.Column('status_code', sa.Integer(), nullable=True),
+    sa.Column('response', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('key', 'path'),
+    if_not_exists=True
+    )
+    op.create_index('ix_idempotency_keys_created_at', 'idempotency_keys', ['created_at'],
+                    unique=False, if_not_exists=True)
+
+    # 같은 (사용자, 가게) 에 더 나은 행(활성 우선, 그다음 id 큰 행) 이 있는 행을 옮김
+    op.create_table('employees_duplicates',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('code', sa.Integer(), nullable=False),
+    sa.Column('type', sa.String(length=50), nullable=False),
+    sa.Column('is_active', sa.Boolean(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('store_id', sa.Integer(), nullable=False),
+    sa.Column('removed_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    if_not_exists=True
+    )
+    op.execute(
+        f"INSERT INTO employees_duplicates ({COLUMNS}, removed_at) "
+        f"SELECT {COLUMNS}, CURRENT_TIMESTAMP FROM employees e WHERE EXISTS ("
+        "SELECT 1 FROM employees k WHERE k.user_id = e.user_id AND k.store_id = e.store_id "
+        "AND (k.is_active > e.is_active OR (k.is_active = e.is_active AND k.id > e.id)))"
+    )
+    moved = op.get_bind().scalar(sa.text("SELECT COUNT(*) FROM employees_duplicates"))
+    if moved:
+        logger.warning(f"중복 직원 행 {moved}개를 employees_duplicates 로 옮겼습니다")
+    op.execute("DELETE FROM employees WHERE id IN (SELECT id FROM employees_duplicates)")
+    op.create_index('uq_employees_user_id_store_id', 'employees', ['user_id', 'store_id'],
+                    unique=True, if_not_exists=True)
+
+
+def downgrade():
+    op.drop_index('uq_employees_user_id_store_id', table_name='employees')
+    op.execute(f"INSERT INTO employees ({COLUMNS}) SELECT {COLUMNS} FROM employees_duplicates")
+    op.drop_table('employees_duplicates')
+    op.drop_index('ix_idempotency_keys_created_at', table_name='idempotency_keys')
+    op.drop_table('idempotency_keys')
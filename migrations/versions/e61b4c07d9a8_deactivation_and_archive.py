@@ -0,0 +1,83 @@
+"""deactivation and archive
+
+users / stores / employees 에 deactivated_at (비활성화 시각) 을 추가하고,
+flask archive-inactive 가 오래된 비활성 행을 옮길 보관 테이블을 만든다.
+이미 비활성인 행은 이 마이그레이션 시각에 비활성화된 것으로 채운다.
+
+Revision ID: e61b4c07d9a8
+Revises: a3f08d6b71c2
+Create Date: 2026-10-18 11:58:40.117264
+
+"""
+from datetime import datetime, timezone
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e61b4c07d9a8'
+down_revision = 'a3f08d6b71c2'
+branch_labels = None
+depends_on = None
+
+TABLES = ('users', 'stores', 'employees')
+
+
+def upgrade():
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    for name in TABLES:
+        op.add_column(name, sa.Column('deactivated_at', sa.DateTime(), nullable=True))
+        table = sa.table(name, sa.column('is_active', sa.Boolean()),
+                         sa.column('deactivated_at', sa.DateTime()))
+        op.execute(table.update().where(table.c.is_active.is_(False)).values(deactivated_at=now))
+
+    op.create_table('users_archive',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('first_name', sa.String(length=50), nullable=True),
+    sa.Column('last_name', sa.String(length=50), nullable=False),
+    sa.Column('email', sa.String(length=100), nullable=False),
+    sa.Column('password', sa.String(length=255), nullable=False),
+    sa.Column('address', sa.String(length=255), nullable=True),
+    sa.Column('contact', sa.String(length=50), nullable=True),
+    sa.Column('gender', sa.String(length=50), nullable=False),
+    sa.Column('is_active', sa.Boolean(), nullable=False),
+    sa.Column('is_staff', sa.Boolean(), nullable=False),
+    sa.Column('deactivated_at', sa.DateTime(), nullable=True),
+    sa.Column('archived_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    if_not_exists=True
+    )
+    op.create_table('stores_archive',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=50), nullable=False),
+    sa.Column('address', sa.String(length=255), nullable=True),
+    sa.Column('contact', sa.String(length=50), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=False),
+    sa.Column('deactivated_at', sa.DateTime(), nullable=True),
+    sa.Column('archived_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    if_not_exists=True
+    )
+    op.create_table('employees_archive',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('code', sa.Integer(), nullable=False),
+    sa.Column('type', sa.String(length=50), nullable=False),
+    sa.Column('is_active', sa.Boolean(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('store_id', sa.Integer(), nullable=False),
+    sa.Column('deactivated_at', sa.DateTime(), nullable=True),
+    sa.Column('archived_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    if_not_exists=True
+    )
+
+
+def downgrade():
+    op.drop_table('employees_archive')
+    op.drop_table('stores_archive')
+    op.drop_table('users_archive')
+    # batch 모드는 SQLite 테이블을 다시 만들면서 검색 트리거를 지우므로
+    # ALTER TABLE ... DROP COLUMN (SQLite 3.35+) 을 그대로 쓴다
+    for name in reversed(TABLES):
+        op.drop_column(name, 'deactivated_at')
@@ -0,0 +1,95 @@
+"""테스트 공용 fixture
+
+테스트마다 임시 SQLite 파일에 새 앱을 만든다. 비밀번호 해시는 inline,
+작업자 스레드 / 웹훅 / 캐시 / 요청 한도는 끈 상태가 기본이고 테스트에서 덮어쓴다.
+"""
+import pytest
+from sqlalchemy import event, insert, update
+
+from app import create_app, db
+from app.codes import encode
+from app.models import Employee, EmployeeCodeSequence, GenderEnum, PositionEnum, Store, User
+
+TEST_CONFIG = {
+    'PASSWORD_HASH_EXECUTOR': 'inline',
+    'JOBS_EXECUTOR': 'external',
+    'WEBHOOK_URL': None,
+    'CACHE_BACKEND': 'null',
+    'RATELIMIT_BACKEND': 'null',
+    'ADMISSION_LIMITS': {}
+}
+
+
+@pytest.fixture
+def make_app(tmp_path):
+    """make_app(**설정) -> 임시 DB 를 쓰는 앱 (create_all=False 면 스키마를 만들지 않음)"""
+    def make(create_all=True, **overrides):
+        config = {'SQLALCHEMY_DATABASE_URI': f"sqlite:///{tmp_path / 'test.db'}", **TEST_CONFIG}
+        config.update(overrides)
+        app = create_app(config)
+        if create_all:
+            # 주 DB 만 (복제본 bind 의 빈 metadata 는 db 객체에 남아 다음 앱에도 보임)
+            with app.app_context():
+                db.create_all(bind_key=None)
+        return app
+    return make
+
+
+@pytest.fixture
+def app(make_app):
+    return make_app()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+def seed(users, stores, employees):
+    """사용자 / 가게 / 직원 행 추가 (앱 컨텍스트 안에서)
+
+    직원은 이번에 추가한 사용자에게만 돌아가며 배정하므로 (사용자, 가게) 가
+    겹치지 않는다 (employees <= users * 전체 가게 수).
+    """
+    start_user = db.session.query(db.func.count(User.id)).scalar()
+    start_store = db.session.query(db.func.count(Store.id)).scalar()
+    start_employee = db.session.query(db.func.count(Employee.id)).scalar()
+    if users:
+        db.session.execute(insert(User), [{
+            "first_name": "테스트", "last_name": f"사용자{i}", "email": f"user{i}@example.com",
+            "password": "x", "contact": f"010-0000-{i:04d}",
+            "gender": GenderEnum.MALE, "is_active": True, "is_staff": False
+        } for i in range(start_user, start_user + users)])
+    if stores:
+        db.session.execute(insert(Store), [
+            {"name": f"매장{i}", "address": f"주소{i}", "is_active": True}
+            for i in range(start_store, start_store + stores)
+        ])
+    total_stores = start_store + stores
+    end = start_employee + employees
+    if employees:
+        db.session.execute(insert(Employee), [{
+            "code": encode(start_employee + i),
+            "type": PositionEnum.MANAGER if i % 10 == 0 else PositionEnum.STAFF,
+            "is_active": True,
+            "user_id": start_user + i % users + 1,
+            "store_id": (i // users) % total_stores + 1
+        } for i in range(employees)])
+    table = EmployeeCodeSequence.__table__
+    db.session.execute(update(table).where(table.c.id == 1).values(next_value=end))
+    db.session.commit()
+
+
+@pytest.fixture
+def queries(app):
+    """db.engine 에서 실행된 SQL 문 목록 (테스트 중 계속 쌓임, clear() 로 비움)"""
+    with app.app_context():
+        engine = db.engine
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, 'before_cursor_execute', before_cursor_execute)
+    yield statements
+    event.remove(engine, 'before_cursor_execute', before_cursor_execute)
@@ -0,0 +1,124 @@
+"""ASGI 서빙 (코루틴 라우트 + WSGI 대체 처리) 과 WSGI 앱의 응답 비교"""
+import asyncio
+import json
+from urllib.parse import quote
+
+import pytest
+
+from app import db
+from app.asgi import AsyncApp
+from app.async_routes import routes
+from conftest import seed
+
+PATHS = [
+    '/api/users',
+    '/api/users?limit=2&fields=id,email',
+    '/api/stores',
+    '/api/employees',
+    '/api/employees?after=3&limit=5',
+    '/api/stores/1/employees',
+    f"/api/stores/1/employees?position={quote('매니저')}",
+    '/api/users/1/stores',
+    '/api/stores/999/employees'
+]
+
+
+async def call(asgi_app, method, target, headers=(), body=b''):
+    """ASGI 요청 하나 -> (상태 코드, 헤더 dict, 본문)"""
+    path, _, query = target.partition('?')
+    headers = [*headers, ('Content-Length', str(len(body)))] if body else list(headers)
+    scope = {
+        'type': 'http', 'asgi': {'version': '3.0'}, 'http_version': '1.1',
+        'method': method, 'scheme': 'http', 'path': path, 'raw_path': path.encode(),
+        'query_string': query.encode('ascii'), 'root_path': '',
+        'headers': [(name.lower().encode('latin-1'), value.encode('latin-1')) for name, value in headers],
+        'client': ('127.0.0.1', 50000), 'server': ('localhost', 80)
+    }
+    finished = asyncio.Event()
+    messages = [{'type': 'http.request', 'body': body, 'more_body': False}]
+    sent = []
+
+    async def receive():
+        if messages:
+            return messages.pop()
+        await finished.wait()
+        return {'type': 'http.disconnect'}
+
+    async def send(message):
+        sent.append(message)
+        if message['type'] == 'http.response.body' and not message.get('more_body'):
+            finished.set()
+
+    await asgi_app(scope, receive, send)
+    start = sent[0]
+    response_headers = {}
+    for name, value in start['headers']:
+        response_headers.setdefault(name.decode('latin-1').lower(), value.decode('latin-1'))
+    return start['status'], response_headers, b''.join(m.get('body', b'') for m in sent[1:])
+
+
+def run(asgi_app, *requests):
+    """같은 이벤트 루프에서 요청을 차례로 보내고 끝나면 비동기 엔진을 닫음"""
+    async def main():
+        try:
+            return [await call(asgi_app, *request) for request in requests]
+        finally:
+            await asgi_app.dispose()
+    return asyncio.run(main())
+
+
+@pytest.fixture
+def seeded(make_app):
+    def make(**overrides):
+        flask_app = make_app(**overrides)
+        with flask_app.app_context():
+            seed(users=5, stores=2, employees=10)
+        return flask_app, AsyncApp(flask_app, db, routes)
+    return make
+
+
+def test_coroutine_routes_match_wsgi_responses(seeded):
+    flask_app, asgi_app = seeded()
+    client = flask_app.test_client()
+    results = run(asgi_app, *[('GET', path) for path in PATHS])
+    for path, (status, headers, body) in zip(PATHS, results):
+        expected = client.get(path)
+        assert status == expected.status_code, path
+        assert json.loads(body) == expected.get_json(), path
+        assert headers.get('etag') == expected.headers.get('ETag'), path
+
+
+def test_if_none_match_returns_304_from_coroutine_route(seeded):
+    flask_app, asgi_app = seeded()
+    etag = flask_app.test_client().get('/api/stores').headers['ETag']
+    [(status, _, body)] = run(asgi_app, ('GET', '/api/stores', [('If-None-Match', etag)]))
+    assert (status, body) == (304, b'')
+
+
+def test_other_paths_fall_back_to_the_wsgi_app(seeded):
+    _, asgi_app = seeded()
+    created, listed, missing = run(
+        asgi_app,
+        ('POST', '/api/stores', [('Content-Type', 'application/json')], b'{"name": "ASGI"}'),
+        ('GET', '/api/stores'),
+        ('GET', '/api/nowhere')
+    )
+    assert created[0] == 201
+    assert json.loads(listed[2])["count"] == 3
+    assert missing[0] == 404
+
+
+def test_coroutine_routes_go_through_flask_request_hooks(seeded):
+    _, asgi_app = seeded(INSTRUMENTATION_ENABLED=True)
+    [(status, headers, _)] = run(asgi_app, ('GET', '/api/employees'))
+    assert status == 200
+    assert '"2 queries"' in headers['server-timing']
+
+
+def test_admission_limit_applies_to_coroutine_route(seeded):
+    flask_app, asgi_app = seeded(ADMISSION_LIMITS={'employees': (0, 0)})
+    [(status, headers, body)] = run(asgi_app, ('GET', '/api/employees'))
+    expected = flask_app.test_client().get('/api/employees')
+    assert status == expected.status_code == 503
+    assert json.loads(body) == expected.get_json()
+    assert headers['retry-after'] == expected.headers['Retry-After']
@@ -0,0 +1,82 @@
+"""사용자 / 직원 입력 검증 (단건과 일괄)"""
+from app import db
+from conftest import seed
+
+
+def _user(n, **fields):
+    return {"last_name": "테스트", "email": f"bulk{n}@example.com", "password": "pw", "gender": "남성", **fields}
+
+
+def test_bulk_signup_reports_bad_types_per_row(client):
+    response = client.post('/api/users/bulk', json=[
+        _user(0),
+        _user(1, email=[]),
+        _user(2, password=None),
+        _user(3, gender={"x": 1}),
+        _user(4, contact=123),
+        _user(5, address=None)
+    ])
+    assert response.status_code == 207
+    body = response.get_json()
+    assert [row["status"] for row in body["results"]] == [201, 400, 400, 400, 400, 201]
+    assert body["results"][1]["error"] == "email 필드는 문자열이어야 합니다"
+
+
+def test_bulk_signup_size_is_capped(make_app):
+    client = make_app(BULK_SIGNUP_ROWS_PER_HASH_WORKER=2).test_client()
+    response = client.post('/api/users/bulk', json=[_user(n) for n in range(3)])
+    assert response.status_code == 400
+    assert client.post('/api/users/bulk', json=[_user(n) for n in range(2)]).status_code == 201
+
+
+def test_bulk_signup_cap_scales_with_hash_workers(make_app):
+    client = make_app(BULK_SIGNUP_ROWS_PER_HASH_WORKER=2, PASSWORD_HASH_EXECUTOR='thread',
+                      PASSWORD_HASH_WORKERS=3).test_client()
+    response = client.post('/api/users/bulk', json=[_user(n) for n in range(7)])
+    assert response.get_json() == {"error": "한 번에 최대 6명까지 가입할 수 있습니다"}
+    assert client.post('/api/users/bulk', json=[_user(n) for n in range(6)]).status_code == 201
+
+
+def test_signup_rejects_non_string_email(client):
+    response = client.post('/api/users/signup', json=_user(0, email=["a@example.com"]))
+    assert response.status_code == 400
+    assert response.get_json() == {"error": "email 필드는 문자열이어야 합니다"}
+
+
+def test_bulk_employees_reports_bad_user_id_per_row(app, client):
+    with app.app_context():
+        seed(users=3, stores=1, employees=0)
+    response = client.post('/api/employees/bulk', json={"store_id": 1, "employees": [
+        {"user_id": 1, "type": "스태프"},
+        {"user_id": [2], "type": "스태프"},
+        {"user_id": True, "type": "스태프"},
+        {"user_id": 3, "type": ["매니저"]},
+        {"user_id": 99, "type": "스태프"}
+    ]})
+    assert response.status_code == 207
+    assert [row["status"] for row in response.get_json()["results"]] == [201, 400, 400, 400, 404]
+
+
+def test_bulk_employees_rejects_bad_store_id(client):
+    response = client.post('/api/employees/bulk', json={"store_id": [1], "employees": []})
+    assert response.status_code == 400
+
+
+def test_register_employee_rejects_bad_ids(app, client):
+    with app.app_context():
+        seed(users=1, stores=1, employees=0)
+    response = client.post('/api/employees', json={"user_id": {"id": 1}, "store_id": 1, "type": "스태프"})
+    assert response.status_code == 400
+    with app.app_context():
+        assert db.session.query(db.func.count()).select_from(db.metadata.tables['employees']).scalar() == 0
+
+
+def test_single_row_paths_reject_bad_enum_values(app, client):
+    with app.app_context():
+        seed(users=1, stores=1, employees=0)
+    response = client.post('/api/users/signup', json=_user(0, gender="기타"))
+    assert (response.status_code, response.get_json()) == (400, {"error": "잘못된 성별 값입니다"})
+
+    for position in ("사장", ["스태프"]):
+        response = client.post('/api/employees', json={"user_id": 1, "store_id": 1, "type": position})
+        assert (response.status_code, response.get_json()) == (400, {"error": "잘못된 직급 값입니다"})
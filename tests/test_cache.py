@@ -0,0 +1,38 @@
+"""읽기 캐시와 조건부 GET"""
+import sqlite3
+
+from app import cache
+from app.cache import LRUCache, key_scope
+
+
+def test_key_scope_nests_and_resets():
+    cache_key = cache.full_key('users', 'page')
+    with key_scope('users3'):
+        with key_scope('replica'):
+            assert cache.full_key('users', 'page') == f"{cache_key}@users3/replica"
+        assert cache.full_key('users', 'page') == f"{cache_key}@users3"
+    assert cache.full_key('users', 'page') == cache_key
+
+
+def test_change_from_another_process_is_visible_with_the_new_etag(make_app, tmp_path):
+    client = make_app(CACHE_BACKEND='memory').test_client()
+    first = client.get('/api/stores')
+    assert first.get_json()["count"] == 0
+    assert isinstance(cache.backend, LRUCache)
+
+    # 다른 워커 프로세스의 쓰기: 이 프로세스의 캐시 세대는 그대로이고 버전 행만 바뀜
+    other = sqlite3.connect(tmp_path / 'test.db')
+    with other:
+        other.execute("INSERT INTO stores (name, is_active) VALUES ('다른 워커', 1)")
+        other.execute("UPDATE table_versions SET version = version + 1 WHERE table_name = 'stores'")
+    other.close()
+
+    second = client.get('/api/stores')
+    assert second.get_json()["count"] == 1
+    assert second.headers['ETag'] != first.headers['ETag']
+
+    hits = cache.hits
+    third = client.get('/api/stores')
+    assert third.get_json()["count"] == 1
+    assert third.headers['ETag'] == second.headers['ETag']
+    assert cache.hits == hits + 1
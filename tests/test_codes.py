@@ -0,0 +1,54 @@
+"""직원번호 발급기"""
+import pytest
+
+from app import db
+from app.codes import CODE_MIN, CODE_SPACE, allocate_codes, encode, permute
+from app.models import Employee, EmployeeCodeSequence, PositionEnum
+from conftest import seed
+
+
+def test_permute_is_a_bijection_over_the_code_space():
+    assert sorted(permute(index) for index in range(CODE_SPACE)) == list(range(CODE_SPACE))
+
+
+def test_permute_rejects_out_of_range_index():
+    with pytest.raises(ValueError):
+        permute(CODE_SPACE)
+    with pytest.raises(ValueError):
+        permute(-1)
+
+
+def test_encode_stays_in_six_digits_and_depends_on_key():
+    codes = [encode(index) for index in range(1000)]
+    assert all(CODE_MIN <= code < CODE_MIN + CODE_SPACE for code in codes)
+    assert codes != [encode(index, key=1) for index in range(1000)]
+
+
+def test_allocations_do_not_overlap(app):
+    with app.app_context():
+        first = allocate_codes(db.session, EmployeeCodeSequence.__table__, Employee.code, 100)
+        second = allocate_codes(db.session, EmployeeCodeSequence.__table__, Employee.code, 1)
+        db.session.commit()
+        assert len(set(first + second)) == 101
+        assert first == [encode(index) for index in range(100)]
+        assert db.session.get(EmployeeCodeSequence, 1).next_value == 101
+
+
+def test_allocation_skips_codes_taken_by_legacy_rows(app):
+    with app.app_context():
+        seed(users=1, stores=1, employees=0)
+        # 예전 무작위 방식으로 발급된 번호가 다음 번호와 겹치는 경우
+        db.session.add(Employee(code=encode(0), type=PositionEnum.STAFF, user_id=1, store_id=1))
+        db.session.commit()
+        table = EmployeeCodeSequence.__table__
+        db.session.execute(table.update().values(next_value=0))
+        codes = allocate_codes(db.session, table, Employee.code, 3)
+        assert codes == [encode(1), encode(2), encode(3)]
+        assert db.session.get(EmployeeCodeSequence, 1).next_value == 4
+
+
+def test_allocation_rolls_back_with_the_transaction(app):
+    with app.app_context():
+        allocate_codes(db.session, EmployeeCodeSequence.__table__, Employee.code, 5)
+        db.session.rollback()
+        assert db.session.get(EmployeeCodeSequence, 1).next_value == 0
@@ -0,0 +1,101 @@
+"""비활성화 전파 / 다시 활성화 / 오래된 비활성 행 보관"""
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import select
+
+from app import db
+from app.models import Employee, Store, User, employees_archive, stores_archive, users_archive
+from app.services import archive_inactive
+from conftest import seed
+
+
+def active_employees():
+    return db.session.scalars(select(Employee.id).where(Employee.is_active.is_(True))
+                              .order_by(Employee.id)).all()
+
+
+def employee_updates(queries):
+    return [q for q in queries if q.startswith('UPDATE employees')]
+
+
+def test_user_and_store_deactivation_cascade_in_one_update(app, client, queries):
+    with app.app_context():
+        # 사용자 4명이 가게 2곳에 모두 근무: 직원 1~4 는 가게 1, 5~8 은 가게 2
+        seed(users=4, stores=2, employees=8)
+
+    queries.clear()
+    assert client.post('/api/users/1/deactivate').get_json()["deactivated_employees"] == 2
+    assert len(employee_updates(queries)) == 1
+    with app.app_context():
+        user = db.session.get(User, 1)
+        cascaded = db.session.scalars(select(Employee).where(Employee.user_id == 1)).all()
+        assert [e.deactivated_at for e in cascaded] == [user.deactivated_at] * 2
+        assert active_employees() == [2, 3, 4, 6, 7, 8]
+
+    queries.clear()
+    assert client.post('/api/stores/2/deactivate').get_json()["deactivated_employees"] == 3
+    assert len(employee_updates(queries)) == 1
+    with app.app_context():
+        assert active_employees() == [2, 3, 4]
+
+    # 이미 비활성이면 아무것도 바꾸지 않음
+    assert client.post('/api/stores/2/deactivate').get_json()["deactivated_employees"] == 0
+
+
+def test_reactivation_restores_only_rows_from_the_same_cascade(app, client):
+    with app.app_context():
+        seed(users=4, stores=2, employees=8)
+
+    # 직원 2 는 따로 먼저 비활성화 (다른 시각)
+    assert client.post('/api/employees/2/deactivate').status_code == 200
+    with app.app_context():
+        db.session.execute(Employee.__table__.update().where(Employee.id == 2).values(
+            deactivated_at=datetime(2020, 1, 1)
+        ))
+        db.session.commit()
+    assert client.post('/api/stores/1/deactivate').get_json()["deactivated_employees"] == 3
+    assert client.post('/api/users/3/deactivate').get_json()["deactivated_employees"] == 1
+
+    # 가게 1 복구: 직원 2 (따로 비활성화) 와 직원 3 (사용자 3 이 비활성) 은 그대로
+    assert client.post('/api/stores/1/reactivate').get_json()["reactivated_employees"] == 2
+    with app.app_context():
+        assert active_employees() == [1, 4, 5, 6, 8]
+
+    # 사용자 3 복구: 가게 2 의 직원 7 만 사용자 비활성화 때 함께 빠졌음
+    assert client.post('/api/users/3/reactivate').get_json()["reactivated_employees"] == 1
+    with app.app_context():
+        assert active_employees() == [1, 4, 5, 6, 7, 8]
+        assert db.session.get(Employee, 3).is_active is False
+
+    # 직원 개별 활성화는 사용자 / 가게가 모두 활성일 때만
+    assert client.post('/api/employees/3/reactivate').status_code == 200
+    assert client.post('/api/users/4/deactivate').status_code == 200
+    assert client.post('/api/employees/4/reactivate').status_code == 400
+
+
+def test_archive_moves_old_inactive_rows_in_batches(app, client, queries):
+    with app.app_context():
+        seed(users=6, stores=2, employees=8)
+    # 사용자 1 (직원 1, 7), 사용자 2 (직원 2, 8), 직원 5 비활성화
+    for path in ('/api/users/1/deactivate', '/api/users/2/deactivate', '/api/employees/5/deactivate'):
+        assert client.post(path).status_code == 200
+
+    with app.app_context():
+        # 기준 시각보다 나중에 비활성화된 행은 옮기지 않음
+        cutoff = datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(seconds=1)
+        assert archive_inactive(cutoff - timedelta(days=1)) == {"employees": 0, "users": 0, "stores": 0}
+
+        queries.clear()
+        assert archive_inactive(cutoff, batch_size=2) == {"employees": 5, "users": 2, "stores": 0}
+        # 직원 5행은 2 / 2 / 1 로 나눠 옮김
+        assert len([q for q in queries if q.startswith('DELETE FROM employees')]) == 3
+
+        assert db.session.scalars(select(employees_archive.c.id).order_by(employees_archive.c.id)).all() \
+            == [1, 2, 5, 7, 8]
+        assert db.session.scalars(select(users_archive.c.id).order_by(users_archive.c.id)).all() == [1, 2]
+        assert db.session.scalar(select(db.func.count()).select_from(stores_archive)) == 0
+
+        # 활성 행은 그대로
+        assert db.session.scalars(select(Employee.id).order_by(Employee.id)).all() == [3, 4, 6]
+        assert db.session.scalars(select(User.id).order_by(User.id)).all() == [3, 4, 5, 6]
+        assert db.session.query(Store).count() == 2
@@ -0,0 +1,102 @@
+"""직원 등록 중복 처리와 Idempotency-Key 재시도"""
+from datetime import datetime, timezone
+import hashlib
+
+from sqlalchemy import insert
+
+from app import db, services
+from app.models import Employee, IdempotencyKey
+from app.services import DUPLICATE_EMPLOYEE
+from conftest import seed
+
+STAFF = {"user_id": 1, "store_id": 1, "type": "스태프"}
+
+
+def test_duplicate_registration_is_rejected(app, client):
+    with app.app_context():
+        seed(users=2, stores=1, employees=1)
+    response = client.post('/api/employees', json=STAFF)
+    assert response.status_code == 400
+    assert response.get_json() == {"error": DUPLICATE_EMPLOYEE, "employee_id": 1}
+
+
+def test_inactive_employee_points_to_reactivate(app, client):
+    with app.app_context():
+        seed(users=2, stores=1, employees=1)
+    assert client.post('/api/employees/1/deactivate').status_code == 200
+
+    body = client.post('/api/employees', json=STAFF).get_json()
+    assert body["employee_id"] == 1
+    assert body["reactivate"] == "POST /api/employees/1/reactivate"
+
+    rows = client.post('/api/employees/bulk', json={"store_id": 1, "employees": [
+        {"user_id": 1, "type": "스태프"}, {"user_id": 2, "type": "스태프"}, {"user_id": 2, "type": "매니저"}
+    ]}).get_json()["results"]
+    assert rows[0]["reactivate"] == "POST /api/employees/1/reactivate"
+    assert [row["status"] for row in rows] == [400, 201, 400]
+    assert rows[2]["error"] == DUPLICATE_EMPLOYEE
+
+
+def test_concurrent_duplicate_maps_to_duplicate_error(app, client, monkeypatch):
+    with app.app_context():
+        seed(users=2, stores=1, employees=1)
+    # 확인 조회는 통과했지만 그 사이 다른 요청이 같은 (사용자, 가게) 를 커밋한 경우
+    check = services._existing_employee_error
+    calls = []
+
+    def first_check_misses(user_id, store_id):
+        calls.append(user_id)
+        return None if len(calls) == 1 else check(user_id, store_id)
+
+    monkeypatch.setattr(services, '_existing_employee_error', first_check_misses)
+    response = client.post('/api/employees', json=STAFF)
+    assert response.status_code == 400
+    assert response.get_json() == {"error": DUPLICATE_EMPLOYEE, "employee_id": 1}
+
+
+def test_other_integrity_errors_are_not_reported_as_duplicates(app, client, monkeypatch):
+    with app.app_context():
+        seed(users=2, stores=1, employees=1)
+        taken = db.session.get(Employee, 1).code
+    # 직원번호 UNIQUE 위반 (예전 방식으로 발급된 번호와 충돌)
+    monkeypatch.setattr(services, 'next_employee_codes', lambda count=1: [taken])
+    response = client.post('/api/employees', json={**STAFF, "user_id": 2})
+    assert response.status_code == 500
+    assert response.get_json()["error"].startswith("직원 등록 실패")
+
+
+def test_idempotent_replay_returns_the_first_response(client):
+    headers = {'Idempotency-Key': 'store-1'}
+    first = client.post('/api/stores', json={"name": "가게"}, headers=headers)
+    replay = client.post('/api/stores', json={"name": "가게"}, headers=headers)
+    assert first.status_code == replay.status_code == 201
+    assert replay.get_json() == first.get_json()
+    assert replay.headers['Idempotent-Replayed'] == 'true'
+    assert client.get('/api/stores').get_json()["count"] == 1
+
+    conflict = client.post('/api/stores', json={"name": "다른 가게"}, headers=headers)
+    assert conflict.status_code == 422
+
+
+def test_in_flight_key_returns_409(app, client):
+    body = '{"name": "가게"}'.encode()
+    with app.app_context():
+        db.session.execute(insert(IdempotencyKey).values(
+            key='busy', path='/api/stores', fingerprint=hashlib.sha256(b'POST' + body).hexdigest(),
+            created_at=datetime.now(timezone.utc).replace(tzinfo=None)
+        ))
+        db.session.commit()
+    response = client.post('/api/stores', data=body, content_type='application/json',
+                           headers={'Idempotency-Key': 'busy'})
+    assert response.status_code == 409
+    assert response.headers['Retry-After'] == '1'
+
+
+def test_server_error_is_not_stored(app, client, monkeypatch):
+    monkeypatch.setattr('app.routes.create_store', lambda data: ({"error": "실패"}, 500))
+    headers = {'Idempotency-Key': 'retry-me'}
+    assert client.post('/api/stores', json={"name": "가게"}, headers=headers).status_code == 500
+    with app.app_context():
+        assert db.session.query(IdempotencyKey).count() == 0
+    monkeypatch.undo()
+    assert client.post('/api/stores', json={"name": "가게"}, headers=headers).status_code == 201
@@ -0,0 +1,24 @@
+"""비밀번호 해시 실행기"""
+import pytest
+from werkzeug.security import check_password_hash
+
+from app import hashing
+
+
+@pytest.fixture
+def restore_executor():
+    yield
+    hashing.configure('inline')
+
+
+def test_process_pool_does_not_fork(restore_executor):
+    hashing.configure('process', 1)
+    hashed = hashing.hash_passwords(['first', 'second'])
+    assert check_password_hash(hashed[0], 'first') and check_password_hash(hashed[1], 'second')
+    assert hashing._executor._mp_context.get_start_method() in hashing.START_METHODS
+    assert hashing.hash_stats()["workers"] == 1
+
+
+def test_unknown_executor_is_rejected():
+    with pytest.raises(ValueError):
+        hashing.configure('greenlet')
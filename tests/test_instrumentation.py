@@ -0,0 +1,27 @@
+"""요청 계측과 /metrics"""
+from collections import Counter
+
+
+def metric_types(text):
+    """{지표: 종류} (# TYPE 줄이 두 번 나오면 실패)"""
+    declared = [line.split()[2:] for line in text.splitlines() if line.startswith('# TYPE ')]
+    assert [name for name, count in Counter(name for name, _ in declared).items() if count > 1] == []
+    return dict(declared)
+
+
+def test_metrics_declare_counters_and_gauges_once(make_app):
+    client = make_app(INSTRUMENTATION_ENABLED=True).test_client()
+    assert client.get('/api/users').status_code == 200
+
+    text = client.get('/metrics').get_data(as_text=True)
+    types = metric_types(text)
+    assert types['http_request_duration_seconds'] == 'histogram'
+    assert types['password_hash_queue_depth'] == 'gauge'
+    for name in ('cache_hits_total', 'idempotent_replays_total', 'jobs_completed_total',
+                 'replica_reads_total', 'rate_limited_requests_total', 'shed_requests_total'):
+        assert types[name] == 'counter'
+    assert all(name.endswith('_total') for name, kind in types.items() if kind == 'counter')
+
+    # 라벨만 다른 표본은 한 지표 아래에 (값은 테스트 사이에 누적)
+    samples = [line.split(' ')[0] for line in text.splitlines() if line.startswith('replica_reads_total')]
+    assert samples == ['replica_reads_total{target="replica"}', 'replica_reads_total{target="primary"}']
@@ -0,0 +1,203 @@
+"""작업 큐 (jobs 테이블) 와 웹훅 후속 작업"""
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+import time
+
+import pytest
+
+from app import db, jobs
+from app.models import Job
+from conftest import seed
+
+runs = Counter()
+lock = threading.Lock()
+
+
+@jobs.task('test_echo')
+def echo(value):
+    with lock:
+        runs[value] += 1
+    return {"value": value}
+
+
+@jobs.task('test_fail')
+def fail():
+    raise RuntimeError("항상 실패")
+
+
+def test_rolled_back_write_leaves_no_job(app):
+    with app.app_context():
+        jobs.enqueue('test_echo', value='rollback')
+        db.session.rollback()
+        assert db.session.query(Job).count() == 0
+
+
+def test_unknown_task_is_rejected(app):
+    with app.app_context(), pytest.raises(ValueError):
+        jobs.enqueue('no_such_task')
+
+
+def test_committed_job_runs_and_stores_result(app):
+    with app.app_context():
+        job = jobs.enqueue('test_echo', value='once')
+        assert jobs.enqueue('test_echo', dedupe=True, value='once') is job
+        db.session.commit()
+        assert jobs.run_pending() == 1
+        status = jobs.get(job.id)
+        assert (status["status"], status["attempts"], status["result"]) == ('done', 1, {"value": "once"})
+
+
+def test_failed_job_is_retried_then_marked_failed(make_app):
+    app = make_app(JOBS_RETRY_BACKOFF=0, JOBS_MAX_ATTEMPTS=3)
+    with app.app_context():
+        job = jobs.enqueue('test_fail')
+        db.session.commit()
+        assert jobs.run_pending() == 3
+        status = jobs.get(job.id)
+        assert (status["status"], status["attempts"]) == ('failed', 3)
+        assert status["last_error"] == "RuntimeError: 항상 실패"
+
+
+def test_retry_waits_for_backoff(make_app):
+    app = make_app(JOBS_RETRY_BACKOFF=60)
+    with app.app_context():
+        job = jobs.enqueue('test_fail')
+        db.session.commit()
+        assert jobs.run_pending() == 1
+        assert jobs.get(job.id)["status"] == 'queued'
+        assert 59 <= jobs._idle_wait(3600) <= 60
+
+
+def test_each_job_is_claimed_once_across_workers(app):
+    with app.app_context():
+        for i in range(30):
+            jobs.enqueue('test_echo', value=f"parallel-{i}")
+        db.session.commit()
+
+    def work():
+        with app.app_context():
+            jobs.run_pending()
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert [runs[f"parallel-{i}"] for i in range(30)] == [1] * 30
+
+
+def test_idle_wait_stops_at_next_delayed_job(app):
+    with app.app_context():
+        assert jobs._idle_wait(30) == 30
+        jobs.enqueue('test_echo', delay=5, value='later')
+        db.session.commit()
+        assert 4 <= jobs._idle_wait(30) <= 5
+        assert jobs._idle_wait(1) == 1
+
+
+def test_worker_thread_wakes_on_commit(make_app):
+    app = make_app(JOBS_EXECUTOR='thread', JOBS_POLL_INTERVAL=60)
+    try:
+        with app.app_context():
+            job = jobs.enqueue('test_echo', value='woken')
+            db.session.commit()
+            deadline = time.monotonic() + 5
+            while jobs.get(job.id)["status"] != 'done' and time.monotonic() < deadline:
+                db.session.commit()
+                time.sleep(0.01)
+            assert jobs.get(job.id)["status"] == 'done'
+
+            # 작업자는 빈 큐를 60 초 간격으로 보지만 새 커밋에는 바로 깨어남
+            second = jobs.enqueue('test_echo', value='woken-again')
+            db.session.commit()
+            deadline = time.monotonic() + 5
+            while jobs.get(second.id)["status"] != 'done' and time.monotonic() < deadline:
+                db.session.commit()
+                time.sleep(0.01)
+            assert jobs.get(second.id)["status"] == 'done'
+    finally:
+        jobs.shutdown()
+
+
+@pytest.fixture
+def webhook():
+    """받은 (X-Event-Id, JSON 본문) 을 모으는 로컬 HTTP 서버 (status 로 응답 코드 지정)"""
+    received = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers['Content-Length']))
+            received.append((self.headers['X-Event-Id'], json.loads(body)))
+            self.send_response(server.status)
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.status = 204
+    server.url = f"http://127.0.0.1:{server.server_port}/hook"
+    server.received = received
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+SIGNUP = {"last_name": "김", "email": "kim@example.com", "password": "pw", "gender": "남성"}
+
+
+def test_writes_without_webhook_enqueue_nothing(app, client):
+    body = client.post('/api/users/signup', json=SIGNUP).get_json()
+    assert body["job_id"] is None
+    with app.app_context():
+        assert db.session.query(Job).count() == 0
+
+
+def test_signup_and_registration_are_delivered_by_worker(make_app, webhook):
+    app = make_app(WEBHOOK_URL=webhook.url)
+    client = app.test_client()
+    with app.app_context():
+        seed(users=0, stores=1, employees=0)
+
+    signup = client.post('/api/users/signup', json=SIGNUP).get_json()
+    employee = client.post('/api/employees', json={"user_id": signup["user_id"], "store_id": 1,
+                                                   "type": "스태프"}).get_json()
+    bulk = client.post('/api/users/bulk', json=[
+        {**SIGNUP, "email": "lee@example.com"}, {**SIGNUP, "email": "park@example.com"}
+    ]).get_json()
+    # 응답 전에는 아무것도 보내지 않음
+    assert webhook.received == []
+
+    with app.app_context():
+        assert jobs.run_pending() == 3
+        assert [jobs.get(body["job_id"])["status"] for body in (signup, employee, bulk)] == ['done'] * 3
+        assert jobs.get(signup["job_id"])["result"] == {"status": 204}
+
+    assert [payload for _, payload in webhook.received] == [
+        {"event": "user.created", "data": {"user_id": signup["user_id"], "email": "kim@example.com"}},
+        {"event": "employee.registered", "data": {
+            "employee_id": employee["employee_id"], "employee_code": employee["employee_code"],
+            "user_id": signup["user_id"], "store_id": 1, "position": "스태프"
+        }},
+        {"event": "users.created", "data": {"user_ids": [row["user_id"] for row in bulk["results"]]}}
+    ]
+    assert len({event_id for event_id, _ in webhook.received}) == 3
+
+
+def test_failed_delivery_is_retried_with_same_event_id(make_app, webhook):
+    app = make_app(WEBHOOK_URL=webhook.url, JOBS_RETRY_BACKOFF=0, JOBS_MAX_ATTEMPTS=2)
+    webhook.status = 500
+    job_id = app.test_client().post('/api/users/signup', json=SIGNUP).get_json()["job_id"]
+
+    with app.app_context():
+        assert jobs.run_pending() == 2
+        status = jobs.get(job_id)
+        assert (status["status"], status["attempts"]) == ('failed', 2)
+        assert status["last_error"].startswith("HTTPError")
+
+    first, second = webhook.received
+    assert first == second
@@ -0,0 +1,133 @@
+"""요청 한도 (토큰 버킷) 와 동시 실행 한도"""
+import sys
+import threading
+import time
+
+import pytest
+
+from app.limits import Gate, MemoryBuckets, RedisBuckets
+
+SIGNUP = {"last_name": "한도", "email": "limit@example.com", "password": "pw", "gender": "남성"}
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeRedis:
+    """incr / expire 만 흉내 내는 Redis 호환 클라이언트"""
+
+    def __init__(self):
+        self.values = {}
+        self.expires = {}
+
+    def incr(self, name, amount=1):
+        self.values[name] = self.values.get(name, 0) + amount
+        return self.values[name]
+
+    def expire(self, name, seconds):
+        self.expires[name] = seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    module = sys.modules['app.limits']       # app.limits 속성은 Limits 인스턴스
+    monkeypatch.setattr(module, 'time', type('FakeTime', (), {'monotonic': clock, 'time': clock}))
+    return clock
+
+
+def test_memory_bucket_refills_over_time(clock):
+    buckets = MemoryBuckets(capacity=2, rate=1.0)
+    assert buckets.take('a', 1) == 0
+    assert buckets.take('a', 1) == 0
+    assert buckets.take('a', 1) == pytest.approx(1.0)
+    assert buckets.take('b', 1) == 0
+    clock.now += 1
+    assert buckets.take('a', 1) == 0
+
+
+def test_memory_bucket_forgets_least_recent_clients(clock):
+    buckets = MemoryBuckets(capacity=1, rate=0.001, maxsize=2)
+    for key in ('a', 'b', 'c'):
+        assert buckets.take(key, 1) == 0
+    assert list(buckets._buckets) == ['b', 'c']
+    assert buckets.take('a', 1) == 0
+
+
+def test_redis_bucket_counts_per_fixed_window(clock):
+    client = FakeRedis()
+    buckets = RedisBuckets(client, capacity=2, rate=1.0)     # 2 초 창
+    assert buckets.take('a', 1) == 0
+    assert buckets.take('a', 1) == 0
+    assert buckets.take('a', 1) == pytest.approx(2.0)
+    assert list(client.expires.values()) == [3]
+    clock.now += 2
+    assert buckets.take('a', 1) == 0
+
+
+def test_gate_rejects_when_queue_is_full():
+    gate = Gate(limit=1, queue=0)
+    assert gate.enter()
+    assert not gate.enter()
+    gate.leave()
+    assert gate.enter(wait=False)
+
+
+def test_gate_admits_waiter_when_a_slot_frees_up():
+    gate = Gate(limit=1, queue=1, timeout=5)
+    assert gate.enter()
+    admitted = []
+    waiter = threading.Thread(target=lambda: admitted.append(gate.enter()))
+    waiter.start()
+    while gate.stats()["waiting"] == 0:
+        time.sleep(0.001)
+    assert not gate.enter()         # 대기열이 참
+    gate.leave()
+    waiter.join()
+    assert admitted == [True]
+    assert gate.stats() == {"limit": 1, "running": 1, "queue": 1, "waiting": 0}
+
+
+def test_gate_gives_up_after_timeout():
+    gate = Gate(limit=1, queue=1, timeout=0.01)
+    assert gate.enter()
+    assert not gate.enter()
+    assert gate.stats()["waiting"] == 0
+
+
+def test_limits_counts_rejections(make_app):
+    app = make_app(RATELIMIT_BACKEND='memory', RATELIMIT_CAPACITY=1, RATELIMIT_REFILL_RATE=0.001,
+                   ADMISSION_LIMITS={'export': (0, 0)})
+    limits = app.extensions['limits']
+    before = limits.stats()
+    assert limits.acquire('signup', '10.0.0.1') is None
+    assert limits.acquire('signup', '10.0.0.1')[1] == 429
+    assert limits.acquire('signup', '10.0.0.2') is None
+    assert limits.acquire('export', '10.0.0.3')[1] == 503
+    stats = limits.stats()
+    assert stats["rate_limited"] - before["rate_limited"] == 1
+    assert stats["shed"] - before["shed"] == 1
+    assert stats["routes"]["export"] == {"limit": 0, "running": 0, "queue": 0, "waiting": 0}
+
+
+def test_idempotent_replay_does_not_use_tokens(make_app):
+    client = make_app(RATELIMIT_BACKEND='memory', RATELIMIT_CAPACITY=1,
+                      RATELIMIT_REFILL_RATE=0.001).test_client()
+    first = client.post('/api/users/signup', json=SIGNUP, headers={'Idempotency-Key': 'k1'})
+    assert first.status_code == 201
+
+    replay = client.post('/api/users/signup', json=SIGNUP, headers={'Idempotency-Key': 'k1'})
+    assert replay.status_code == 201
+    assert replay.headers['Idempotent-Replayed'] == 'true'
+
+    # 한도에 걸린 응답은 저장하지 않으므로 같은 키의 재시도도 다시 한도 검사를 받음
+    other = {**SIGNUP, "email": "other@example.com"}
+    for _ in range(2):
+        limited = client.post('/api/users/signup', json=other, headers={'Idempotency-Key': 'k2'})
+        assert limited.status_code == 429
+        assert 'Idempotent-Replayed' not in limited.headers
@@ -0,0 +1,44 @@
+"""마이그레이션 (flask db upgrade / check)"""
+from flask_migrate import check, downgrade, upgrade
+from sqlalchemy import inspect, text
+
+from app import db, init_migrations
+
+
+def test_clean_upgrade_matches_models(make_app):
+    app = make_app(create_all=False)
+    with app.app_context():
+        init_migrations(app)
+        upgrade()
+        assert {'users_fts', 'employees_fts'} <= set(inspect(db.engine).get_table_names())
+        # 모델과 다르면 (검색 색인을 지우는 revision 포함) SystemExit
+        check()
+
+
+def test_unique_employee_migration_keeps_active_latest_row(make_app):
+    app = make_app(create_all=False)
+    with app.app_context():
+        init_migrations(app)
+        upgrade(revision='5c1e7a9d2f40')
+        db.session.execute(text(
+            "INSERT INTO users (id, last_name, email, password, gender, is_active, is_staff) "
+            "VALUES (1, '김', 'kim@example.com', 'x', 'MALE', 1, 0)"
+        ))
+        db.session.execute(text("INSERT INTO stores (id, name, is_active) VALUES (1, '매장', 1), (2, '매장2', 1)"))
+        # 가게 1: 비활성 (id 1) 뒤에 활성 (id 2) 재등록, 가게 2: 활성 두 번 (id 3, 4)
+        db.session.execute(text(
+            "INSERT INTO employees (id, code, type, is_active, user_id, store_id) VALUES "
+            "(1, 100001, 'STAFF', 0, 1, 1), (2, 100002, 'MANAGER', 1, 1, 1), "
+            "(3, 100003, 'STAFF', 1, 1, 2), (4, 100004, 'STAFF', 1, 1, 2)"
+        ))
+        db.session.commit()
+
+        upgrade(revision='a3f08d6b71c2')
+        assert db.session.execute(text("SELECT id FROM employees ORDER BY id")).scalars().all() == [2, 4]
+        moved = db.session.execute(text("SELECT id, code, is_active FROM employees_duplicates ORDER BY id")).all()
+        assert moved == [(1, 100001, 0), (3, 100003, 1)]
+        db.session.commit()
+
+        downgrade(revision='5c1e7a9d2f40')
+        assert db.session.execute(text("SELECT id FROM employees ORDER BY id")).scalars().all() == [1, 2, 3, 4]
+        assert 'employees_duplicates' not in inspect(db.engine).get_table_names()
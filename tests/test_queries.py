@@ -0,0 +1,58 @@
+"""목록 / 조회 API 의 SQL 실행 횟수 회귀 테스트
+
+행이 늘어나도 요청당 SQL 수는 그대로여야 한다 (N+1 조회 방지). 목록 SQL 수에는
+ETag 용 table_versions 조회 1회가 들어 있다.
+"""
+import pytest
+
+from app import db
+from conftest import seed
+
+# (경로, 요청당 SQL 수)
+ENDPOINTS = [
+    ('/api/', 0),
+    ('/api', 0),
+    ('/api/users', 2),
+    ('/api/stores', 2),
+    ('/api/employees', 2),
+    ('/api/stores/stats', 3),
+    ('/api/stores/1/employees', 3),
+    ('/api/users/1/stores', 3),
+    ('/api/users/search?q=user', 2),
+    ('/api/employees/search?q=user', 2),
+    ('/api/export/employees', 1),
+]
+
+
+def _count(client, queries, path):
+    queries.clear()
+    response = client.get(path)
+    response.get_data()
+    assert response.status_code == 200, response.get_data(as_text=True)
+    return len(queries)
+
+
+@pytest.mark.parametrize('path, expected', ENDPOINTS)
+def test_query_count_does_not_grow_with_rows(app, client, queries, path, expected):
+    with app.app_context():
+        seed(users=3, stores=2, employees=4)
+    # 첫 요청의 일회성 조회 (검색 색인 확인 등) 는 빼고 센다
+    _count(client, queries, path)
+    small = _count(client, queries, path)
+
+    with app.app_context():
+        seed(users=30, stores=5, employees=60)
+    large = _count(client, queries, path)
+
+    assert (small, large) == (expected, expected), queries
+
+
+def test_job_status_query_count(app, client, queries):
+    from app.models import Job
+    with app.app_context():
+        job = Job(name='example', payload='{}', status='queued', attempts=0, max_attempts=1,
+                  run_at=db.func.current_timestamp(), created_at=db.func.current_timestamp())
+        db.session.add(job)
+        db.session.commit()
+        job_id = job.id
+    assert _count(client, queries, f'/api/jobs/{job_id}') == 1
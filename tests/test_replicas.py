@@ -0,0 +1,87 @@
+"""읽기 복제본 라우팅과 read-your-writes"""
+import shutil
+import sqlite3
+import time
+
+import pytest
+from sqlalchemy import text
+
+from app import db, replicas
+from app.replicas import READ_PRIMARY_COOKIE
+from conftest import seed
+
+
+@pytest.fixture
+def replicated(make_app, tmp_path):
+    """가게 1곳이 있는 주 DB 와 그 복사본(복제 지연이 멈춘 복제본) 을 쓰는 앱"""
+    app = make_app()
+    with app.app_context():
+        seed(users=1, stores=1, employees=0)
+        db.session.execute(text("PRAGMA wal_checkpoint(TRUNCATE)"))
+    replica = tmp_path / 'replica.db'
+    shutil.copy(tmp_path / 'test.db', replica)
+
+    def make(**overrides):
+        return make_app(create_all=False, SQLALCHEMY_REPLICA_URIS=[f"sqlite:///{replica}"], **overrides)
+    return make
+
+
+def _insert_store_on_primary(path):
+    """다른 프로세스가 주 DB 에만 쓴 가게 (버전 행은 그대로)"""
+    connection = sqlite3.connect(path)
+    with connection:
+        connection.execute("INSERT INTO stores (name, is_active) VALUES ('주 DB 에만', 1)")
+    connection.close()
+
+
+def test_list_reads_go_to_the_replica(replicated, tmp_path):
+    client = replicated().test_client()
+    _insert_store_on_primary(tmp_path / 'test.db')
+    before = replicas.stats()["replica_reads"]
+    assert client.get('/api/stores').get_json()["count"] == 1
+    assert replicas.stats()["replica_reads"] == before + 1
+
+
+def test_writer_reads_its_own_write_from_the_primary(replicated):
+    writer, other = replicated().test_client(), replicated().test_client()
+    response = writer.post('/api/stores', json={"name": "새 가게"})
+    assert response.status_code == 201
+    assert READ_PRIMARY_COOKIE in response.headers['Set-Cookie']
+
+    assert writer.get('/api/stores').get_json()["count"] == 2
+    assert other.get('/api/stores').get_json()["count"] == 1
+
+
+def test_cached_replica_response_is_not_served_to_primary_readers(replicated, tmp_path):
+    app = replicated(CACHE_BACKEND='memory')
+    _insert_store_on_primary(tmp_path / 'test.db')
+
+    reader = app.test_client()
+    assert reader.get('/api/stores').get_json()["count"] == 1
+
+    writer = app.test_client()
+    writer.set_cookie(READ_PRIMARY_COOKIE, str(int(time.time() + 60)))
+    assert writer.get('/api/stores').get_json()["count"] == 2
+    assert reader.get('/api/stores').get_json()["count"] == 1
+
+
+def test_replica_connections_are_read_only(replicated):
+    app = replicated()
+    with app.app_context():
+        with db.engines['replica_0'].connect() as connection:
+            with pytest.raises(Exception, match='readonly'):
+                connection.execute(text("INSERT INTO stores (name, is_active) VALUES ('x', 1)"))
+
+
+def test_search_checks_fts_on_the_replica_it_queries(replicated, tmp_path):
+    # FTS 색인이 없는 복제본 (예: 색인 없이 만든 PostgreSQL/SQLite 복제본)
+    connection = sqlite3.connect(tmp_path / 'replica.db')
+    with connection:
+        connection.execute("DROP TABLE users_fts")
+        connection.execute("DROP TABLE employees_fts")
+    connection.close()
+
+    client = replicated().test_client()
+    response = client.get('/api/users/search?q=user0')
+    assert response.status_code == 200
+    assert response.get_json()["count"] == 1
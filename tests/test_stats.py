@@ -0,0 +1,95 @@
+"""가게별 직급 인원 집계 (store_stats 트리거와 재계산)"""
+from sqlalchemy import func, update
+
+from app import db
+from app.models import Employee, PositionEnum, Store, StoreStat
+from conftest import seed
+
+
+def headcounts():
+    """store_stats 의 {(가게 id, 직급): 인원} (0 인 행 제외)"""
+    return {(store_id, position.value): headcount for store_id, position, headcount in
+            db.session.query(StoreStat.store_id, StoreStat.position, StoreStat.headcount)
+            if headcount}
+
+
+def recount():
+    """활성 직원을 GROUP BY 로 센 {(가게 id, 직급): 인원}"""
+    return {(store_id, position.value): count for store_id, position, count in
+            db.session.query(Employee.store_id, Employee.type, func.count())
+            .filter(Employee.is_active.is_(True)).group_by(Employee.store_id, Employee.type)}
+
+
+def test_registration_increments_stats(app, client):
+    with app.app_context():
+        # 사용자 4명이 가게 2곳에 모두 근무 (0번 직원만 매니저)
+        seed(users=4, stores=2, employees=8)
+        assert headcounts() == recount() == {(1, "매니저"): 1, (1, "스태프"): 3, (2, "스태프"): 4}
+
+        seed(users=2, stores=0, employees=0)
+    assert client.post('/api/employees', json={"user_id": 5, "store_id": 1, "type": "매니저"}).status_code == 201
+    assert client.post('/api/employees/bulk', json={"store_id": 2, "employees": [
+        {"user_id": 5, "type": "스태프"}, {"user_id": 6, "type": "매니저"}
+    ]}).status_code == 201
+
+    with app.app_context():
+        assert headcounts() == recount() == {
+            (1, "매니저"): 2, (1, "스태프"): 3, (2, "매니저"): 1, (2, "스태프"): 5
+        }
+
+
+def test_type_change_moves_headcount(app):
+    with app.app_context():
+        seed(users=4, stores=1, employees=4)
+        db.session.execute(update(Employee).where(Employee.id == 2).values(type=PositionEnum.MANAGER))
+        db.session.commit()
+        assert headcounts() == recount() == {(1, "매니저"): 2, (1, "스태프"): 2}
+
+
+def test_deactivation_cascade_and_reactivation(app, client):
+    with app.app_context():
+        seed(users=4, stores=2, employees=8)
+
+    # 사용자 비활성화는 두 가게의 직원 행을 함께 뺀다
+    assert client.post('/api/users/2/deactivate').get_json()["deactivated_employees"] == 2
+    with app.app_context():
+        assert headcounts() == recount() == {(1, "매니저"): 1, (1, "스태프"): 2, (2, "스태프"): 3}
+
+    assert client.post('/api/stores/2/deactivate').get_json()["deactivated_employees"] == 3
+    with app.app_context():
+        assert headcounts() == recount() == {(1, "매니저"): 1, (1, "스태프"): 2}
+
+    # 가게를 다시 열면 가게와 함께 빠진 직원만 돌아옴 (사용자 2 는 아직 비활성)
+    assert client.post('/api/stores/2/reactivate').get_json()["reactivated_employees"] == 3
+    assert client.post('/api/users/2/reactivate').get_json()["reactivated_employees"] == 2
+    with app.app_context():
+        assert headcounts() == recount() == {(1, "매니저"): 1, (1, "스태프"): 3, (2, "스태프"): 4}
+
+
+def test_delete_decrements_and_store_delete_drops_rows(app):
+    with app.app_context():
+        seed(users=4, stores=2, employees=8)
+        db.session.delete(db.session.get(Employee, 1))
+        db.session.commit()
+        assert headcounts() == recount() == {(1, "스태프"): 3, (2, "스태프"): 4}
+
+        db.session.execute(Employee.__table__.delete().where(Employee.store_id == 2))
+        db.session.delete(db.session.get(Store, 2))
+        db.session.commit()
+        assert db.session.query(StoreStat).filter_by(store_id=2).count() == 0
+        assert headcounts() == recount()
+
+
+def test_rebuild_matches_group_by(app):
+    with app.app_context():
+        seed(users=4, stores=2, employees=8)
+        db.session.execute(update(Employee).where(Employee.id.in_((3, 6))).values(is_active=False))
+        # 트리거를 거치지 않은 변경으로 집계가 어긋난 상태
+        db.session.execute(update(StoreStat).values(headcount=99))
+        db.session.commit()
+
+    result = app.test_cli_runner().invoke(args=['rebuild-store-stats'])
+    assert result.exit_code == 0
+    assert "3개의 집계 행" in result.output
+    with app.app_context():
+        assert headcounts() == recount() == {(1, "매니저"): 1, (1, "스태프"): 2, (2, "스태프"): 3}
@@ -0,0 +1,10 @@
+"""운영 서버(WSGI) 진입점
+
+    gunicorn -c gunicorn.conf.py wsgi:app
+
+개발 서버(python run.py) 와 달리 디버거/리로더를 쓰지 않고, 스키마 생성도
+하지 않는다. 스키마는 마이그레이션(flask --app wsgi db upgrade) 으로 관리한다.
+"""
+from app import create_app, db  # noqa: F401
+
+app = create_app()